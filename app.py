@@ -1,12 +1,10 @@
 import os
 import json
-import requests
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context
 from dotenv import load_dotenv
+from werkzeug.exceptions import RequestEntityTooLarge
 import google.generativeai as genai
 # from serpapi import GoogleSearch  # Removed - using alternatives
-import PyPDF2
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import math
@@ -14,12 +12,31 @@ from collections import Counter
 from flask_cors import CORS
 from datetime import datetime, timedelta
 import re
-from bs4 import BeautifulSoup
-import time
 import concurrent.futures
-from urllib.parse import urljoin, urlparse
 import logging
-from job_scraper_alternatives import JobScraperAlternatives, get_jobs_without_serpapi
+from job_scraper_alternatives import JobScraperAlternatives
+from scrape_scheduler import ScrapeScheduler
+from enrichment import ApplyLinkEnrichmentStage, apply_enrichment
+from career_cache import CareerPageCache, LookupUnavailable
+from resume_cache import ResumeAnalysisCache, resume_digest
+from title_cache import JobTitleCache
+from scrape_cache import ScrapeResultCache
+from job_index import JobIndex
+from tfidf_model import TfidfModelStore, build_vectorizer
+from job_vector_cache import JobVectorCache
+from job_retrieval import JobPoolRetriever, BM25Index
+from semantic_index import SemanticModelStore, SemanticJobIndex
+from keyword_matcher import get_matcher
+from resume_keywords import guess_job_titles
+from local_analyzer import analyze_resume_locally, experience_level_for_years, level_title_variants, years_of_experience
+from gemini_limiter import GeminiLimiter, GeminiUnavailable
+from job_dedupe import JobDeduplicator
+from search_jobs import SearchStore, SearchJobManager, SearchQueueFull
+from result_sessions import ResultSessionStore
+from job_payload import compact_job, dumps as dump_json
+from job_record import Job
+from response_compression import compress_response
+from resume_pdf import PdfTextExtractor, PdfExtractionError
 
 # Load environment variables from .env file
 load_dotenv()
@@ -29,11 +46,161 @@ genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")  # Keep as backup
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
 
-# Initialize the alternative scraper
-alternative_scraper = JobScraperAlternatives()
+# Gemini resume extraction: "chained" (three dependent prompts) or "single" (one structured prompt)
+GEMINI_EXTRACTION_MODE = os.getenv("GEMINI_EXTRACTION_MODE", "chained").lower()
+EXPERIENCE_LEVELS = ("entry", "junior", "mid", "senior", "lead")
+FALLBACK_JOB_TITLES = ["Software Engineer", "Developer"]
+
+# Resume analyzer: "llm" (Gemini, local analyzer as fallback), "local" (no LLM calls) or
+# "local_first" (answer with the local profile, refine with Gemini in the background for the next upload)
+RESUME_ANALYZER_MODE = os.getenv("RESUME_ANALYZER_MODE", "llm").lower()
+resume_refine_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("RESUME_REFINE_WORKERS", "2")),
+    thread_name_prefix="resume-refine"
+)
+
+# Gemini requests are paced across all worker processes through a shared SQLite limiter
+gemini_limiter = GeminiLimiter(
+    os.getenv("GEMINI_LIMITER_PATH", os.path.join("cache", "gemini_limiter.db")),
+    rate_per_minute=float(os.getenv("GEMINI_RATE_PER_MINUTE", "15")),
+    burst=int(os.getenv("GEMINI_BURST", "3")),
+    max_in_flight=int(os.getenv("GEMINI_MAX_IN_FLIGHT", "4")),
+    max_wait_seconds=float(os.getenv("GEMINI_MAX_WAIT_SECONDS", "20")),
+    failure_threshold=int(os.getenv("GEMINI_BREAKER_FAILURES", "5")),
+    open_seconds=float(os.getenv("GEMINI_BREAKER_OPEN_SECONDS", "60"))
+)
+
+# Initialize the alternative scraper ("async" drives all fetches from one pooled event loop)
+SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "sync").lower()
+if SCRAPER_BACKEND == "async":
+    from async_job_scraper import AsyncJobScraperAlternatives, SyncJobScraperWrapper
+    alternative_scraper = SyncJobScraperWrapper(AsyncJobScraperAlternatives(
+        max_connections=int(os.getenv("ASYNC_MAX_CONNECTIONS", "100")),
+        max_per_host=int(os.getenv("ASYNC_MAX_CONNECTIONS_PER_HOST", "8"))
+    ))
+else:
+    alternative_scraper = JobScraperAlternatives()
+
+# Concurrent scrape scheduler (per-host rate limits instead of a global sleep)
+SCRAPE_DEADLINE_SECONDS = float(os.getenv("SCRAPE_DEADLINE_SECONDS", "25"))
+scrape_scheduler = ScrapeScheduler(max_workers=int(os.getenv("SCRAPE_MAX_WORKERS", "16")))
+
+# Shared scrape result cache keyed by (source, job_title, location), with stale-while-revalidate
+scrape_result_cache = ScrapeResultCache(
+    ttl_seconds=float(os.getenv("SCRAPE_CACHE_TTL_MINUTES", "30")) * 60,
+    stale_seconds=float(os.getenv("SCRAPE_CACHE_STALE_MINUTES", "120")) * 60,
+    empty_ttl_seconds=float(os.getenv("SCRAPE_CACHE_EMPTY_TTL_MINUTES", "5")) * 60,
+    max_entries=int(os.getenv("SCRAPE_CACHE_MAX_ENTRIES", "2000"))
+)
+
+# Scrape titles guessed locally from the resume while Gemini runs (results are reused via the scrape cache)
+SPECULATIVE_SCRAPE_ENABLED = os.getenv("SPECULATIVE_SCRAPE_ENABLED", "true").lower() == "true"
+SPECULATIVE_MAX_TITLES = int(os.getenv("SPECULATIVE_MAX_TITLES", "2"))
+
+# Optional local job index filled by ingest_worker.py; covered titles skip live scraping
+JOB_INDEX_ENABLED = os.getenv("JOB_INDEX_ENABLED", "false").lower() == "true"
+JOB_INDEX_PATH = os.getenv("JOB_INDEX_PATH", os.path.join("cache", "job_index.db"))
+JOB_INDEX_MAX_AGE_SECONDS = float(os.getenv("JOB_INDEX_MAX_AGE_HOURS", "24")) * 3600
+JOB_INDEX_MIN_MATCHES = int(os.getenv("JOB_INDEX_MIN_MATCHES", "10"))
+JOB_INDEX_MAX_RESULTS = int(os.getenv("JOB_INDEX_MAX_RESULTS", "100"))
+job_index = JobIndex(JOB_INDEX_PATH) if JOB_INDEX_ENABLED else None
+
+# Similarity scorer for ranking: "tfidf", "lsa" (semantic model) or "hybrid" (average of both)
+MATCH_SCORER = os.getenv("MATCH_SCORER", "tfidf").lower()
+semantic_model_store = SemanticModelStore(os.getenv("SEMANTIC_MODEL_PATH", os.path.join("cache", "semantic_model.npz")))
+
+def build_pool_index(documents):
+    """LSA embeddings (LSH on large pools) when a semantic scorer and model are available, else BM25."""
+    model = semantic_model_store.get() if MATCH_SCORER in ("lsa", "hybrid") else None
+    if model is not None:
+        return SemanticJobIndex(
+            model,
+            n_tables=int(os.getenv("SEMANTIC_LSH_TABLES", "8")),
+            n_bits=int(os.getenv("SEMANTIC_LSH_BITS", "12")),
+            min_lsh_docs=int(os.getenv("SEMANTIC_LSH_MIN_DOCS", "500000"))
+        ).build(documents)
+    return BM25Index().build(documents)
+
+# Candidate retrieval over the whole local job index, ahead of ranking
+RETRIEVAL_ENABLED = os.getenv("RETRIEVAL_ENABLED", "false").lower() == "true"
+RETRIEVAL_CANDIDATES = int(os.getenv("RETRIEVAL_CANDIDATES", "300"))
+job_pool_retriever = JobPoolRetriever(
+    lambda location: map(Job.from_dict, job_index.iter_jobs(location, JOB_INDEX_MAX_AGE_SECONDS)),
+    refresh_seconds=float(os.getenv("RETRIEVAL_REFRESH_MINUTES", "15")) * 60,
+    build_index=build_pool_index
+) if job_index is not None and RETRIEVAL_ENABLED else None
+
+# MinHash agreement above which two postings from the same company are merged
+JOB_DEDUPE_THRESHOLD = float(os.getenv("JOB_DEDUPE_THRESHOLD", "0.7"))
+
+# Pre-fitted TF-IDF model (python tfidf_model.py); without it each request fits its own
+tfidf_model_store = TfidfModelStore(os.getenv("TFIDF_MODEL_PATH", os.path.join("cache", "tfidf_model.npz")))
+
+# TF-IDF rows of job descriptions under the pre-fitted model (disk tier is optional)
+job_vector_cache = JobVectorCache(
+    max_entries=int(os.getenv("JOB_VECTOR_CACHE_MAX_ENTRIES", "20000")),
+    disk_dir=os.getenv("JOB_VECTOR_CACHE_DIR") or None
+)
+
+# Apply-link enrichment stage limits
+ENRICH_MAX_JOBS = int(os.getenv("ENRICH_MAX_JOBS", "30"))
+ENRICH_MAX_WORKERS = int(os.getenv("ENRICH_MAX_WORKERS", "8"))
+ENRICH_BUDGET_SECONDS = float(os.getenv("ENRICH_BUDGET_SECONDS", "15"))
+
+# Persistent company -> career page cache (misses are cached with a shorter TTL, failed lookups shorter still)
+career_page_cache = CareerPageCache(
+    os.getenv("CAREER_CACHE_PATH", os.path.join("cache", "career_pages.db")),
+    ttl_seconds=float(os.getenv("CAREER_CACHE_TTL_HOURS", "168")) * 3600,
+    negative_ttl_seconds=float(os.getenv("CAREER_CACHE_NEGATIVE_TTL_HOURS", "24")) * 3600,
+    error_ttl_seconds=float(os.getenv("CAREER_CACHE_ERROR_TTL_MINUTES", "5")) * 60
+)
+
+# Resume analysis cache keyed by PDF content hash (disk tier is optional)
+resume_analysis_cache = ResumeAnalysisCache(
+    max_entries=int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "256")),
+    disk_dir=os.getenv("RESUME_CACHE_DIR") or None
+)
+
+# Generated job titles / level variants keyed by canonical skill set + experience level
+job_title_cache = JobTitleCache(
+    ttl_seconds=float(os.getenv("TITLE_CACHE_TTL_HOURS", "24")) * 3600,
+    max_entries=int(os.getenv("TITLE_CACHE_MAX_ENTRIES", "1000")),
+    min_jaccard=float(os.getenv("TITLE_CACHE_MIN_JACCARD", "0.9"))
+)
+
+# Background searches for the submit/poll API (records are shared across workers via SQLite)
+search_job_manager = SearchJobManager(
+    SearchStore(os.getenv("SEARCH_STORE_PATH", os.path.join("cache", "searches.db"))),
+    max_workers=int(os.getenv("SEARCH_MAX_WORKERS", "4")),
+    max_pending=int(os.getenv("SEARCH_MAX_PENDING", "32")),
+    retention_seconds=float(os.getenv("SEARCH_RESULT_TTL_MINUTES", "60")) * 60
+)
+
+# Ranked results per search session, paged / filtered / re-sorted server-side
+result_session_store = ResultSessionStore(
+    os.getenv("RESULT_SESSION_PATH", os.path.join("cache", "result_sessions.db")),
+    ttl_seconds=float(os.getenv("RESULT_SESSION_TTL_MINUTES", "60")) * 60
+)
+RESULTS_PAGE_SIZE = int(os.getenv("RESULTS_PAGE_SIZE", "12"))
+RESULTS_MAX_PAGE_SIZE = int(os.getenv("RESULTS_MAX_PAGE_SIZE", "100"))
+RESULT_SORTS = ("score", "date", "company", "title")
+
+# gzip / brotli for buffered responses above a minimum size (streamed responses are never compressed)
+RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() == "true"
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+
+# Resume PDF text extraction runs in a separate process per document, with per-document limits
+RESUME_MAX_UPLOAD_MB = float(os.getenv("RESUME_MAX_UPLOAD_MB", "5"))
+pdf_text_extractor = PdfTextExtractor(
+    max_workers=int(os.getenv("RESUME_PDF_WORKERS", "2")),
+    timeout=float(os.getenv("RESUME_PDF_TIMEOUT_SECONDS", "10")),
+    max_pages=int(os.getenv("RESUME_PDF_MAX_PAGES", "30")),
+    max_chars=int(os.getenv("RESUME_MAX_CHARS", "20000"))
+)
 
 # Initialize Flask App
 app = Flask(__name__, template_folder='templates', static_folder='static')
+app.config['MAX_CONTENT_LENGTH'] = int(RESUME_MAX_UPLOAD_MB * 1024 * 1024)
 CORS(app)
 
 # Configure logging
@@ -53,47 +220,109 @@ logger = logging.getLogger(__name__)
 #     # Deprecated - using localStorage instead
 #     pass
 
-def parse_resume(file_stream) -> str:
-    """Reads a PDF file stream and returns its text content."""
+def parse_resume(resume_bytes: bytes) -> str:
+    """Returns the text content of a PDF (see PdfTextExtractor for the page, size and time limits)."""
     try:
-        reader = PyPDF2.PdfReader(file_stream)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
+        return pdf_text_extractor.extract_text(resume_bytes)
+    except PdfExtractionError as e:
         logger.error(f"Error parsing PDF: {e}")
         return ""
 
-def extract_experience_and_skills(resume_text: str) -> dict:
-    """Uses Gemini API to extract experience level and skills from resume in multiple requests."""
+def extract_experience_and_skills(resume_text: str, mode: str = None) -> dict:
+    """
+    Uses Gemini API to extract experience level and skills from resume in multiple requests.
+    While Gemini is unavailable (circuit breaker open, no request slot) or its extraction fails
+    (no skills/level, or no job titles beyond the generic fallback), the local analyzer's profile is returned.
+    """
     if not resume_text:
         return {"experience_level": "entry", "years_experience": 0, "skills": [], "job_titles": []}
     
+    if gemini_limiter.is_open():
+        logger.warning("Gemini circuit breaker is open, using the local resume profile")
+        return local_fallback_profile(resume_text)
+    
+    try:
+        profile = extract_experience_and_skills_with_gemini(resume_text, mode)
+    except GeminiUnavailable as e:
+        logger.warning(f"Gemini unavailable ({e}), using the local resume profile")
+        return local_fallback_profile(resume_text)
+    
+    if not profile.get('job_titles'):
+        logger.warning("Gemini extraction failed, using the local resume profile")
+        return local_fallback_profile(resume_text)
+    return profile
+
+def local_fallback_profile(resume_text: str) -> dict:
+    profile = analyze_resume_locally(resume_text)
+    profile['analysis_source'] = 'local'  # Not cached, so the next upload retries Gemini
+    return profile
+
+def is_cacheable_analysis(experience_data: dict) -> bool:
+    """Only complete Gemini extractions are cached; local and degraded profiles are retried on the next upload."""
+    return bool(experience_data.get('job_titles')) and experience_data.get('analysis_source') not in ('local', 'degraded')
+
+def refine_resume_analysis(digest: str, resume_text: str):
+    """Background Gemini analysis for local_first mode; only a real Gemini result is cached."""
+    try:
+        experience_data = extract_experience_and_skills(resume_text)
+        if is_cacheable_analysis(experience_data):
+            resume_analysis_cache.put(digest, resume_text, experience_data)
+            logger.info(f"Refined resume analysis cached for {digest[:12]}")
+    except Exception as e:
+        logger.error(f"Error refining resume analysis: {e}")
+
+def extract_experience_and_skills_with_gemini(resume_text: str, mode: str = None) -> dict:
     model = genai.GenerativeModel('gemini-1.5-flash')
     
+    # Single structured request, falling back to the chained prompts if it fails validation
+    if (mode or GEMINI_EXTRACTION_MODE) == "single":
+        profile = extract_resume_profile_single_call(resume_text, model)
+        if profile:
+            return profile
+        logger.warning("Single-call extraction failed validation, falling back to chained requests")
+    
     # Request 1: Extract basic experience and skills
     basic_info = extract_basic_resume_info(resume_text, model)
+    if basic_info is None:
+        return {}
     
-    # Request 2: Generate job titles based on skills
-    job_titles = generate_job_titles_from_skills(basic_info.get('skills', []), model)
+    skills = basic_info.get('skills', [])
+    experience_level = basic_info.get('experience_level', 'entry')
     
-    # Request 3: Generate experience-level specific variants
-    experience_variants = generate_experience_level_variants(
-        job_titles, 
-        basic_info.get('experience_level', 'entry'),
-        basic_info.get('years_experience', 0),
-        model
-    )
+    # Requests 2 and 3 only depend on the skills and level, so similar profiles share them
+    cached_titles = job_title_cache.get(skills, experience_level)
+    if cached_titles is not None:
+        logger.info("Job title cache hit, skipping title generation requests")
+        experience_variants = cached_titles['variants']
+    else:
+        # Request 2: Generate job titles based on skills
+        job_titles = generate_job_titles_from_skills(skills, model)
+        if job_titles == FALLBACK_JOB_TITLES:
+            # Generic titles only mean title generation failed; the local profile does better
+            return {}
+        
+        # Request 3: Generate experience-level specific variants
+        experience_variants = generate_experience_level_variants(
+            job_titles, 
+            experience_level,
+            basic_info.get('years_experience', 0),
+            model
+        )
+        
+        # Unchanged titles (failed variant request) are not worth caching
+        if experience_variants != job_titles:
+            job_title_cache.put(skills, experience_level, job_titles, experience_variants)
     
     # Combine all results
     result = basic_info.copy()
     result['job_titles'] = experience_variants
+    if cached_titles is None and experience_variants == job_titles:
+        result['analysis_source'] = 'degraded'  # Variant request failed; not cached, so a re-upload retries it
     
     return result
 
 def extract_basic_resume_info(resume_text: str, model) -> dict:
-    """First Gemini request: Extract basic experience and skills."""
+    """First Gemini request: Extract basic experience and skills. Returns None if the request fails."""
     prompt = f"""
     Analyze the following resume text and extract:
     1. Total years of experience (sum of all work experience). If the resume doesn't have end date for experience and says "Present", use current month and year as end date.
@@ -121,19 +350,20 @@ def extract_basic_resume_info(resume_text: str, model) -> dict:
     """
     
     try:
-        response = model.generate_content(prompt)
-        time.sleep(1)  # Rate limiting for Gemini API
+        response = gemini_limiter.call(model.generate_content, prompt)
         json_response_text = response.text.strip().replace("```json", "").replace("```", "")
         data = json.loads(json_response_text)
         return data
+    except GeminiUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Error extracting basic resume info: {e}")
-        return {"experience_level": "entry", "years_experience": 0, "skills": []}
+        return None
 
 def generate_job_titles_from_skills(skills: list, model) -> list:
     """Second Gemini request: Generate popular job titles based on skills."""
     if not skills:
-        return ["Software Engineer", "Developer"]
+        return list(FALLBACK_JOB_TITLES)
     
     skills_text = ", ".join(skills)
     prompt = f"""
@@ -162,14 +392,15 @@ def generate_job_titles_from_skills(skills: list, model) -> list:
     """
     
     try:
-        response = model.generate_content(prompt)
-        time.sleep(1)  # Rate limiting for Gemini API
+        response = gemini_limiter.call(model.generate_content, prompt)
         json_response_text = response.text.strip().replace("```json", "").replace("```", "")
         job_titles = json.loads(json_response_text)
         return job_titles if isinstance(job_titles, list) else []
+    except GeminiUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Error generating job titles from skills: {e}")
-        return ["Software Engineer", "Developer"]
+        return list(FALLBACK_JOB_TITLES)
 
 def generate_experience_level_variants(job_titles: list, experience_level: str, years_experience: int, model) -> list:
     """Third Gemini request: Generate experience-level specific variants of job titles."""
@@ -203,15 +434,97 @@ def generate_experience_level_variants(job_titles: list, experience_level: str,
     """
     
     try:
-        response = model.generate_content(prompt)
-        time.sleep(1)  # Rate limiting for Gemini API
+        response = gemini_limiter.call(model.generate_content, prompt)
         json_response_text = response.text.strip().replace("```json", "").replace("```", "")
         variants = json.loads(json_response_text)
         return variants if isinstance(variants, list) else job_titles
+    except GeminiUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Error generating experience level variants: {e}")
         return job_titles
 
+def extract_resume_profile_single_call(resume_text: str, model) -> dict:
+    """Single Gemini request: experience, skills, base job titles and experience-level variants together."""
+    prompt = f"""
+    Analyze the following resume text and return a single JSON object describing the candidate.
+
+    1. Total years of experience (sum of all work experience). If the resume doesn't have end date for experience and says "Present", use current month and year as end date.
+    2. Experience level based on years:
+       - Entry: 0-1 years
+       - Junior: 1-3 years
+       - Mid: 3-5 years
+       - Senior: 5-8 years
+       - Lead: 8+ years
+    3. Key technical skills (programming languages, frameworks, tools, technologies)
+    4. 8-12 popular, in-demand job titles that suit these skills and are commonly posted on job boards
+    5. 10-15 variants of those titles appropriate for the experience level:
+       - Entry: prefixes like "Associate", "Entry Level", "Junior", "Graduate", or suffixes like "I", "Trainee"
+       - Junior: prefixes like "Junior", or suffixes like "I", "1"
+       - Mid: suffixes like "II", "2" or keep original titles
+       - Senior: prefixes like "Senior" or suffixes like "III", "3"
+       - Lead: prefixes like "Senior", "Lead", "Principal" or suffixes like "IV", "Lead"
+
+    Return ONLY a JSON object with:
+    {{
+        "experience_level": "entry|junior|mid|senior|lead",
+        "years_experience": number,
+        "skills": ["skill1", "skill2", ...],
+        "base_job_titles": ["title1", "title2", ...],
+        "job_titles": ["experience-appropriate title1", "experience-appropriate title2", ...]
+    }}
+
+    Resume Text:
+    ---
+    {resume_text}
+    ---
+    """
+    
+    try:
+        response = gemini_limiter.call(model.generate_content, prompt)
+        json_response_text = response.text.strip().replace("```json", "").replace("```", "")
+        return validate_resume_profile(json.loads(json_response_text))
+    except GeminiUnavailable:
+        raise
+    except Exception as e:
+        logger.error(f"Error in single-call resume extraction: {e}")
+        return None
+
+def validate_resume_profile(data: dict) -> dict:
+    """Validate a structured resume profile. Returns the normalized profile, or None if it is unusable."""
+    if not isinstance(data, dict):
+        return None
+    
+    experience_level = str(data.get('experience_level', '')).strip().lower()
+    if experience_level not in EXPERIENCE_LEVELS:
+        return None
+    
+    try:
+        years_experience = float(data.get('years_experience'))
+    except (TypeError, ValueError):
+        return None
+    if years_experience < 0:
+        return None
+    if years_experience.is_integer():
+        years_experience = int(years_experience)
+    
+    def string_list(value):
+        if not isinstance(value, list):
+            return []
+        return [item.strip() for item in value if isinstance(item, str) and item.strip()]
+    
+    skills = string_list(data.get('skills'))
+    job_titles = string_list(data.get('job_titles')) or string_list(data.get('base_job_titles'))
+    if not job_titles:
+        return None
+    
+    return {
+        "experience_level": experience_level,
+        "years_experience": years_experience,
+        "skills": skills,
+        "job_titles": job_titles
+    }
+
 # Removed: generate_experience_based_job_titles - replaced with AI-generated titles
 
 def get_experience_based_search_filters(experience_data: dict) -> dict:
@@ -247,18 +560,11 @@ def get_experience_based_search_filters(experience_data: dict) -> dict:
 def scrape_linkedin_jobs(job_title: str, location: str = "India", experience_filters: dict = None) -> list:
     """Updated LinkedIn scraping without SerpAPI"""
     try:
-        jobs = alternative_scraper.scrape_linkedin_jobs_direct(job_title, location)
-        
-        # Apply experience filters
-        if experience_filters:
-            filtered_jobs = []
-            for job in jobs:
-                cleaned_job = clean_job_data_updated(job, "LinkedIn")
-                if cleaned_job and matches_experience_level(cleaned_job, experience_filters):
-                    filtered_jobs.append(cleaned_job)
-            return filtered_jobs
-        
-        return [clean_job_data_updated(job, "LinkedIn") for job in jobs if clean_job_data_updated(job, "LinkedIn")]
+        jobs = scrape_result_cache.get_or_fetch(
+            "LinkedIn", job_title, location,
+            lambda: alternative_scraper.scrape_linkedin_jobs_direct(job_title, location)
+        )
+        return request_jobs(jobs, experience_filters)
     except Exception as e:
         logger.error(f"Error scraping LinkedIn jobs for '{job_title}': {e}")
         return []
@@ -266,18 +572,11 @@ def scrape_linkedin_jobs(job_title: str, location: str = "India", experience_fil
 def scrape_indeed_jobs(job_title: str, location: str = "India", experience_filters: dict = None) -> list:
     """Updated Indeed scraping without SerpAPI"""
     try:
-        jobs = alternative_scraper.scrape_indeed_direct(job_title, location)
-        
-        # Apply experience filters
-        if experience_filters:
-            filtered_jobs = []
-            for job in jobs:
-                cleaned_job = clean_job_data_updated(job, "Indeed")
-                if cleaned_job and matches_experience_level(cleaned_job, experience_filters):
-                    filtered_jobs.append(cleaned_job)
-            return filtered_jobs
-        
-        return [clean_job_data_updated(job, "Indeed") for job in jobs if clean_job_data_updated(job, "Indeed")]
+        jobs = scrape_result_cache.get_or_fetch(
+            "Indeed", job_title, location,
+            lambda: alternative_scraper.scrape_indeed_direct(job_title, location)
+        )
+        return request_jobs(jobs, experience_filters)
     except Exception as e:
         logger.error(f"Error scraping Indeed jobs for '{job_title}': {e}")
         return []
@@ -285,18 +584,11 @@ def scrape_indeed_jobs(job_title: str, location: str = "India", experience_filte
 def scrape_naukri_jobs(job_title: str, location: str = "India", experience_filters: dict = None) -> list:
     """Updated Naukri scraping without SerpAPI"""
     try:
-        jobs = alternative_scraper.scrape_naukri_direct(job_title, location)
-        
-        # Apply experience filters
-        if experience_filters:
-            filtered_jobs = []
-            for job in jobs:
-                cleaned_job = clean_job_data_updated(job, "Naukri")
-                if cleaned_job and matches_experience_level(cleaned_job, experience_filters):
-                    filtered_jobs.append(cleaned_job)
-            return filtered_jobs
-        
-        return [clean_job_data_updated(job, "Naukri") for job in jobs if clean_job_data_updated(job, "Naukri")]
+        jobs = scrape_result_cache.get_or_fetch(
+            "Naukri", job_title, location,
+            lambda: alternative_scraper.scrape_naukri_direct(job_title, location)
+        )
+        return request_jobs(jobs, experience_filters)
     except Exception as e:
         logger.error(f"Error scraping Naukri jobs for '{job_title}': {e}")
         return []
@@ -308,196 +600,243 @@ def scrape_jsearch_jobs(job_title: str, location: str = "India", experience_filt
             logger.warning("RapidAPI key not found, skipping JSearch API")
             return []
             
-        jobs = alternative_scraper.use_jsearch_api(job_title, location, RAPIDAPI_KEY)
-        
-        # Apply experience filters
-        if experience_filters:
-            filtered_jobs = []
-            for job in jobs:
-                cleaned_job = clean_job_data_updated(job, "JSearch")
-                if cleaned_job and matches_experience_level(cleaned_job, experience_filters):
-                    filtered_jobs.append(cleaned_job)
-            return filtered_jobs
-        
-        return [clean_job_data_updated(job, "JSearch") for job in jobs if clean_job_data_updated(job, "JSearch")]
+        jobs = scrape_result_cache.get_or_fetch(
+            "JSearch", job_title, location,
+            lambda: alternative_scraper.use_jsearch_api(job_title, location, RAPIDAPI_KEY)
+        )
+        return request_jobs(jobs, experience_filters)
     except Exception as e:
         logger.error(f"Error using JSearch API for '{job_title}': {e}")
         return []
 
+def request_jobs(jobs: list, experience_filters: dict = None) -> list:
+    """
+    This request's copies of cached scrape results (already normalized by the
+    scraper) that match the experience filters; ranking and enrichment then
+    update the copies in place.
+    """
+    return [job.copy() for job in jobs if job and matches_experience_level(job, experience_filters)]
+
+def job_match_text(job: dict) -> str:
+    return f"{job.get('title', '')} {job.get('description', '')}"
+
 def matches_experience_level(job: dict, experience_filters: dict) -> bool:
     """Check if job matches the experience level filters."""
     if not experience_filters:
         return True
     
-    job_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
+    job_text = job_match_text(job)
     
     # Check for excluded keywords
-    exclude_keywords = experience_filters.get('exclude', [])
-    for keyword in exclude_keywords:
-        if keyword.lower() in job_text:
-            return False
+    if get_matcher(experience_filters.get('exclude', [])).search(job_text):
+        return False
     
     # Check for required keywords (at least one should match)
     include_keywords = experience_filters.get('keywords', [])
-    if include_keywords:
-        has_matching_keyword = any(keyword.lower() in job_text for keyword in include_keywords)
-        if not has_matching_keyword:
-            return False
+    if include_keywords and not get_matcher(include_keywords).search(job_text):
+        return False
     
     return True
 
+def resolve_company_website(company_name: str) -> str:
+    """
+    Find a company's website using basic search (SerpAPI if available).
+    Raises LookupUnavailable when SerpAPI could not be reached, so the miss is only cached briefly.
+    """
+    if not SERPAPI_KEY:
+        # Without SerpAPI, we can't easily find company websites
+        return None
+        
+    try:
+        from serpapi import GoogleSearch
+    except ImportError:
+        logger.warning("SERPAPI_KEY is set but the serpapi package is not installed")
+        return None
+    
+    try:
+        search_params = {
+            "engine": "google",
+            "q": f"{company_name} official website",
+            "api_key": SERPAPI_KEY,
+            "num": 1
+        }
+        
+        search = GoogleSearch(search_params)
+        results = search.get_dict()
+    except Exception as e:
+        raise LookupUnavailable(f"SerpAPI request failed: {e}") from e
+    
+    # An explicit answer (no results, quota exhausted, rejected request) is a real miss
+    if results.get("error"):
+        logger.warning(f"SerpAPI returned an error for {company_name}: {results['error']}")
+    if "organic_results" in results and results["organic_results"]:
+        return results["organic_results"][0].get("link", "")
+    return None
+
 def find_career_page(company_name: str, company_url: str = None) -> str:
     """Find the career page URL for a company."""
     try:
-        # Common career page patterns
-        career_patterns = [
-            "/careers",
-            "/jobs",
-            "/career",
-            "/job",
-            "/work-with-us",
-            "/join-us",
-            "/opportunities"
-        ]
-        
-        if company_url:
-            base_url = company_url
-        else:
-            # Try to find company website using basic search (fallback to SerpAPI if available)
-            if SERPAPI_KEY:
-                try:
-                    from serpapi import GoogleSearch
-                    search_params = {
-                        "engine": "google",
-                        "q": f"{company_name} official website",
-                        "api_key": SERPAPI_KEY,
-                        "num": 1
-                    }
-                    
-                    search = GoogleSearch(search_params)
-                    results = search.get_dict()
-                    
-                    if "organic_results" in results and results["organic_results"]:
-                        base_url = results["organic_results"][0].get("link", "")
-                    else:
-                        return None
-                except:
-                    # If SerpAPI fails, try basic search approach
-                    return None
-            else:
-                # Without SerpAPI, we can't easily find company websites
-                return None
+        base_url = company_url or resolve_company_website(company_name)
         
         if not base_url:
             return None
             
-        # Try different career page URLs
-        for pattern in career_patterns:
-            career_url = urljoin(base_url, pattern)
-            try:
-                response = requests.get(career_url, timeout=10)
-                if response.status_code == 200:
-                    return career_url
-            except:
-                continue
-                
-        return None
+        # Try different career page URLs over the scraper's pooled connections
+        return alternative_scraper.find_career_page(base_url)
         
+    except LookupUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Error finding career page for {company_name}: {e}")
         return None
 
 def extract_apply_links_from_career_page(career_url: str) -> list:
     """Extract apply links from a company's career page."""
-    apply_links = []
-    
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(career_url, headers=headers, timeout=10)
-        if response.status_code != 200:
-            return apply_links
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Common apply link patterns
-        apply_patterns = [
-            'apply',
-            'apply now',
-            'apply for this position',
-            'submit application',
-            'apply online',
-            'apply here',
-            'apply today'
-        ]
-        
-        # Find all links
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            link_text = link.get_text().lower().strip()
-            href = link.get('href', '')
-            
-            # Check if link text matches apply patterns
-            if any(pattern in link_text for pattern in apply_patterns):
-                full_url = urljoin(career_url, href)
-                apply_links.append({
-                    'text': link.get_text().strip(),
-                    'url': full_url
-                })
-            
-            # Also check href for apply patterns
-            elif any(pattern in href.lower() for pattern in apply_patterns):
-                full_url = urljoin(career_url, href)
-                apply_links.append({
-                    'text': link.get_text().strip() or 'Apply',
-                    'url': full_url
-                })
-            
-            # Limit to maximum 3 apply links
-            if len(apply_links) >= 3:
-                break
-        
-        return apply_links
-        
+        return alternative_scraper.extract_apply_links_from_career_page(career_url)
     except Exception as e:
         logger.error(f"Error extracting apply links from {career_url}: {e}")
-        return apply_links
+        return []
 
-def enhance_job_with_apply_links(job: dict) -> dict:
-    """Enhance job with direct apply links from career page."""
+def lookup_company_apply_links(company_name: str) -> dict:
+    """Find a company's career page and apply links. Returns None if no career page was found."""
+    if not company_name:
+        return None
+    
+    # Serve from the persistent cache (including cached misses)
+    cached = career_page_cache.get(company_name)
+    if cached is not None:
+        return cached['result']
+    
+    # Find career page; a failed lookup (network error, timeout) is retried after a few minutes
+    base_url = None
     try:
-        company_name = job.get('company_name', '')
-        if not company_name:
-            return job
-            
-        # Find career page
-        career_url = find_career_page(company_name)
-        if not career_url:
-            return job
-            
-        # Extract apply links
-        apply_links = extract_apply_links_from_career_page(career_url)
-        
-        if apply_links:
-            # Add career page and apply links to job
-            job['career_page'] = career_url
-            job['apply_links'] = apply_links
-            job['has_direct_apply'] = True
-        else:
-            job['has_direct_apply'] = False
-            
-        return job
+        base_url = resolve_company_website(company_name)
+        career_url = find_career_page(company_name, base_url) if base_url else None
+    except LookupUnavailable as e:
+        logger.warning(f"Career page lookup for {company_name} failed: {e}")
+        career_page_cache.put(company_name, base_url=base_url, failed=True)
+        return None
+    if not career_url:
+        career_page_cache.put(company_name, base_url=base_url)
+        return None
         
+    # Extract apply links
+    apply_links = extract_apply_links_from_career_page(career_url)
+    career_page_cache.put(company_name, base_url, career_url, apply_links)
+    return {
+        'career_page': career_url,
+        'apply_links': apply_links
+    }
+
+# Apply-link enrichment for the top jobs, on one bounded pool shared by all requests
+enrichment_stage = ApplyLinkEnrichmentStage(
+    lookup_company_apply_links,
+    max_jobs=ENRICH_MAX_JOBS,
+    max_workers=ENRICH_MAX_WORKERS,
+    budget_seconds=ENRICH_BUDGET_SECONDS
+)
+
+def enrich_jobs_with_apply_links(jobs: list) -> list:
+    """Enrichment stage: look up apply links per company in parallel within a wall-clock budget."""
+    return enrichment_stage.run(jobs)
+
+def get_search_configs(location: str) -> list:
+    """Search configurations for the different job boards."""
+    search_configs = [
+        {
+            "name": "Naukri",
+            "host": "naukri.com",
+            "scraper": scrape_naukri_jobs,
+            "locations": [location]
+        },
+        {
+            "name": "Indeed",
+            "host": "indeed.com",
+            "scraper": scrape_indeed_jobs,
+            "locations": [location]
+        },
+        {
+            "name": "LinkedIn",
+            "host": "linkedin.com",
+            "scraper": scrape_linkedin_jobs,
+            "locations": [location]
+        },
+        {
+            "name": "JSearch",
+            "host": "jsearch",
+            "scraper": scrape_jsearch_jobs,
+            "locations": [location]
+        }
+    ]
+    return search_configs
+
+def build_scrape_tasks(titles: list, search_configs: list, experience_filters: dict = None) -> list:
+    """One scheduler task per (title, source, location); cached or in-flight results skip host pacing."""
+    tasks = []
+    for title in titles:
+        for config in search_configs:
+            for location in config["locations"]:
+                tasks.append({
+                    "name": config["name"],
+                    "host": config["host"],
+                    "title": title,
+                    "func": config["scraper"],
+                    "args": (title, location, experience_filters),
+                    "rate_limited": not scrape_result_cache.is_warm(config["name"], title, location)
+                })
+    return tasks
+
+def start_speculative_scrapes(resume_text: str, location_filter: str) -> list:
+    """
+    Start scraping titles guessed from a local dictionary scan of the resume while
+    Gemini is still analyzing it. Each guess gets the level prefix for the locally
+    estimated experience ("Senior Python Developer"), the form the analysis returns,
+    so discovery later reuses these fetches through scrape_result_cache (joining them
+    if still in flight); only new titles are fetched.
+    """
+    if not SPECULATIVE_SCRAPE_ENABLED or not resume_text:
+        return []
+    
+    level = experience_level_for_years(years_of_experience(resume_text))
+    guesses = [level_title_variants([title], level, limit=1)[0]
+               for title in guess_job_titles(resume_text, SPECULATIVE_MAX_TITLES)]
+    titles = [title for title in guesses if get_indexed_jobs(title, location_filter) is None]
+    tasks = [task for task in build_scrape_tasks(titles, get_search_configs(location_filter)) if task["rate_limited"]]
+    if tasks:
+        logger.info(f"Speculatively scraping {titles} ({len(tasks)} scrapes) while the resume is analyzed")
+        scrape_scheduler.start(tasks, timeout=SCRAPE_DEADLINE_SECONDS)
+    return titles
+
+def get_indexed_jobs(title: str, location: str, experience_filters: dict = None) -> list:
+    """Jobs for a title from the local job index, or None if the index doesn't cover the title."""
+    if job_index is None:
+        return None
+    
+    jobs = job_index.search(title, location, JOB_INDEX_MAX_AGE_SECONDS, limit=JOB_INDEX_MAX_RESULTS)
+    if len(jobs) < JOB_INDEX_MIN_MATCHES and not job_index.is_ingested(title, location, JOB_INDEX_MAX_AGE_SECONDS):
+        return None
+    
+    return [Job.from_dict(job) for job in jobs if matches_experience_level(job, experience_filters)]
+
+def get_pool_candidates(resume_text: str, location: str, experience_filters: dict = None) -> list:
+    """Best matches for the resume across the whole local job pool (empty if retrieval is off)."""
+    if job_pool_retriever is None or not resume_text:
+        return []
+    
+    try:
+        candidates = job_pool_retriever.search(location, resume_text, RETRIEVAL_CANDIDATES)
     except Exception as e:
-        logger.error(f"Error enhancing job with apply links: {e}")
-        return job
+        logger.error(f"Error retrieving candidates from the job pool: {e}")
+        return []
+    
+    return request_jobs(candidates, experience_filters)
 
-def discover_jobs_enhanced(experience_data: dict, date_filter: str = "all", location_filter: str = "India") -> list:
-    """Enhanced job discovery using AI-generated job titles from resume analysis"""
+def iter_discovered_job_batches(experience_data: dict, date_filter: str = "all", location_filter: str = "India", resume_text: str = None):
+    """Enhanced job discovery using AI-generated job titles; yields (source, new_jobs) as each scrape finishes."""
     all_jobs = []
+    # Exact and near-duplicate postings are merged into the first one seen
+    deduper = JobDeduplicator(JOB_DEDUPE_THRESHOLD)
     
     # Use AI-generated job titles from resume analysis
     ai_generated_titles = experience_data.get('job_titles', [])
@@ -523,61 +862,56 @@ def discover_jobs_enhanced(experience_data: dict, date_filter: str = "all", loca
     # Get experience filters for filtering results
     experience_filters = get_experience_based_search_filters(experience_data)
     
-    # Define search configurations for different job boards (updated)
-    search_configs = [
-        {
-            "name": "Naukri",
-            "scraper": scrape_naukri_jobs,
-            "locations": [location_filter]
-        },
-        {
-            "name": "Indeed", 
-            "scraper": scrape_indeed_jobs,
-            "locations": [location_filter]
-        },
-        {
-            "name": "LinkedIn",
-            "scraper": scrape_linkedin_jobs,
-            "locations": [location_filter]
-        },
-        {
-            "name": "JSearch",
-            "scraper": scrape_jsearch_jobs,
-            "locations": [location_filter]
-        }
-    ]
+    # Resume-matched candidates from the whole local pool, not just the searched titles
+    new_jobs = []
+    for job in get_pool_candidates(resume_text, location_filter, experience_filters):
+        if is_recent_job(job, date_filter) and deduper.add(job):
+            all_jobs.append(job)
+            new_jobs.append(job)
+    if new_jobs:
+        logger.info(f"Retrieved {len(new_jobs)} candidates from the job pool")
+        yield "Index", new_jobs
     
-    # Process each scraper sequentially for better reliability
+    # Titles the local job index already covers are served from disk
+    titles_to_scrape = []
     for title in job_titles_to_search[:4]:  # Limit to top 4 AI-generated job titles
-        for config in search_configs:
-            try:
-                for location in config["locations"]:
-                    logger.info(f"Scraping {config['name']} for '{title}' in {location}")
-                    jobs = config["scraper"](title, location, experience_filters)
-                    
-                    for job in jobs:
-                        if job and is_recent_job(job, date_filter) and not is_duplicate_job(job, all_jobs):
-                            all_jobs.append(job)
-                    
-                    # Small delay between requests to be respectful
-                    time.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"Error processing {config['name']} for '{title}': {e}")
-                continue
-    
-    # Enhance jobs with apply links (limit to avoid overwhelming)
-    enhanced_jobs = []
-    for job in all_jobs[:30]:  # Limit to first 30 jobs for apply link enhancement
-        enhanced_job = enhance_job_with_apply_links(job)
-        enhanced_jobs.append(enhanced_job)
-        time.sleep(0.5)  # Reduced rate limiting
-    
-    # Add remaining jobs without enhancement
-    enhanced_jobs.extend(all_jobs[30:])
-    
-    logger.info(f"Total jobs discovered: {len(enhanced_jobs)}")
-    return enhanced_jobs
+        indexed_jobs = get_indexed_jobs(title, location_filter, experience_filters)
+        if indexed_jobs is None:
+            titles_to_scrape.append(title)
+            continue
+        logger.info(f"Serving '{title}' from the job index ({len(indexed_jobs)} jobs)")
+        new_jobs = []
+        for job in indexed_jobs:
+            if is_recent_job(job, date_filter) and deduper.add(job):
+                all_jobs.append(job)
+                new_jobs.append(job)
+        if new_jobs:
+            yield "Index", new_jobs
+    
+    # Define search configurations for different job boards (updated)
+    search_configs = get_search_configs(location_filter)
+    
+    # Fan out every (title, source) scrape concurrently; pacing is per host
+    tasks = build_scrape_tasks(titles_to_scrape, search_configs, experience_filters)
+    
+    logger.info(f"Scheduling {len(tasks)} scrapes with a {SCRAPE_DEADLINE_SECONDS}s deadline")
+    for task, jobs in scrape_scheduler.iter_completed(tasks, timeout=SCRAPE_DEADLINE_SECONDS):
+        new_jobs = []
+        for job in jobs:
+            if job and is_recent_job(job, date_filter) and deduper.add(job):
+                all_jobs.append(job)
+                new_jobs.append(job)
+        if new_jobs:
+            yield task["name"], new_jobs
+    
+    logger.info(f"Total jobs discovered: {len(all_jobs)}")
+
+def discover_jobs_enhanced(experience_data: dict, date_filter: str = "all", location_filter: str = "India", resume_text: str = None) -> list:
+    """Enhanced job discovery using AI-generated job titles from resume analysis"""
+    all_jobs = []
+    for source, jobs in iter_discovered_job_batches(experience_data, date_filter, location_filter, resume_text):
+        all_jobs.extend(jobs)
+    return all_jobs
 
 def generate_title_variations(title: str) -> list:
     """Generate variations of job titles for better search coverage."""
@@ -672,118 +1006,29 @@ def get_cutoff_date(date_filter: str) -> datetime:
     else:
         return datetime.min  # Include all jobs
 
-def is_duplicate_job(new_job: dict, existing_jobs: list) -> bool:
-    """Check if a job is a duplicate based on title and company."""
-    for existing_job in existing_jobs:
-        if (new_job.get('title', '').lower() == existing_job.get('title', '').lower() and
-            new_job.get('company_name', '').lower() == existing_job.get('company_name', '').lower()):
-            return True
-    return False
-
-def clean_job_data(job: dict, source: str = "Unknown") -> dict:
-    """Cleans and standardizes job data from various sources."""
-    try:
-        cleaned = {
-            'title': job.get('title', ''),
-            'company_name': job.get('company_name', ''),
-            'location': job.get('location', ''),
-            'description': job.get('description', ''),
-            'job_id': job.get('job_id', ''),
-            'posted_at': job.get('posted_at', ''),
-            'salary': job.get('salary', ''),
-            'job_type': job.get('job_type', ''),
-            'apply_options': job.get('apply_options', []),
-            'related_links': job.get('related_links', []),
-            'source': source,
-            'career_page': None,
-            'apply_links': [],
-            'has_direct_apply': False
-        }
-        
-        # Ensure we have at least a title and company
-        if not cleaned['title'] or not cleaned['company_name']:
-            return None
-            
-        return cleaned
-    except Exception as e:
-        logger.error(f"Error cleaning job data: {e}")
-        return None
-
-def clean_job_data_updated(job: dict, source: str = "Unknown") -> dict:
-    """Updated job data cleaning function for alternative scrapers"""
-    try:
-        # Create a meaningful description if none exists
-        description = job.get('description', '')
-        if not description:
-            # Create description from available fields
-            desc_parts = []
-            if job.get('title'):
-                desc_parts.append(f"Position: {job.get('title')}")
-            if job.get('experience'):
-                desc_parts.append(f"Experience: {job.get('experience')}")
-            if job.get('salary'):
-                desc_parts.append(f"Salary: {job.get('salary')}")
-            if job.get('job_type'):
-                desc_parts.append(f"Type: {job.get('job_type')}")
-            description = '. '.join(desc_parts) if desc_parts else f"{job.get('title', '')} position at {job.get('company_name', '')}"
-        
-        # Ensure apply_url is properly formatted
-        apply_url = job.get('apply_url', '')
-        apply_options = []
-        
-        if apply_url:
-            apply_options.append({
-                'title': f"Apply on {source}",
-                'link': apply_url
-            })
-        
-        cleaned = {
-            'title': job.get('title', ''),
-            'company_name': job.get('company_name', ''),
-            'location': job.get('location', ''),
-            'description': description,
-            'job_id': job.get('job_id', f"{source}_{abs(hash(job.get('title', '') + job.get('company_name', '')))}"),
-            'posted_at': job.get('posted_at', ''),
-            'salary': job.get('salary', ''),
-            'job_type': job.get('job_type', ''),
-            'apply_options': apply_options,
-            'related_links': job.get('related_links', []),
-            'source': source,
-            'career_page': None,
-            'apply_links': [],
-            'has_direct_apply': bool(apply_url)
-        }
-        
-        # Ensure we have at least a title and company
-        if not cleaned['title'] or not cleaned['company_name']:
-            return None
-            
-        return cleaned
-    except Exception as e:
-        logger.error(f"Error cleaning job data: {e}")
-        return None
-
-def calculate_tfidf_similarity(resume_text: str, job_descriptions: list) -> list:
+def calculate_tfidf_similarity(resume_text: str, job_descriptions: list, job_ids: list = None) -> list:
     """Calculate TF-IDF based cosine similarity between resume and job descriptions."""
     if not resume_text or not job_descriptions:
         return [0.0] * len(job_descriptions)
     
     try:
-        # Combine resume and all job descriptions for TF-IDF vectorization
-        documents = [resume_text] + job_descriptions
+        vectorizer, model_version = tfidf_model_store.current()
+        if vectorizer is not None:
+            # Pre-fitted model: transform the resume, reuse cached job rows. Rows are
+            # L2-normalized, so one sparse mat-vec gives the cosine similarities.
+            resume_vector = vectorizer.transform([resume_text])
+            job_matrix = job_vector_cache.transform(
+                vectorizer, model_version, job_ids or [None] * len(job_descriptions), job_descriptions
+            )
+            return (job_matrix @ resume_vector.T).toarray().flatten().tolist()
         
-        # Create TF-IDF vectorizer with optimized parameters for job matching
-        vectorizer = TfidfVectorizer(
+        # No saved model yet: fit on the resume and all job descriptions of this request
+        documents = [resume_text] + job_descriptions
+        vectorizer = build_vectorizer(
             max_features=5000,  # Limit vocabulary size
-            stop_words='english',  # Remove common English stop words
-            ngram_range=(1, 2),  # Include both unigrams and bigrams
             min_df=1,  # Minimum document frequency
-            max_df=0.95,  # Maximum document frequency (ignore very common words)
-            lowercase=True,
-            token_pattern=r'\b[a-zA-Z][a-zA-Z0-9+#\.]*\b'  # Include tech terms like C++, C#, .NET
+            max_df=0.95  # Maximum document frequency (ignore very common words)
         )
-        
-        # Fit and transform documents
         tfidf_matrix = vectorizer.fit_transform(documents)
         
         # Calculate cosine similarity between resume (first document) and each job description
@@ -800,6 +1045,23 @@ def calculate_tfidf_similarity(resume_text: str, job_descriptions: list) -> list
         # Fallback to simple similarity
         return [simple_jaccard_similarity(resume_text, desc) for desc in job_descriptions]
 
+def calculate_match_similarity(resume_text: str, job_descriptions: list, job_ids: list = None) -> list:
+    """Resume/job similarities with the configured MATCH_SCORER, falling back to TF-IDF without a semantic model."""
+    model = semantic_model_store.get() if MATCH_SCORER in ("lsa", "hybrid") else None
+    if model is None:
+        return calculate_tfidf_similarity(resume_text, job_descriptions, job_ids)
+    
+    try:
+        semantic = model.similarity(resume_text, job_descriptions)
+    except Exception as e:
+        logger.error(f"Error in semantic similarity calculation: {e}")
+        return calculate_tfidf_similarity(resume_text, job_descriptions, job_ids)
+    
+    if MATCH_SCORER == "lsa":
+        return semantic
+    lexical = calculate_tfidf_similarity(resume_text, job_descriptions, job_ids)
+    return [(a + b) / 2 for a, b in zip(lexical, semantic)]
+
 def simple_jaccard_similarity(text1: str, text2: str) -> float:
     """Fallback simple text similarity using Jaccard similarity."""
     if not text1 or not text2:
@@ -824,52 +1086,27 @@ def simple_jaccard_similarity(text1: str, text2: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 def rank_jobs_by_similarity(resume_text: str, jobs: list, experience_data: dict) -> list:
-    """Ranks jobs based on TF-IDF cosine similarity between resume and job description, with experience bonus."""
+    """Ranks jobs based on TF-IDF cosine similarity between resume and job description, with experience bonus (scores are set on the jobs in place)."""
     if not jobs:
         return []
     
-    # Enhance job descriptions for better matching
-    enhanced_jobs = []
-    job_descriptions = []
-    
-    for job in jobs:
-        enhanced_job = job.copy()
-        description = job.get('description', '')
-        
-        # If description is too short, enhance it
-        if len(description) < 50:
-            enhanced_desc_parts = [description] if description else []
-            enhanced_desc_parts.extend([
-                f"Job Title: {job.get('title', '')}",
-                f"Company: {job.get('company_name', '')}",
-                f"Location: {job.get('location', '')}",
-            ])
-            if job.get('salary'):
-                enhanced_desc_parts.append(f"Salary: {job.get('salary')}")
-            if job.get('experience'):
-                enhanced_desc_parts.append(f"Experience: {job.get('experience')}")
-            if job.get('job_type'):
-                enhanced_desc_parts.append(f"Job Type: {job.get('job_type')}")
-            
-            enhanced_job['description'] = '. '.join(filter(None, enhanced_desc_parts))
-        
-        enhanced_jobs.append(enhanced_job)
-        job_descriptions.append(enhanced_job['description'])
+    # Short descriptions were padded with the other fields once, at normalization
+    job_descriptions = [job.match_text for job in jobs]
     
     try:
-        # Calculate TF-IDF similarities for all jobs at once
-        similarities = calculate_tfidf_similarity(resume_text, job_descriptions)
+        # Calculate similarities for all jobs at once (TF-IDF, LSA or both per MATCH_SCORER)
+        similarities = calculate_match_similarity(
+            resume_text, job_descriptions, [job.get('job_id') for job in jobs]
+        )
+        
+        # Experience level and skills matching bonuses, one text scan per job
+        bonuses = score_job_bonuses(jobs, experience_data)
         
         # Apply similarity scores and experience bonuses
-        for i, job in enumerate(enhanced_jobs):
+        for i, job in enumerate(jobs):
             # Convert similarity to percentage (0-1 -> 0-100)
             base_score = similarities[i] * 100
-            
-            # Add experience level bonus
-            experience_bonus = get_experience_bonus(job, experience_data)
-            
-            # Add skills matching bonus
-            skills_bonus = get_skills_matching_bonus(job, experience_data)
+            experience_bonus, skills_bonus = bonuses[i]
             
             # Calculate final score with bonuses
             final_score = min(100, max(5, base_score + experience_bonus + skills_bonus))
@@ -883,132 +1120,402 @@ def rank_jobs_by_similarity(resume_text: str, jobs: list, experience_data: dict)
     except Exception as e:
         logger.error(f"Error in TF-IDF similarity calculation: {e}")
         # Fallback scoring with some randomization for variety
-        for i, job in enumerate(enhanced_jobs):
+        bonuses = score_job_bonuses(jobs, experience_data)
+        for i, job in enumerate(jobs):
             base_score = 40 + (i % 30) + np.random.randint(0, 20)  # Scores between 40-90
-            experience_bonus = get_experience_bonus(job, experience_data)
-            skills_bonus = get_skills_matching_bonus(job, experience_data)
+            experience_bonus, skills_bonus = bonuses[i]
             job['match_score'] = round(min(100, base_score + experience_bonus + skills_bonus), 2)
         
     # Sort jobs by score in descending order
-    sorted_jobs = sorted(enhanced_jobs, key=lambda x: x['match_score'], reverse=True)
+    sorted_jobs = sorted(jobs, key=lambda x: x['match_score'], reverse=True)
     return sorted_jobs
 
-def get_skills_matching_bonus(job: dict, experience_data: dict) -> float:
-    """Calculate bonus based on skills matching between resume and job."""
-    user_skills = experience_data.get('skills', [])
+# Experience level bonuses: keywords that suggest the job fits the level
+EXPERIENCE_LEVEL_BONUSES = {
+    'entry': {
+        'keywords': ['entry', 'associate', 'junior', 'graduate', 'fresher', '0-1', '1 year'],
+        'bonus': 15
+    },
+    'junior': {
+        'keywords': ['junior', 'I', '1-3', '2 years', '3 years', 'early career'],
+        'bonus': 10
+    },
+    'mid': {
+        'keywords': ['II', 'mid-level', '3-5', '4 years', '5 years', 'intermediate'],
+        'bonus': 5
+    },
+    'senior': {
+        'keywords': ['senior', 'III', '5+', '6 years', '7 years', '8 years', 'advanced'],
+        'bonus': 0
+    },
+    'lead': {
+        'keywords': ['lead', 'principal', 'senior lead', 'IV', '8+', '10+', 'team lead'],
+        'bonus': 0
+    }
+}
+
+def skills_bonus_from_hits(user_skills: list, hits: set) -> float:
+    """Up to 15 points based on the share of the user's skills found in the job."""
     if not user_skills:
         return 0.0
+    skills_found = sum(1 for skill in user_skills if skill in hits)
+    return skills_found / len(user_skills) * 15  # Max 15 points
+
+def score_job_bonuses(jobs: list, experience_data: dict) -> list:
+    """
+    (experience_bonus, skills_bonus) for every job, scanning each job's text once
+    with one matcher for the user's skills and the level keywords together.
+    """
+    user_skills = experience_data.get('skills', [])
+    experience_level = experience_data.get('experience_level', 'entry')
+    level_config = EXPERIENCE_LEVEL_BONUSES.get(experience_level, EXPERIENCE_LEVEL_BONUSES['entry'])
+    level_keywords = set(level_config['keywords'])
     
-    job_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
+    matcher = get_matcher(list(user_skills) + level_config['keywords'])
+    bonuses = []
+    for hits in matcher.find_all([f"{job.title} {job.match_text}" for job in jobs]):
+        experience_bonus = level_config['bonus'] if hits & level_keywords else 0
+        bonuses.append((experience_bonus, skills_bonus_from_hits(user_skills, hits)))
+    return bonuses
+
+@app.route('/')
+def index():
+    """Serves the main HTML page."""
+    return render_template('index.html')
+
+@app.after_request
+def compress(response):
+    if RESPONSE_COMPRESSION_ENABLED:
+        return compress_response(response, request.headers.get('Accept-Encoding', ''),
+                                 min_size=RESPONSE_COMPRESSION_MIN_BYTES)
+    return response
+
+def json_response(payload, status: int = 200) -> Response:
+    """JSON response serialized with orjson when available (large job lists)."""
+    return Response(dump_json(payload), status=status, mimetype='application/json')
+
+class SearchError(Exception):
+    """A search failure that should be reported to the user with an HTTP status."""
     
-    # Count how many user skills are mentioned in the job
-    skills_found = 0
-    for skill in user_skills:
-        if skill.lower() in job_text:
-            skills_found += 1
+    def __init__(self, message: str, status_code: int = 500):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+def get_uploaded_resume() -> bytes:
+    """Validate the uploaded resume in the current request and return its bytes."""
+    try:
+        files = request.files
+    except RequestEntityTooLarge:
+        # Bodies over MAX_CONTENT_LENGTH are rejected before they are read
+        raise SearchError(f"Resume file is too large (max {RESUME_MAX_UPLOAD_MB:g} MB)", 413)
+
+    if 'resume' not in files:
+        raise SearchError("No resume file provided", 400)
+
+    file = files['resume']
+    if file.filename == '':
+        raise SearchError("No selected file", 400)
+
+    # Check file type
+    if not file.filename.lower().endswith('.pdf'):
+        raise SearchError("Please upload a PDF file", 400)
+
+    return file.read()
+
+def analyze_resume(resume_bytes: bytes, location_filter: str = None) -> tuple:
+    """
+    Parse the resume and extract experience data, using the content-hash cache. Returns (resume_text, experience_data).
+    With a location, scrapes for locally guessed titles start before the Gemini calls.
+    """
+    digest = resume_digest(resume_bytes)
     
-    # Calculate bonus: up to 15 points based on skill match percentage
-    if len(user_skills) > 0:
-        skill_match_ratio = skills_found / len(user_skills)
-        skills_bonus = skill_match_ratio * 15  # Max 15 points
-        return skills_bonus
+    cached = resume_analysis_cache.get(digest)
+    if cached:
+        # Same PDF seen before: skip parsing and all Gemini calls
+        logger.info(f"Resume analysis cache hit for {digest[:12]}")
+        return cached['resume_text'], cached['experience_data']
     
-    return 0.0
-
-def get_experience_bonus(job: dict, experience_data: dict) -> float:
-    """Calculate experience bonus for job matching."""
-    experience_level = experience_data.get('experience_level', 'entry')
-    years_experience = experience_data.get('years_experience', 0)
+    # Parse Resume
+    resume_text = parse_resume(resume_bytes)
+    if not resume_text:
+        raise SearchError("Could not read text from resume PDF. Please ensure the file is not corrupted.", 400)
     
-    job_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
+    if location_filter:
+        start_speculative_scrapes(resume_text, location_filter)
     
-    # Experience level bonuses
-    level_bonuses = {
-        'entry': {
-            'keywords': ['entry', 'associate', 'junior', 'graduate', 'fresher', '0-1', '1 year'],
-            'bonus': 15
-        },
-        'junior': {
-            'keywords': ['junior', 'I', '1-3', '2 years', '3 years', 'early career'],
-            'bonus': 10
-        },
-        'mid': {
-            'keywords': ['II', 'mid-level', '3-5', '4 years', '5 years', 'intermediate'],
-            'bonus': 5
-        },
-        'senior': {
-            'keywords': ['senior', 'III', '5+', '6 years', '7 years', '8 years', 'advanced'],
-            'bonus': 0
-        },
-        'lead': {
-            'keywords': ['lead', 'principal', 'senior lead', 'IV', '8+', '10+', 'team lead'],
-            'bonus': 0
-        }
-    }
+    # Extract experience and skills
+    if RESUME_ANALYZER_MODE == "local":
+        experience_data = analyze_resume_locally(resume_text)
+        experience_data['analysis_source'] = 'local'
+    elif RESUME_ANALYZER_MODE == "local_first":
+        experience_data = local_fallback_profile(resume_text)
+        resume_refine_executor.submit(refine_resume_analysis, digest, resume_text)
+    else:
+        experience_data = extract_experience_and_skills(resume_text)
+    logger.info(f"Extracted experience data: {experience_data}")
+    # logger.info(f"Extracted resume text: {resume_text}")
     
-    level_config = level_bonuses.get(experience_level, level_bonuses['entry'])
+    if not experience_data.get('job_titles'):
+        raise SearchError("Could not extract experience information from resume. Please try again.", 500)
     
-    # Check if job contains experience-appropriate keywords
-    for keyword in level_config['keywords']:
-        if keyword.lower() in job_text:
-            return level_config['bonus']
+    if is_cacheable_analysis(experience_data):
+        resume_analysis_cache.put(digest, resume_text, experience_data)
+    return resume_text, experience_data
+
+def no_jobs_found_message(experience_data: dict) -> str:
+    experience_level = experience_data.get('experience_level', 'entry')
+    years = experience_data.get('years_experience', 0)
+    return f"No jobs found for {experience_level} level roles ({years} years experience) in your area. Try updating your resume or checking back later."
+
+def enrichment_patch(job: dict) -> dict:
+    """The fields the enrichment stage may change, keyed by job_id."""
+    return {
+        'job_id': job.get('job_id'),
+        'career_page': job.get('career_page'),
+        'apply_links': job.get('apply_links', []),
+        'has_direct_apply': job.get('has_direct_apply', False)
+    }
+
+def iter_search_events(resume_bytes: bytes, date_filter: str = "all", location_filter: str = "India", session_id: str = None):
+    """
+    Run the search pipeline incrementally, yielding events as each stage produces output:
+    the extracted profile, ranked job batches per finished source, then enrichment patches.
+    With a session id, discovery ignores the date filter and the full ranked list is kept in
+    the result session (so the filter can change later), saved at the end of discovery and
+    again after enrichment; events still carry only matching jobs.
+    """
+    discovery_date_filter = "all" if session_id else date_filter
+    try:
+        yield {"type": "stage", "stage": "analysis"}
+        resume_text, experience_data = analyze_resume(resume_bytes, location_filter)
+        yield {"type": "profile", "experience_data": experience_data}
+        
+        yield {"type": "stage", "stage": "discovery"}
+        # Re-rank everything found so far on each batch, so scores stay comparable across batches
+        all_jobs = []
+        for source, batch in iter_discovered_job_batches(experience_data, discovery_date_filter, location_filter, resume_text):
+            known_ids = {job.get('job_id') for job in all_jobs}
+            all_jobs = rank_jobs_by_similarity(resume_text, all_jobs + batch, experience_data)
+            yield {
+                "type": "jobs",
+                "source": source,
+                "jobs": [job for job in all_jobs if job.get('job_id') not in known_ids and is_recent_job(job, date_filter)],
+                "scores": {job.get('job_id'): job['match_score'] for job in all_jobs if job.get('job_id') in known_ids}
+            }
+        # Stored once per stage, not per batch: each save rewrites the whole ranked list
+        if session_id:
+            result_session_store.save(session_id, all_jobs)
+        
+        if not any(is_recent_job(job, date_filter) for job in all_jobs):
+            yield {"type": "error", "error": no_jobs_found_message(experience_data), "status": 404}
+            return
+        
+        # Enrich the best matches first and patch them as each company resolves
+        yield {"type": "stage", "stage": "enrichment"}
+        enriched = False
+        for company_jobs, result in enrichment_stage.iter_results(all_jobs):
+            for job in company_jobs:
+                apply_enrichment(job, result)
+            if result:
+                enriched = True
+                yield {"type": "enrichment", "patches": [enrichment_patch(job) for job in company_jobs]}
+        if session_id and enriched:
+            result_session_store.save(session_id, all_jobs)
+        
+        yield {"type": "done", "total": sum(1 for job in all_jobs if is_recent_job(job, date_filter))}
     
-    return 0
+    except SearchError as e:
+        yield {"type": "error", "error": e.message, "status": e.status_code}
+    except Exception as e:
+        logger.error(f"Unexpected error in search pipeline: {e}")
+        yield {"type": "error", "error": "An unexpected error occurred. Please try again.", "status": 500}
 
-@app.route('/')
-def index():
-    """Serves the main HTML page."""
-    return render_template('index.html')
+def posted_dates(session: dict) -> list:
+    """Parsed posted_at of each session job (None if unknown), computed once per decoded session."""
+    dates = session.get('posted_dates')
+    if dates is None:
+        dates = [parse_posted_date(job.get('posted_at', '')) for job in session['jobs']]
+        session['posted_dates'] = dates
+    return dates
+
+def query_result_session(session: dict, date_filter: str = "all", sources: list = None, min_score: float = None,
+                         sort: str = "score", page: int = 1, page_size: int = RESULTS_PAGE_SIZE,
+                         full: bool = False) -> dict:
+    """
+    One page of a session's jobs (card fields only, see compact_job, unless full) after the
+    date / source / score filters, in the requested order, plus stats over every matching job.
+    """
+    cutoff = get_cutoff_date(date_filter) if date_filter != "all" else None
+    wanted_sources = set(sources or [])
+    rows = []
+    for job, posted in zip(session['jobs'], posted_dates(session)):
+        if cutoff is not None and posted is not None and posted < cutoff:
+            continue
+        if min_score is not None and job.get('match_score', 0) < min_score:
+            continue
+        rows.append((job, posted))
+    
+    # Source counts are taken before the source filter so the options stay visible
+    source_counts = Counter(job.get('source', 'Unknown') for job, _ in rows)
+    if wanted_sources:
+        rows = [(job, posted) for job, posted in rows if job.get('source', 'Unknown') in wanted_sources]
+    
+    if sort == "date":
+        # Newest first, undated postings last (stable, so ties keep the score order)
+        rows.sort(key=lambda row: row[1] or datetime.min, reverse=True)
+    elif sort == "company":
+        rows.sort(key=lambda row: (row[0].get('company_name') or '').lower())
+    elif sort == "title":
+        rows.sort(key=lambda row: (row[0].get('title') or '').lower())
+    
+    jobs = [job for job, _ in rows]
+    total = len(jobs)
+    total_pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * page_size
+    return {
+        "session_id": session['session_id'],
+        "page": page,
+        "page_size": page_size,
+        "total": total,
+        "total_pages": total_pages,
+        "jobs": [job if full else compact_job(job) for job in jobs[start:start + page_size]],
+        "stats": {
+            "total": total,
+            "direct_apply": sum(1 for job in jobs if job.get('has_direct_apply')),
+            "avg_score": round(sum(job.get('match_score', 0) for job in jobs) / total) if total else 0,
+            "sources": dict(source_counts)
+        }
+    }
 
 @app.route('/find-jobs', methods=['POST'])
 def find_jobs():
     """The main endpoint to process the resume and find matching jobs."""
     try:
-        if 'resume' not in request.files:
-            return jsonify({"error": "No resume file provided"}), 400
-
-        file = request.files['resume']
-        if file.filename == '':
-            return jsonify({"error": "No selected file"}), 400
-
-        # Check file type
-        if not file.filename.lower().endswith('.pdf'):
-            return jsonify({"error": "Please upload a PDF file"}), 400
+        resume_bytes = get_uploaded_resume()
 
         # Get filters from request
         date_filter = request.form.get('date_filter', 'all')
         location_filter = request.form.get('location_filter', 'India')
 
-        # Parse Resume
-        resume_text = parse_resume(file.stream)
-        if not resume_text:
-            return jsonify({"error": "Could not read text from resume PDF. Please ensure the file is not corrupted."}), 400
-        
-        # Extract experience and skills
-        experience_data = extract_experience_and_skills(resume_text)
-        logger.info(f"Extracted experience data: {experience_data}")
-        # logger.info(f"Extracted resume text: {resume_text}")
-        
-        if not experience_data.get('job_titles'):
-            return jsonify({"error": "Could not extract experience information from resume. Please try again."}), 500
-            
-        # Discover Jobs with experience-based filtering
-        discovered_jobs = discover_jobs_enhanced(experience_data, date_filter, location_filter)
-        if not discovered_jobs:
-            experience_level = experience_data.get('experience_level', 'entry')
-            years = experience_data.get('years_experience', 0)
-            return jsonify({"error": f"No jobs found for {experience_level} level roles ({years} years experience) in your area. Try updating your resume or checking back later."}), 404
+        resume_text, experience_data = analyze_resume(resume_bytes, location_filter)
             
+        # Discover Jobs with experience-based filtering (every date, so the filter can change per page request)
+        discovered_jobs = discover_jobs_enhanced(experience_data, "all", location_filter, resume_text)
+        if not any(is_recent_job(job, date_filter) for job in discovered_jobs):
+            return jsonify({"error": no_jobs_found_message(experience_data)}), 404
+        
         # Rank Jobs by Similarity with experience bonus
         ranked_jobs = rank_jobs_by_similarity(resume_text, discovered_jobs, experience_data)
+        
+        # Enhance the best matches with apply links (separate, time-boxed stage)
+        ranked_jobs = enrich_jobs_with_apply_links(ranked_jobs)
 
-        # Return the final sorted list to the frontend
-        return jsonify(ranked_jobs)
+        # Keep the ranked list server-side and return its first page
+        context = {"date_filter": date_filter, "location_filter": location_filter, "experience_data": experience_data}
+        session_id = result_session_store.create(context)
+        result_session_store.save(session_id, ranked_jobs)
+        session = {"session_id": session_id, "context": context, "jobs": ranked_jobs}
+        return json_response(query_result_session(session, date_filter))
 
+    except SearchError as e:
+        return jsonify({"error": e.message}), e.status_code
     except Exception as e:
         logger.error(f"Unexpected error in find_jobs: {e}")
         return jsonify({"error": "An unexpected error occurred. Please try again."}), 500
 
+@app.route('/find-jobs/stream', methods=['POST'])
+def find_jobs_stream():
+    """Streaming variant of /find-jobs: newline-delimited JSON events as each stage finishes."""
+    try:
+        resume_bytes = get_uploaded_resume()
+    except SearchError as e:
+        return jsonify({"error": e.message}), e.status_code
+
+    date_filter = request.form.get('date_filter', 'all')
+    location_filter = request.form.get('location_filter', 'India')
+
+    session_id = result_session_store.create({"date_filter": date_filter, "location_filter": location_filter})
+
+    def generate():
+        # Job batches are streamed as compact cards; once "done" arrives the client pages through /results/<session_id>
+        yield dump_json({"type": "session", "session_id": session_id}) + b"\n"
+        for event in iter_search_events(resume_bytes, date_filter, location_filter, session_id):
+            if event.get("type") == "jobs":
+                event = dict(event, jobs=[compact_job(job) for job in event["jobs"]])
+            yield dump_json(event) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/searches', methods=['POST'])
+def submit_search():
+    """Queue a search on the background executor and return its id immediately."""
+    try:
+        resume_bytes = get_uploaded_resume()
+    except SearchError as e:
+        return jsonify({"error": e.message}), e.status_code
+
+    date_filter = request.form.get('date_filter', 'all')
+    location_filter = request.form.get('location_filter', 'India')
+
+    try:
+        search_id = search_job_manager.submit(iter_search_events, resume_bytes, date_filter, location_filter)
+    except SearchQueueFull as e:
+        return jsonify({"error": str(e)}), 503
+
+    return jsonify({"search_id": search_id, "status_url": f"/searches/{search_id}"}), 202
+
+@app.route('/searches/<search_id>', methods=['GET'])
+def get_search(search_id):
+    """Status, per-stage progress and (partial) results of a queued search."""
+    record = search_job_manager.get(search_id)
+    if record is None:
+        return jsonify({"error": "Search not found or expired"}), 404
+    return jsonify(record)
+
+@app.route('/results/<session_id>', methods=['GET'])
+def get_results(session_id):
+    """
+    A page of a search session's ranked jobs. Query parameters: page, page_size,
+    date_filter, source (repeatable), min_score, sort (score, date, company, title) and
+    full=true for full job records instead of cards (used when saving jobs).
+    """
+    session = result_session_store.load(session_id)
+    if session is None:
+        return jsonify({"error": "Results not found or expired, please search again"}), 404
+
+    args = request.args
+    sort = args.get('sort', 'score')
+    if sort not in RESULT_SORTS:
+        return jsonify({"error": f"sort must be one of {', '.join(RESULT_SORTS)}"}), 400
+    try:
+        page = int(args.get('page', 1))
+        page_size = min(max(1, int(args.get('page_size', RESULTS_PAGE_SIZE))), RESULTS_MAX_PAGE_SIZE)
+        min_score = float(args['min_score']) if args.get('min_score') else None
+    except ValueError:
+        return jsonify({"error": "page, page_size and min_score must be numbers"}), 400
+
+    return json_response(query_result_session(
+        session,
+        date_filter=args.get('date_filter', session['context'].get('date_filter', 'all')),
+        sources=args.getlist('source'),
+        min_score=min_score,
+        sort=sort,
+        page=page,
+        page_size=page_size,
+        full=args.get('full', 'false').lower() == 'true'
+    ))
+
+@app.route('/results/<session_id>/jobs/<job_id>', methods=['GET'])
+def get_job(session_id, job_id):
+    """Full record of a job in a live result session (the lists only carry card fields)."""
+    job = result_session_store.load_job(session_id, job_id)
+    if job is None:
+        return jsonify({"error": "Job not found or expired"}), 404
+    return json_response(job)
+
 # Server-side job saving routes removed - now using localStorage
 # These routes are no longer needed as we're using browser localStorage
 
@@ -0,0 +1,207 @@
+import asyncio
+import threading
+from urllib.parse import urljoin
+import logging
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, only needed for SCRAPER_BACKEND=async
+    aiohttp = None
+
+from career_cache import LookupUnavailable
+from job_scraper_alternatives import (
+    DEFAULT_HEADERS,
+    JSEARCH_URL,
+    CAREER_PAGE_PATTERNS,
+    naukri_search_url,
+    indeed_search_params,
+    linkedin_search_params,
+    jsearch_request,
+    parse_naukri_jobs,
+    parse_indeed_jobs,
+    parse_linkedin_jobs,
+    parse_jsearch_jobs,
+    parse_apply_links
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobScraperAlternatives:
+    """
+    asyncio-native counterpart of JobScraperAlternatives.
+
+    All requests share one aiohttp session: a pooled connector with a global
+    and per-host connection cap, HTTP keep-alive and gzip/deflate responses.
+    """
+
+    def __init__(self, max_connections: int = 100, max_per_host: int = 8, timeout: float = 10):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async scraper backend")
+        self.headers = dict(DEFAULT_HEADERS)
+        self.headers['Accept-Encoding'] = 'gzip, deflate'
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.session = None
+
+    async def _get_session(self):
+        # The session must be created inside the running event loop
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def _fetch(self, url: str, params: dict = None, headers: dict = None):
+        """GET a URL and return (status, body bytes)"""
+        session = await self._get_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            return response.status, await response.read()
+
+    async def scrape_naukri_direct(self, job_title: str, location: str = "India", max_jobs: int = 20) -> list:
+        """Direct Naukri scraping without API"""
+        try:
+            status, body = await self._fetch(naukri_search_url(job_title, location))
+            if status != 200:
+                return []
+            return parse_naukri_jobs(body, location, max_jobs)
+        except Exception as e:
+            logger.error(f"Error scraping Naukri: {e}")
+            return []
+
+    async def scrape_indeed_direct(self, job_title: str, location: str = "India", max_jobs: int = 20) -> list:
+        """Direct Indeed scraping without API"""
+        try:
+            status, body = await self._fetch("https://in.indeed.com/jobs", params=indeed_search_params(job_title, location))
+            if status != 200:
+                return []
+            return parse_indeed_jobs(body, location, max_jobs)
+        except Exception as e:
+            logger.error(f"Error scraping Indeed: {e}")
+            return []
+
+    async def scrape_linkedin_jobs_direct(self, job_title: str, location: str = "India", max_jobs: int = 15) -> list:
+        """Direct LinkedIn Jobs scraping (limited due to anti-bot measures)"""
+        try:
+            status, body = await self._fetch("https://www.linkedin.com/jobs/search", params=linkedin_search_params(job_title, location))
+            if status != 200:
+                return []
+            return parse_linkedin_jobs(body, location, max_jobs)
+        except Exception as e:
+            logger.error(f"Error scraping LinkedIn: {e}")
+            return []
+
+    async def use_jsearch_api(self, job_title: str, location: str = "India", rapidapi_key: str = None) -> list:
+        """Use JSearch API via RapidAPI (2500 free requests/month)"""
+        if not rapidapi_key:
+            return []
+
+        try:
+            headers, params = jsearch_request(job_title, location, rapidapi_key)
+            session = await self._get_session()
+            async with session.get(JSEARCH_URL, params=params, headers=headers) as response:
+                if response.status != 200:
+                    return []
+                data = await response.json(content_type=None)
+            return parse_jsearch_jobs(data, location)
+        except Exception as e:
+            logger.error(f"Error using JSearch API: {e}")
+            return []
+
+    async def find_career_page(self, base_url: str) -> str:
+        """Probe all common career page paths at once; the first pattern (in order) that answers 200 wins"""
+        async def probe(pattern):
+            career_url = urljoin(base_url, pattern)
+            try:
+                status, _ = await self._fetch(career_url)
+                return career_url if status == 200 else None
+            except Exception as e:
+                return e
+
+        results = await asyncio.gather(*(probe(pattern) for pattern in CAREER_PAGE_PATTERNS))
+        if all(isinstance(result, Exception) for result in results):
+            raise LookupUnavailable(f"{base_url} did not answer any career page probe")
+        return next((url for url in results if isinstance(url, str)), None)
+
+    async def extract_apply_links_from_career_page(self, career_url: str) -> list:
+        """Fetch a career page and extract its apply links"""
+        try:
+            status, body = await self._fetch(career_url)
+            if status != 200:
+                return []
+            return parse_apply_links(body, career_url)
+        except Exception as e:
+            logger.error(f"Error extracting apply links from {career_url}: {e}")
+            return []
+
+    async def scrape_all_sources(self, job_title: str, location: str = "India", rapidapi_key: str = None) -> list:
+        """Scrape jobs from all available sources concurrently"""
+        logger.info(f"Scraping all sources for '{job_title}' in {location}")
+        results = await asyncio.gather(
+            self.scrape_naukri_direct(job_title, location),
+            self.scrape_indeed_direct(job_title, location),
+            self.scrape_linkedin_jobs_direct(job_title, location),
+            self.use_jsearch_api(job_title, location, rapidapi_key)
+        )
+
+        all_jobs = []
+        for jobs in results:
+            all_jobs.extend(jobs)
+        return all_jobs
+
+
+class SyncJobScraperWrapper:
+    """
+    Blocking facade over AsyncJobScraperAlternatives for the Flask routes.
+
+    Coroutines run on one background event loop, so every request thread
+    shares the same connection pool instead of holding a socket per thread.
+    """
+
+    def __init__(self, scraper: AsyncJobScraperAlternatives = None, timeout: float = 30):
+        self.scraper = scraper or AsyncJobScraperAlternatives()
+        self.timeout = timeout
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="async-scraper-loop", daemon=True)
+        self.thread.start()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(self.timeout)
+
+    def scrape_naukri_direct(self, job_title: str, location: str = "India", max_jobs: int = 20) -> list:
+        return self._run(self.scraper.scrape_naukri_direct(job_title, location, max_jobs))
+
+    def scrape_indeed_direct(self, job_title: str, location: str = "India", max_jobs: int = 20) -> list:
+        return self._run(self.scraper.scrape_indeed_direct(job_title, location, max_jobs))
+
+    def scrape_linkedin_jobs_direct(self, job_title: str, location: str = "India", max_jobs: int = 15) -> list:
+        return self._run(self.scraper.scrape_linkedin_jobs_direct(job_title, location, max_jobs))
+
+    def use_jsearch_api(self, job_title: str, location: str = "India", rapidapi_key: str = None) -> list:
+        return self._run(self.scraper.use_jsearch_api(job_title, location, rapidapi_key))
+
+    def find_career_page(self, base_url: str) -> str:
+        return self._run(self.scraper.find_career_page(base_url))
+
+    def extract_apply_links_from_career_page(self, career_url: str) -> list:
+        return self._run(self.scraper.extract_apply_links_from_career_page(career_url))
+
+    def scrape_all_sources(self, job_title: str, location: str = "India", rapidapi_key: str = None) -> list:
+        return self._run(self.scraper.scrape_all_sources(job_title, location, rapidapi_key))
+
+    def close(self):
+        self._run(self.scraper.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
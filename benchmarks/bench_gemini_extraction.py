@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark the chained (3 requests) vs single-call Gemini resume extraction modes.
+
+Runs offline against a stubbed model that simulates per-request and per-token
+latency and counts tokens (approx. 4 characters per token), over the sample
+resumes in benchmarks/fixtures/resumes.
+
+    python benchmarks/bench_gemini_extraction.py [--base-latency 0.6] [--per-output-token 0.004]
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Measure the extraction modes, not the shared Gemini pacing
+os.environ.setdefault("GEMINI_LIMITER_PATH", os.path.join(tempfile.mkdtemp(), "gemini_limiter.db"))
+os.environ.setdefault("GEMINI_RATE_PER_MINUTE", "1000000")
+os.environ.setdefault("GEMINI_BURST", "1000")
+
+import app  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'resumes')
+
+KNOWN_SKILLS = [
+    'Python', 'Flask', 'Django', 'SQL', 'PostgreSQL', 'JavaScript', 'TypeScript', 'React', 'Redux',
+    'Angular', 'Node.js', 'Java', 'Spring Boot', 'Kafka', 'Redis', 'Docker', 'Kubernetes', 'AWS',
+    'GraphQL', 'MongoDB', 'Spark', 'Airflow', 'Scala', 'Hadoop', 'BigQuery', 'GCP', 'Terraform'
+]
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubGeminiModel:
+    """Offline stand-in for genai.GenerativeModel with simulated latency and token accounting"""
+
+    def __init__(self, base_latency: float, per_input_token: float, per_output_token: float):
+        self.base_latency = base_latency
+        self.per_input_token = per_input_token
+        self.per_output_token = per_output_token
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def _answer(self, prompt: str) -> str:
+        skills = [skill for skill in KNOWN_SKILLS if skill.lower() in prompt.lower()][:12]
+        titles = [f"{skill} Developer" for skill in skills[:6]] + ["Software Engineer", "Backend Engineer"]
+        variants = [f"{title} II" for title in titles] + titles[:4]
+
+        if '"base_job_titles"' in prompt:
+            return json.dumps({
+                "experience_level": "mid",
+                "years_experience": 4,
+                "skills": skills,
+                "base_job_titles": titles,
+                "job_titles": variants
+            })
+        if 'Take the following job titles' in prompt:
+            return json.dumps(variants)
+        if 'Based on the following technical skills' in prompt:
+            return json.dumps(titles)
+        return json.dumps({"experience_level": "mid", "years_experience": 4, "skills": skills})
+
+    def generate_content(self, prompt: str) -> StubResponse:
+        answer = self._answer(prompt)
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(answer)
+
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+        # Event.wait rather than time.sleep so stubbing time.sleep elsewhere can't skip the simulated latency
+        threading.Event().wait(self.base_latency + input_tokens * self.per_input_token + output_tokens * self.per_output_token)
+        return StubResponse(f"```json\n{answer}\n```")
+
+
+def run_mode(mode: str, resumes: list, args) -> dict:
+    model = StubGeminiModel(args.base_latency, args.per_input_token, args.per_output_token)
+    app.genai.GenerativeModel = lambda name: model
+
+    latencies = []
+    for resume_text in resumes:
+        start = time.perf_counter()
+        profile = app.extract_experience_and_skills(resume_text, mode=mode)
+        latencies.append(time.perf_counter() - start)
+        assert profile.get('job_titles'), f"{mode} mode produced no job titles"
+
+    cost = (model.input_tokens * args.input_price + model.output_tokens * args.output_price) / 1_000_000
+    return {
+        'mode': mode,
+        'resumes': len(resumes),
+        'mean_latency_s': sum(latencies) / len(latencies),
+        'max_latency_s': max(latencies),
+        'calls': model.calls,
+        'input_tokens': model.input_tokens,
+        'output_tokens': model.output_tokens,
+        'cost_usd': cost
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-latency', type=float, default=0.6, help='Simulated fixed latency per request (s)')
+    parser.add_argument('--per-input-token', type=float, default=0.00002, help='Simulated latency per prompt token (s)')
+    parser.add_argument('--per-output-token', type=float, default=0.004, help='Simulated latency per output token (s)')
+    parser.add_argument('--input-price', type=float, default=0.075, help='USD per 1M input tokens')
+    parser.add_argument('--output-price', type=float, default=0.30, help='USD per 1M output tokens')
+    args = parser.parse_args()
+
+    resumes = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.txt'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            resumes.append(f.read())
+
+    print(f"{'mode':<10}{'mean s':>10}{'max s':>10}{'calls':>8}{'in tok':>10}{'out tok':>10}{'cost $':>12}")
+    for mode in ('chained', 'single'):
+        r = run_mode(mode, resumes, args)
+        print(f"{r['mode']:<10}{r['mean_latency_s']:>10.2f}{r['max_latency_s']:>10.2f}{r['calls']:>8}"
+              f"{r['input_tokens']:>10}{r['output_tokens']:>10}{r['cost_usd']:>12.6f}")
+
+
+if __name__ == '__main__':
+    main()
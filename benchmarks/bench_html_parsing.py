@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark job-board and career-page HTML parsing (html_parsing).
+
+Parses the saved pages in benchmarks/fixtures/html three ways: a full
+html.parser BeautifulSoup tree searched with find_all (the previous approach),
+BeautifulSoup restricted to the job cards / anchors with a SoupStrainer, and
+lxml with the precompiled XPath selectors. Each approach's output is checked
+against the full-tree result.
+
+    python benchmarks/bench_html_parsing.py [--repeat 50]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from html_parsing import SOURCE_SELECTORS, parse_cards, iter_anchors, soup_select, lxml_html  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'html')
+
+
+def full_tree_cards(html, source: str, max_cards: int) -> list:
+    spec = SOURCE_SELECTORS[source]
+    soup = BeautifulSoup(html, 'html.parser')
+    cards = []
+    for card in soup.find_all(spec['card'][0], class_=spec['card'][1])[:max_cards]:
+        values = {}
+        for field, selector in spec['fields'].items():
+            element = soup_select(card, selector)
+            if element is None:
+                continue
+            values[field] = element.text.strip()
+            if field in spec.get('links', ()):
+                values[f'{field}_href'] = element.get('href', '')
+        cards.append(values)
+    return cards
+
+
+def full_tree_anchors(html) -> list:
+    soup = BeautifulSoup(html, 'html.parser')
+    return [(anchor.get_text(), anchor.get('href', '')) for anchor in soup.find_all('a', href=True)]
+
+
+def time_ms(func, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50, help='Parses per fixture and approach')
+    parser.add_argument('--max-cards', type=int, default=20)
+    args = parser.parse_args()
+
+    pages = {source: f'{source}.html' for source in SOURCE_SELECTORS}
+    pages['career_page'] = 'career_page.html'
+
+    for name, filename in pages.items():
+        with open(os.path.join(FIXTURES_DIR, filename), 'rb') as f:
+            html = f.read()
+
+        if name in SOURCE_SELECTORS:
+            approaches = {
+                'full tree': lambda: full_tree_cards(html, name, args.max_cards),
+                'strainer': lambda: parse_cards(html, name, args.max_cards, backend='soup'),
+            }
+            if lxml_html is not None:
+                approaches['lxml'] = lambda: parse_cards(html, name, args.max_cards, backend='lxml')
+        else:
+            approaches = {
+                'full tree': lambda: full_tree_anchors(html),
+                'strainer': lambda: list(iter_anchors(html, backend='soup')),
+            }
+            if lxml_html is not None:
+                approaches['lxml'] = lambda: list(iter_anchors(html, backend='lxml'))
+
+        results = {label: time_ms(func, args.repeat) for label, func in approaches.items()}
+        baseline_ms, baseline = results['full tree']
+        print(f"{name:>12} ({len(html) / 1024:.0f} KB, {len(baseline)} items)")
+        for label, (milliseconds, result) in results.items():
+            status = 'same output' if result == baseline else 'OUTPUT DIFFERS'
+            print(f"{'':>12} {label:>10}: {milliseconds:7.2f} ms  x{baseline_ms / milliseconds:5.1f}  {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark Job records against plain dicts for the scrape -> request path.
+
+Synthetic postings (half with a short description, like card-only scrapes)
+are normalized once, as the scrapers do, then each simulated request takes
+its own filtered copies and builds the ranking texts. Memory is measured with
+tracemalloc for the cached records and for one request's copies, in both
+representations.
+
+    python benchmarks/bench_job_records.py [--jobs 5000] [--requests 20]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_record import normalize_job  # noqa: E402
+
+WORDS = ('python java react django spring kafka aws docker sql backend frontend '
+         'services build scale team design testing cloud api').split()
+LOCATIONS = ('Bengaluru, Karnataka', 'Pune, Maharashtra', 'Hyderabad, Telangana', 'Chennai, Tamil Nadu')
+SOURCES = ('Naukri', 'Indeed', 'LinkedIn')
+
+
+def raw_postings(count: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    return [{
+        'title': f"{rng.choice(['Senior ', '', 'Lead '])}{rng.choice(['Python', 'Java', 'React'])} Developer {i}",
+        'company_name': f"Company {i % 400}",
+        'location': rng.choice(LOCATIONS),
+        'experience': rng.choice(['0-2 Yrs', '3-5 Yrs', '5-8 Yrs']),
+        'salary': '',
+        'apply_url': f"https://example.com/jobs/{i}",
+        'source': rng.choice(SOURCES),
+        'description': ' '.join(rng.choice(WORDS) for _ in range(rng.choice([6, 150]))),
+        'posted_at': '',
+        'job_type': '',
+    } for i in range(count)]
+
+
+def measure(build) -> tuple:
+    """(result, bytes still allocated after build())"""
+    tracemalloc.start()
+    try:
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=5000, help='Cached postings')
+    parser.add_argument('--requests', type=int, default=20, help='Simulated requests over the cache')
+    args = parser.parse_args()
+
+    raws = raw_postings(args.jobs)
+
+    start = time.perf_counter()
+    jobs = [normalize_job(raw) for raw in raws]
+    normalize_ms = (time.perf_counter() - start) * 1000
+
+    dicts, dict_bytes = measure(lambda: [normalize_job(raw).to_dict() for raw in raws])
+    _, job_bytes = measure(lambda: [normalize_job(raw) for raw in raws])
+    dict_copies, dict_copy_bytes = measure(lambda: [dict(job) for job in dicts])
+    job_copies, job_copy_bytes = measure(lambda: [job.copy() for job in jobs])
+    del dict_copies, job_copies
+
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        texts = [job.match_text for job in (job.copy() for job in jobs)]
+    request_ms = (time.perf_counter() - start) * 1000 / args.requests
+
+    count = args.jobs
+    print(f"normalize   {normalize_ms:8.1f} ms for {count} postings ({normalize_ms * 1000 / count:.1f} us each)")
+    print(f"request     {request_ms:8.1f} ms per request (copies + {len(texts)} ranking texts)")
+    print(f"{'':12}{'dict':>10}{'Job':>10}   bytes per record")
+    print(f"{'cached':<12}{dict_bytes / count:>10.0f}{job_bytes / count:>10.0f}   (Job includes its derived keys and text)")
+    print(f"{'per request':<12}{dict_copy_bytes / count:>10.0f}{job_copy_bytes / count:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark BM25 candidate retrieval (job_retrieval.BM25Index) over large job pools.
+
+Builds a synthetic, role-structured job corpus (each role has its own skill
+vocabulary on top of shared filler words) at each pool size, then measures
+index build time and per-query latency of MaxScore-pruned top-k retrieval
+against exhaustive BM25 scoring, with resume-like queries (capped to their
+most discriminative terms, and uncapped as 'full query'). Pruned results are
+checked against the exhaustive top-k.
+
+    python benchmarks/bench_job_retrieval.py [--sizes 10000,100000,1000000] [--k 300] [--queries 50]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_retrieval import BM25Index  # noqa: E402
+
+NUM_ROLES = 60
+SKILLS_PER_ROLE = 80
+FILLER_WORDS = 4000
+
+
+def make_vocabulary(rng: random.Random) -> tuple:
+    role_skills = [[f"skill{role}x{i}" for i in range(SKILLS_PER_ROLE)] for role in range(NUM_ROLES)]
+    filler = [f"word{i}" for i in range(FILLER_WORDS)]
+    filler_weights = [1 / (i + 1) for i in range(FILLER_WORDS)]
+    return role_skills, filler, filler_weights
+
+
+def make_document(rng: random.Random, vocabulary: tuple, skill_count: int, filler_count: int) -> str:
+    role_skills, filler, filler_weights = vocabulary
+    role = rng.randrange(NUM_ROLES)
+    # Most skills come from the role, a few from a neighbouring role
+    skills = rng.choices(role_skills[role], k=skill_count - 2)
+    skills += rng.choices(role_skills[(role + 1) % NUM_ROLES], k=2)
+    return ' '.join(skills + rng.choices(filler, filler_weights, k=filler_count))
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_size(size: int, k: int, query_count: int, seed: int):
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+
+    started = time.perf_counter()
+    index = BM25Index().build(make_document(rng, vocabulary, 12, 28) for _ in range(size))
+    build_seconds = time.perf_counter() - started
+
+    queries = [make_document(rng, vocabulary, 40, 160) for _ in range(query_count)]
+    modes = {
+        'maxscore': {'prune': True},
+        'exhaustive': {'prune': False},
+        'full query': {'prune': False, 'max_query_terms': None}
+    }
+    timings = {label: [] for label in modes}
+    mismatches = 0
+
+    for query in queries:
+        results = {}
+        for label, options in modes.items():
+            started = time.perf_counter()
+            results[label] = index.search(query, k, **options)
+            timings[label].append((time.perf_counter() - started) * 1000)
+        # Ties may order differently; compare the score lists
+        pruned_scores = [round(score, 4) for _, score in results['maxscore']]
+        exhaustive_scores = [round(score, 4) for _, score in results['exhaustive']]
+        if pruned_scores != exhaustive_scores:
+            mismatches += 1
+
+    postings = len(index.doc_ids)
+    print(f"{size:>9,} jobs | build {build_seconds:6.1f}s | {postings:>11,} postings")
+    for label, values in timings.items():
+        print(f"{'':>9} {label:>10}: p50 {statistics.median(values):7.2f} ms | "
+              f"p95 {percentile(values, 0.95):7.2f} ms | max {max(values):7.2f} ms")
+    print(f"{'':>9} top-{k} mismatches vs exhaustive: {mismatches}/{query_count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='Comma-separated pool sizes')
+    parser.add_argument('--k', type=int, default=300, help='Candidates to retrieve')
+    parser.add_argument('--queries', type=int, default=50, help='Queries per pool size')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    for size in [int(value) for value in args.sizes.split(',') if value.strip()]:
+        bench_size(size, args.k, args.queries, args.seed)
+
+
+if __name__ == '__main__':
+    main()
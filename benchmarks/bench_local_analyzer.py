@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local (no-LLM) resume analyzer against reference profiles.
+
+The reference in benchmarks/fixtures/resumes/reference_profiles.json holds
+hand-labelled profiles in the shape the Gemini extraction returns, dated so
+"Present" resolves the same way on every run. The resumes mix month-name,
+numeric and year-only date ranges, including a year right after a company
+name ("Wipro 2020 - 2023") and "from 2018 to 2019". With --live and
+GOOGLE_API_KEY set, the real Gemini extraction is run over the same resumes
+and used as the reference instead (Gemini's years are not pinned to that
+date).
+
+    python benchmarks/bench_local_analyzer.py [--repeat 50] [--live]
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import argparse
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from local_analyzer import analyze_resume_locally  # noqa: E402
+from title_cache import canonical_skill_set  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'resumes')
+
+
+def load_resumes() -> dict:
+    resumes = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.txt'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            resumes[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return resumes
+
+
+def load_reference() -> tuple:
+    with open(os.path.join(FIXTURES_DIR, 'reference_profiles.json'), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    year, month = (int(part) for part in data['as_of'].split('-'))
+    return date(year, month, 15), data['profiles']
+
+
+def live_reference(resumes: dict) -> dict:
+    import app  # Configures Gemini from the environment
+    profiles = {}
+    for name, text in resumes.items():
+        profile = app.extract_experience_and_skills_with_gemini(text)
+        profile['job_titles'] = profile.get('base_job_titles') or profile.get('job_titles', [])
+        profiles[name] = profile
+    return profiles
+
+
+def compare(local: dict, reference: dict) -> dict:
+    local_skills = canonical_skill_set(local['skills'])
+    reference_skills = canonical_skill_set(reference.get('skills', []))
+    matched = local_skills & reference_skills
+    reference_titles = {title.lower() for title in reference.get('job_titles', [])}
+    local_titles = {title.lower() for title in local['base_job_titles'] + local['job_titles']}
+    return {
+        'years_error': abs(float(local['years_experience']) - float(reference.get('years_experience', 0))),
+        'level_match': local['experience_level'] == reference.get('experience_level'),
+        'skill_precision': len(matched) / len(local_skills) if local_skills else 0.0,
+        'skill_recall': len(matched) / len(reference_skills) if reference_skills else 1.0,
+        'title_recall': len(local_titles & reference_titles) / len(reference_titles) if reference_titles else 1.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50, help='Timed runs per resume')
+    parser.add_argument('--live', action='store_true', help='Compare with real Gemini output (needs GOOGLE_API_KEY)')
+    args = parser.parse_args()
+
+    resumes = load_resumes()
+    today, reference = load_reference()
+    if args.live:
+        if not os.getenv('GOOGLE_API_KEY'):
+            parser.error('--live needs GOOGLE_API_KEY')
+        today, reference = None, live_reference(resumes)
+
+    # First call builds the keyword matchers; time the steady state
+    analyze_resume_locally(next(iter(resumes.values())), today)
+
+    print(f"{'resume':<20}{'ms':>8}{'years':>8}{'ref':>6}{'level':>8}{'skill P':>9}{'skill R':>9}{'title R':>9}")
+    rows = []
+    for name, text in resumes.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            local = analyze_resume_locally(text, today)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / args.repeat
+        row = compare(local, reference.get(name, {}))
+        rows.append(row)
+        print(f"{name:<20}{elapsed_ms:>8.2f}{local['years_experience']:>8}{reference.get(name, {}).get('years_experience', '-'):>6}"
+              f"{local['experience_level']:>8}{row['skill_precision']:>9.2f}{row['skill_recall']:>9.2f}{row['title_recall']:>9.2f}")
+
+    count = len(rows)
+    print(f"\nmean years error {sum(r['years_error'] for r in rows) / count:.2f}, "
+          f"level agreement {sum(r['level_match'] for r in rows)}/{count}, "
+          f"skill P/R {sum(r['skill_precision'] for r in rows) / count:.2f}/{sum(r['skill_recall'] for r in rows) / count:.2f}, "
+          f"title recall {sum(r['title_recall'] for r in rows) / count:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark the LSA + random-projection LSH semantic index (semantic_index.py).
+
+Fits the LSA model on a synthetic, role-structured job corpus (see
+bench_job_retrieval.py), then for several LSH configurations reports
+recall@k of the approximate top-k against exact cosine over every job
+embedding, the average number of candidates re-ranked, and queries/sec.
+
+    python benchmarks/bench_semantic_index.py [--size 100000] [--fit-size 20000] [--queries 200]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from semantic_index import LsaModel, SemanticJobIndex, RandomProjectionLsh  # noqa: E402
+from bench_job_retrieval import make_vocabulary, make_document  # noqa: E402
+
+LSH_CONFIGS = [(8, 12), (16, 12), (24, 10), (32, 10)]
+
+
+def bench_config(index, queries, exact_results, n_tables, n_bits, ks):
+    # Reuse the job embeddings; only the LSH tables change per configuration
+    started = time.perf_counter()
+    index.lsh = RandomProjectionLsh(index.vectors.shape[1], n_tables, n_bits).build(index.vectors)
+    build_seconds = time.perf_counter() - started
+
+    recalls = {k: 0.0 for k in ks}
+    candidates = 0
+    started = time.perf_counter()
+    for query, exact in zip(queries, exact_results):
+        approximate = {doc_id for doc_id, _ in index.search(query, max(ks))}
+        for k in ks:
+            truth = {doc_id for doc_id, _ in exact[:k]}
+            recalls[k] += len(truth & approximate) / max(1, len(truth))
+    elapsed = time.perf_counter() - started
+
+    query_vectors = index.model.embed(queries)
+    for vector in query_vectors:
+        candidates += len(index.lsh.candidates(vector))
+
+    recall_text = ' | '.join(f"recall@{k} {recalls[k] / len(queries):.3f}" for k in ks)
+    print(f"  LSH {n_tables:>2} tables x {n_bits:>2} bits | tables {build_seconds:5.1f}s | {recall_text} | "
+          f"~{candidates // len(queries):>6} candidates | {len(queries) / elapsed:8.1f} q/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=100000, help='Jobs in the pool')
+    parser.add_argument('--fit-size', type=int, default=20000, help='Jobs used to fit the LSA model')
+    parser.add_argument('--components', type=int, default=128)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = make_vocabulary(rng)
+    documents = [make_document(rng, vocabulary, 12, 28) for _ in range(args.size)]
+    queries = [make_document(rng, vocabulary, 40, 160) for _ in range(args.queries)]
+    ks = (10, 100)
+
+    started = time.perf_counter()
+    model = LsaModel.fit(documents[:args.fit_size], n_components=args.components, seed=args.seed)
+    print(f"LSA fit on {args.fit_size:,} jobs ({args.components} components): {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    index = SemanticJobIndex(model).build(documents)
+    print(f"Embedded {args.size:,} jobs: {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    exact_results = [index.search(query, max(ks), exact=True) for query in queries]
+    elapsed = time.perf_counter() - started
+    print(f"{args.size:,} jobs | exact cosine: {len(queries) / elapsed:8.1f} q/s")
+
+    for n_tables, n_bits in LSH_CONFIGS:
+        bench_config(index, queries, exact_results, n_tables, n_bits, ks)
+
+
+if __name__ == '__main__':
+    main()
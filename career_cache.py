@@ -0,0 +1,135 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Legal-entity suffixes that should not make "Infosys Ltd" and "Infosys Limited" different companies
+COMPANY_SUFFIXES = {
+    'ltd', 'limited', 'pvt', 'private', 'inc', 'incorporated', 'llc', 'llp',
+    'corp', 'corporation', 'co', 'company', 'plc', 'gmbh', 'pte'
+}
+
+
+class LookupUnavailable(Exception):
+    """A company lookup failed transiently (network error, timeout), as opposed to finding nothing."""
+
+
+def normalize_company_name(company_name: str) -> str:
+    """Normalize a company name for cache lookups: lowercase, no punctuation, no legal suffixes."""
+    words = re.sub(r'[^a-z0-9&+ ]', ' ', (company_name or '').lower()).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+class CareerPageCache:
+    """
+    Persistent SQLite cache: normalized company name -> (base_url, career_url, apply_links, fetched_at).
+
+    Companies without a discoverable career page are cached too (career_url is NULL)
+    with their own, usually shorter, TTL so they stop costing a probe on every request.
+    Lookups that failed transiently are cached as misses for only error_ttl_seconds,
+    so an outage does not hide a company for the whole negative TTL.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, negative_ttl_seconds: float, error_ttl_seconds: float = 300):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.error_ttl_seconds = error_ttl_seconds
+        self.local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS career_pages (
+                    company_key TEXT PRIMARY KEY,
+                    company_name TEXT,
+                    base_url TEXT,
+                    career_url TEXT,
+                    apply_links TEXT,
+                    fetched_at REAL NOT NULL,
+                    ttl_seconds REAL
+                )
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; enrichment lookups run on a thread pool
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def get(self, company_name: str) -> dict:
+        """
+        Return the cached entry for a company, or None on a miss / expired entry.
+
+        A negative entry is returned as a dict with 'result' set to None.
+        """
+        key = normalize_company_name(company_name)
+        if not key:
+            return None
+
+        try:
+            row = self._connection().execute(
+                "SELECT base_url, career_url, apply_links, fetched_at, ttl_seconds FROM career_pages WHERE company_key = ?",
+                (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading career page cache for {company_name}: {e}")
+            return None
+
+        if not row:
+            return None
+
+        base_url, career_url, apply_links, fetched_at, ttl = row
+        if ttl is None:
+            ttl = self.ttl_seconds if career_url else self.negative_ttl_seconds
+        if time.time() - fetched_at > ttl:
+            return None
+
+        result = None
+        if career_url:
+            result = {'career_page': career_url, 'apply_links': json.loads(apply_links or '[]')}
+
+        return {'base_url': base_url, 'result': result, 'fetched_at': fetched_at}
+
+    def put(self, company_name: str, base_url: str = None, career_url: str = None, apply_links: list = None,
+            failed: bool = False):
+        """Store a lookup result. Pass career_url=None to cache a miss, and failed=True if the lookup errored."""
+        key = normalize_company_name(company_name)
+        if not key:
+            return
+
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO career_pages "
+                    "(company_key, company_name, base_url, career_url, apply_links, fetched_at, ttl_seconds) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, company_name, base_url, career_url, json.dumps(apply_links or []), time.time(),
+                     self.error_ttl_seconds if failed else None)
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error writing career page cache for {company_name}: {e}")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        now = time.time()
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM career_pages WHERE fetched_at < ? - COALESCE(ttl_seconds, "
+                "CASE WHEN career_url IS NOT NULL THEN ? ELSE ? END)",
+                (now, self.ttl_seconds, self.negative_ttl_seconds)
+            )
+            return cursor.rowcount
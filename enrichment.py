@@ -0,0 +1,87 @@
+import concurrent.futures
+import logging
+from career_cache import normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+
+def company_key(company_name: str) -> str:
+    """Key used to make sure an employer is only probed once per request"""
+    return normalize_company_name(company_name)
+
+
+class ApplyLinkEnrichmentStage:
+    """
+    Enriches jobs with career page / apply links using a bounded worker pool.
+
+    `lookup` takes a company name and returns a dict with 'career_page' and
+    'apply_links' (or None when nothing was found). Each company is looked up
+    at most once per call, and a call stops after `budget_seconds`, shipping
+    whatever was enriched by then.
+
+    The stage is long-lived and shared by all requests: its pool caps the
+    number of lookups in flight for the whole process, not per request.
+    """
+
+    def __init__(self, lookup, max_jobs: int = 30, max_workers: int = 8, budget_seconds: float = 15):
+        self.lookup = lookup
+        self.max_jobs = max_jobs
+        self.budget_seconds = budget_seconds
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='enrich')
+
+    def _group_by_company(self, jobs: list) -> dict:
+        companies = {}
+        for job in jobs[:self.max_jobs]:
+            key = company_key(job.get('company_name', ''))
+            if key:
+                companies.setdefault(key, []).append(job)
+        return companies
+
+    def iter_results(self, jobs: list):
+        """Yield (jobs_for_company, lookup_result) pairs as each company lookup finishes."""
+        companies = self._group_by_company(jobs)
+        if not companies:
+            return
+
+        futures = {
+            self.executor.submit(self.lookup, company_jobs[0].get('company_name', '')): key
+            for key, company_jobs in companies.items()
+        }
+
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=self.budget_seconds):
+                key = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error enriching jobs for {key}: {e}")
+                    continue
+                yield companies[key], result
+        except concurrent.futures.TimeoutError:
+            pending = sum(1 for future in futures if not future.done())
+            logger.warning(f"Enrichment budget of {self.budget_seconds}s exhausted, "
+                           f"{pending}/{len(futures)} companies left unenriched")
+        finally:
+            # Lookups that have not started yet are dropped; running ones finish and warm the career page cache
+            for future in futures:
+                future.cancel()
+
+    def run(self, jobs: list) -> list:
+        """Enrich jobs in place and return the full list (unenriched jobs are kept as-is)."""
+        for company_jobs, result in self.iter_results(jobs):
+            for job in company_jobs:
+                apply_enrichment(job, result)
+        return jobs
+
+
+def apply_enrichment(job: dict, result: dict) -> dict:
+    """Copy a company lookup result onto a job (None means no career page was found)."""
+    if not result:
+        return job
+    if result.get('apply_links'):
+        job['career_page'] = result.get('career_page')
+        job['apply_links'] = result.get('apply_links')
+        job['has_direct_apply'] = True
+    else:
+        job['has_direct_apply'] = False
+    return job
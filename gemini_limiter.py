@@ -0,0 +1,210 @@
+import os
+import re
+import time
+import uuid
+import sqlite3
+import threading
+import logging
+
+try:
+    from google.api_core.exceptions import TooManyRequests
+except ImportError:  # google-api-core comes with google-generativeai
+    TooManyRequests = None
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiUnavailable(Exception):
+    """The circuit breaker is open, or no request slot was free within the wait limit."""
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """429 / quota-exhausted responses (ResourceExhausted is a TooManyRequests)"""
+    if TooManyRequests is not None and isinstance(error, TooManyRequests):
+        return True
+    message = str(error).lower()
+    return getattr(error, 'code', None) == 429 or '429' in message or 'quota' in message or 'rate limit' in message
+
+
+def retry_delay_seconds(error: Exception) -> float:
+    """Server-suggested retry delay from a quota error message, if any"""
+    match = re.search(r'retry(?:_delay)?[^0-9]{0,20}(\d+(?:\.\d+)?)\s*s', str(error), re.IGNORECASE)
+    return float(match.group(1)) if match else 0.0
+
+
+class GeminiLimiter:
+    """
+    Gemini request limiter shared by every worker process through one SQLite file.
+
+    - Token bucket: at most `rate_per_minute` requests per minute, bursts of `burst`.
+    - In-flight cap: at most `max_in_flight` requests at once (leases expire after
+      `lease_seconds` in case a worker dies mid-request).
+    - 429 / quota errors push a shared "blocked until" time with exponential
+      backoff (or the server's retry delay) and the call is retried.
+    - Circuit breaker: after `failure_threshold` consecutive failures the breaker
+      opens for `open_seconds`; calls then fail fast with GeminiUnavailable so the
+      caller can use a local fallback. The first call after that is a trial.
+    """
+
+    def __init__(self, path: str, rate_per_minute: float = 15, burst: int = 3, max_in_flight: int = 4,
+                 max_wait_seconds: float = 20, failure_threshold: int = 5, open_seconds: float = 60,
+                 base_backoff_seconds: float = 2, max_backoff_seconds: float = 60, max_retries: int = 2,
+                 lease_seconds: float = 120):
+        self.path = path
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.max_wait_seconds = max_wait_seconds
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.max_retries = max_retries
+        self.lease_seconds = lease_seconds
+        self.local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS limiter_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    blocked_until REAL NOT NULL DEFAULT 0,
+                    backoff_level INTEGER NOT NULL DEFAULT 0,
+                    failures INTEGER NOT NULL DEFAULT 0,
+                    open_until REAL NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS limiter_leases (
+                    lease_id TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO limiter_state (id, tokens, updated_at) VALUES (1, ?, ?)",
+                         (float(burst), time.time()))
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; autocommit so BEGIN IMMEDIATE controls the write lock
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def _transaction(self, operation):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = operation(conn)
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _try_acquire(self, conn: sqlite3.Connection, now: float) -> tuple:
+        """One atomic attempt: (lease_id, 0) on success, or (None, seconds to wait)."""
+        tokens, updated_at, blocked_until, open_until = conn.execute(
+            "SELECT tokens, updated_at, blocked_until, open_until FROM limiter_state WHERE id = 1"
+        ).fetchone()
+
+        if open_until > now:
+            raise GeminiUnavailable(f"Gemini circuit breaker is open for another {open_until - now:.0f}s")
+        if blocked_until > now:
+            return None, blocked_until - now
+
+        conn.execute("DELETE FROM limiter_leases WHERE expires_at <= ?", (now,))
+        in_flight = conn.execute("SELECT COUNT(*) FROM limiter_leases").fetchone()[0]
+        if in_flight >= self.max_in_flight:
+            return None, 0.1
+
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+        if tokens < 1:
+            conn.execute("UPDATE limiter_state SET tokens = ?, updated_at = ? WHERE id = 1", (tokens, now))
+            return None, (1 - tokens) / self.rate
+
+        lease_id = uuid.uuid4().hex
+        conn.execute("UPDATE limiter_state SET tokens = ?, updated_at = ? WHERE id = 1", (tokens - 1, now))
+        conn.execute("INSERT INTO limiter_leases (lease_id, expires_at) VALUES (?, ?)", (lease_id, now + self.lease_seconds))
+        return lease_id, 0.0
+
+    def _acquire(self, deadline: float) -> str:
+        while True:
+            now = time.time()
+            lease_id, wait = self._transaction(lambda conn: self._try_acquire(conn, now))
+            if lease_id:
+                return lease_id
+            if now + wait > deadline:
+                raise GeminiUnavailable(f"No Gemini request slot within {self.max_wait_seconds:g}s")
+            time.sleep(wait)
+
+    def _release(self, lease_id: str):
+        try:
+            self._transaction(lambda conn: conn.execute("DELETE FROM limiter_leases WHERE lease_id = ?", (lease_id,)))
+        except sqlite3.Error as e:
+            logger.error(f"Error releasing Gemini lease: {e}")
+
+    def _record_success(self):
+        self._transaction(lambda conn: conn.execute(
+            "UPDATE limiter_state SET failures = 0, backoff_level = 0, open_until = 0 WHERE id = 1"
+        ))
+
+    def _record_failure(self, error: Exception):
+        def update(conn):
+            now = time.time()
+            failures, backoff_level, blocked_until = conn.execute(
+                "SELECT failures, backoff_level, blocked_until FROM limiter_state WHERE id = 1"
+            ).fetchone()
+            failures += 1
+            if is_rate_limit_error(error):
+                backoff = min(self.max_backoff_seconds, self.base_backoff_seconds * (2 ** backoff_level))
+                blocked_until = max(blocked_until, now + max(backoff, retry_delay_seconds(error)))
+                backoff_level += 1
+            open_until = now + self.open_seconds if failures >= self.failure_threshold else 0
+            conn.execute(
+                "UPDATE limiter_state SET failures = ?, backoff_level = ?, blocked_until = ?, open_until = ? WHERE id = 1",
+                (failures, backoff_level, blocked_until, open_until)
+            )
+            return failures, open_until
+        failures, open_until = self._transaction(update)
+        if open_until:
+            logger.warning(f"Gemini circuit breaker opened for {self.open_seconds:g}s after {failures} consecutive failures")
+
+    def is_open(self) -> bool:
+        """True while the circuit breaker is open (calls would fail fast)."""
+        try:
+            open_until = self._connection().execute("SELECT open_until FROM limiter_state WHERE id = 1").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Error reading Gemini limiter state: {e}")
+            return False
+        return open_until > time.time()
+
+    def call(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) as one Gemini request under the shared limits.
+        Rate-limit errors are retried after the shared backoff; raises GeminiUnavailable
+        when the breaker is open or no slot frees up within max_wait_seconds.
+        """
+        deadline = time.time() + self.max_wait_seconds
+        attempt = 0
+        while True:
+            lease_id = self._acquire(deadline)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._record_failure(e)
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning(f"Gemini rate limited, retrying after backoff (attempt {attempt}): {e}")
+                continue
+            finally:
+                self._release(lease_id)
+            self._record_success()
+            return result
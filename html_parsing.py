@@ -0,0 +1,181 @@
+"""
+HTML parsing for job boards and career pages.
+
+Every source's job-card markup is described once in SOURCE_SELECTORS as
+(tag, class[, child tag]) selectors. With lxml installed they are compiled to
+XPath expressions once at import and evaluated on an lxml tree; without it,
+BeautifulSoup falls back to a SoupStrainer so only the job cards (or anchors)
+are ever turned into a tree, not the whole page.
+"""
+
+import logging
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # Optional speed-up; BeautifulSoup + SoupStrainer is used without it
+    etree = lxml_html = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'lxml' if lxml_html is not None else 'soup'
+
+# Per source: the job card, then the fields read from each card. Fields listed
+# in 'links' also return their href as '<field>_href'.
+SOURCE_SELECTORS = {
+    'naukri': {
+        'card': ('div', 'jobTuple'),
+        'fields': {
+            'title': ('a', 'title'),
+            'company': ('a', 'subTitle'),
+            'location': ('span', 'locationsContainer'),
+            'experience': ('span', 'expwdth'),
+            'salary': ('span', 'salary'),
+            'description': ('span', 'job-description'),
+        },
+        'links': ('title',),
+    },
+    'indeed': {
+        'card': ('div', 'job_seen_beacon'),
+        'fields': {
+            'title': ('h2', 'jobTitle'),
+            'title_link': ('h2', 'jobTitle', 'a'),
+            'company': ('span', 'companyName'),
+            'location': ('div', 'companyLocation'),
+            'salary': ('span', 'salary-snippet'),
+            'description': ('div', 'job-snippet'),
+        },
+        'links': ('title_link',),
+    },
+    'linkedin': {
+        'card': ('div', 'base-card'),
+        'fields': {
+            'title': ('h3', 'base-search-card__title'),
+            'company': ('h4', 'base-search-card__subtitle'),
+            'location': ('span', 'job-search-card__location'),
+            'link': ('a', None),
+        },
+        'links': ('link',),
+    },
+}
+
+
+def selector_xpath(selector: tuple, relative: bool = True) -> str:
+    """XPath for a (tag, class[, child tag]) selector, matching class tokens like BeautifulSoup's class_"""
+    tag, css_class = selector[:2]
+    xpath = ('.//' if relative else '//') + tag
+    if css_class:
+        xpath += f"[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+    if len(selector) > 2:
+        xpath += f"//{selector[2]}"
+    return xpath
+
+
+def _compile_selectors():
+    if etree is None:
+        return {}
+    return {
+        source: {
+            'card': etree.XPath(selector_xpath(spec['card'], relative=False)),
+            'fields': {field: etree.XPath(selector_xpath(selector)) for field, selector in spec['fields'].items()},
+        }
+        for source, spec in SOURCE_SELECTORS.items()
+    }
+
+
+COMPILED_SELECTORS = _compile_selectors()
+
+
+def _lxml_tree(html):
+    if not html:
+        return None
+    try:
+        return lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.warning(f"Could not parse HTML with lxml: {e}")
+        return None
+
+
+def _lxml_cards(html, source: str, max_cards: int) -> list:
+    tree = _lxml_tree(html)
+    if tree is None:
+        return []
+    compiled = COMPILED_SELECTORS[source]
+    links = SOURCE_SELECTORS[source].get('links', ())
+    cards = []
+    for card in compiled['card'](tree)[:max_cards]:
+        values = {}
+        for field, xpath in compiled['fields'].items():
+            found = xpath(card)
+            if not found:
+                continue
+            values[field] = found[0].text_content().strip()
+            if field in links:
+                values[f'{field}_href'] = found[0].get('href', '')
+        cards.append(values)
+    return cards
+
+
+def soup_select(card, selector: tuple):
+    element = card.find(selector[0], class_=selector[1]) if selector[1] else card.find(selector[0])
+    if element is not None and len(selector) > 2:
+        element = element.find(selector[2])
+    return element
+
+
+def has_class_token(css_class: str):
+    # SoupStrainer sees the raw class attribute ("jobTuple bgWhite"), not the split list
+    def matches(value):
+        if not value:
+            return False
+        tokens = value.split() if isinstance(value, str) else value
+        return css_class in tokens
+    return matches
+
+
+def _soup_cards(html, source: str, max_cards: int) -> list:
+    spec = SOURCE_SELECTORS[source]
+    card_tag, card_class = spec['card'][:2]
+    strainer = SoupStrainer(card_tag, class_=has_class_token(card_class))
+    soup = BeautifulSoup(html, 'html.parser', parse_only=strainer)
+    links = spec.get('links', ())
+    cards = []
+    for card in soup.find_all(card_tag, class_=card_class)[:max_cards]:
+        values = {}
+        for field, selector in spec['fields'].items():
+            element = soup_select(card, selector)
+            if element is None:
+                continue
+            values[field] = element.text.strip()
+            if field in links:
+                values[f'{field}_href'] = element.get('href', '')
+        cards.append(values)
+    return cards
+
+
+def parse_cards(html, source: str, max_cards: int = 20, backend: str = None) -> list:
+    """
+    Job cards of a source's search page as dicts of field -> stripped text
+    (plus '<field>_href' for link fields). Fields missing from a card are absent.
+    """
+    if (backend or DEFAULT_BACKEND) == 'lxml':
+        return _lxml_cards(html, source, max_cards)
+    return _soup_cards(html, source, max_cards)
+
+
+def iter_anchors(html, backend: str = None):
+    """(text, href) for every <a href> on the page, in document order."""
+    if (backend or DEFAULT_BACKEND) == 'lxml':
+        tree = _lxml_tree(html)
+        if tree is None:
+            return
+        for anchor in tree.iter('a'):
+            href = anchor.get('href')
+            if href is not None:
+                yield anchor.text_content(), href
+        return
+
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('a', href=True))
+    for anchor in soup.find_all('a', href=True):
+        yield anchor.get_text(), anchor.get('href', '')
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Background ingestion worker for the local job index.
+
+Periodically scrapes a configurable set of popular titles and locations with
+the app's existing scrapers and stores the cleaned jobs in the SQLite/FTS
+index that /find-jobs reads when JOB_INDEX_ENABLED=true.
+
+    python ingest_worker.py            # run forever, every INGEST_INTERVAL_MINUTES
+    python ingest_worker.py --once     # single ingestion cycle
+"""
+
+import os
+import time
+import argparse
+import logging
+
+import app
+from job_index import JobIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TITLES = "Software Engineer;Python Developer;Java Developer;Full Stack Developer;Frontend Developer;Backend Developer;Data Engineer;DevOps Engineer"
+DEFAULT_LOCATIONS = "India"
+
+
+def parse_list(value: str) -> list:
+    """Semicolon-separated list (locations themselves contain commas)"""
+    return [item.strip() for item in value.split(';') if item.strip()]
+
+
+def run_ingestion_cycle(index: JobIndex, titles: list, locations: list) -> int:
+    """Scrape every (title, location, source) once and upsert the results. Returns jobs stored."""
+    # Always ingest fresh upstream results rather than the request-path cache
+    app.scrape_result_cache.clear()
+
+    tasks = []
+    for location in locations:
+        for title in titles:
+            for config in app.get_search_configs(location):
+                tasks.append({
+                    "name": config["name"],
+                    "host": config["host"],
+                    "title": title,
+                    "location": location,
+                    "func": config["scraper"],
+                    "args": (title, location, None)
+                })
+
+    logger.info(f"Ingesting {len(titles)} titles x {len(locations)} locations ({len(tasks)} scrapes)")
+    stored = 0
+    for task, jobs in app.scrape_scheduler.run(tasks):
+        count = index.upsert_jobs(jobs, task["title"], task["location"], task["name"])
+        logger.info(f"Indexed {count} {task['name']} jobs for '{task['title']}' in {task['location']}")
+        stored += count
+
+    removed = index.purge_older_than(app.JOB_INDEX_MAX_AGE_SECONDS)
+    logger.info(f"Ingestion cycle stored {stored} jobs, purged {removed} expired")
+    return stored
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Populate the local job index")
+    parser.add_argument('--once', action='store_true', help='Run a single ingestion cycle and exit')
+    args = parser.parse_args()
+
+    titles = parse_list(os.getenv("INGEST_TITLES", DEFAULT_TITLES))
+    locations = parse_list(os.getenv("INGEST_LOCATIONS", DEFAULT_LOCATIONS))
+    interval_seconds = float(os.getenv("INGEST_INTERVAL_MINUTES", "60")) * 60
+
+    index = JobIndex(app.JOB_INDEX_PATH)
+
+    while True:
+        started = time.monotonic()
+        try:
+            run_ingestion_cycle(index, titles, locations)
+        except Exception as e:
+            logger.error(f"Ingestion cycle failed: {e}")
+
+        if args.once:
+            break
+        time.sleep(max(0.0, interval_seconds - (time.monotonic() - started)))
+
+
+if __name__ == '__main__':
+    main()
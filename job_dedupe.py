@@ -0,0 +1,131 @@
+import re
+import zlib
+import logging
+import numpy as np
+from career_cache import normalize_company_name
+from job_index import make_dedupe_key
+
+logger = logging.getLogger(__name__)
+
+# Smallest prime above 2^32: a * x with a, x < 2^32 stays below 2^64 in uint64
+HASH_PRIME = 4294967311
+
+
+def shingle_hashes(text: str, size: int = 5) -> np.ndarray:
+    """Stable 32-bit hashes of the character shingles of normalized text"""
+    normalized = ' '.join(re.findall(r'[a-z0-9+#]+', (text or '').lower()))
+    if len(normalized) <= size:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+    return np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles), dtype=np.uint64)
+
+
+class MinHasher:
+    """MinHash signatures with universal hashing (a * x + b) mod p, vectorized over shingles"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        prime = np.uint64(HASH_PRIME)
+        values = ((self.a[:, None] * hashes[None, :]) % prime + self.b[:, None]) % prime
+        return values.min(axis=1)
+
+
+def merge_job(existing: dict, duplicate: dict):
+    """
+    Fold a duplicate posting into the kept one: union of apply options and sources, fill blanks.
+    The lists are replaced rather than extended, since per-request Job copies share them with the cache.
+    """
+    sources = existing.get('sources') or [existing.get('source', 'Unknown')]
+    source = duplicate.get('source')
+    if source and source not in sources:
+        sources = sources + [source]
+    existing['sources'] = sources
+
+    options = existing.get('apply_options') or []
+    known_links = {option.get('link') for option in options}
+    new_options = []
+    for option in duplicate.get('apply_options', []) or []:
+        if option.get('link') not in known_links:
+            new_options.append(option)
+            known_links.add(option.get('link'))
+    if new_options:
+        existing['apply_options'] = options + new_options
+
+    for field in ('salary', 'job_type', 'posted_at', 'location'):
+        if not existing.get(field) and duplicate.get(field):
+            existing[field] = duplicate[field]
+    if len(duplicate.get('description', '') or '') > len(existing.get('description', '') or ''):
+        existing['description'] = duplicate['description']
+    if duplicate.get('has_direct_apply'):
+        existing['has_direct_apply'] = True
+
+
+class JobDeduplicator:
+    """
+    Incremental job dedupe.
+
+    Exact duplicates are caught in O(1) by the normalized company + title key
+    ("Infosys Ltd" == "Infosys Limited"). Near duplicates (the same posting on
+    two boards with slightly different titles) are found with MinHash over
+    title + description shingles and LSH banding, restricted to the same
+    normalized company. Duplicates are merged into the first posting seen.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 64, bands: int = 16):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.jobs = []
+        self.by_key = {}
+        self.signatures = []
+        self.companies = []
+        self.buckets = [{} for _ in range(bands)]
+
+    def _near_duplicate(self, signature: np.ndarray, company: str, band_keys: list) -> int:
+        candidates = set()
+        for band, band_key in enumerate(band_keys):
+            candidates.update(self.buckets[band].get(band_key, ()))
+        for index in candidates:
+            if self.companies[index] != company:
+                continue
+            if np.mean(self.signatures[index] == signature) >= self.threshold:
+                return index
+        return -1
+
+    def add(self, job: dict) -> bool:
+        """Keep the job and return True, or merge it into an earlier duplicate and return False."""
+        # Job records carry their keys precomputed
+        key = getattr(job, 'dedupe_key', None) or make_dedupe_key(job)
+        index = self.by_key.get(key)
+        if index is not None:
+            merge_job(self.jobs[index], job)
+            return False
+
+        company = getattr(job, 'company_key', None) or normalize_company_name(job.get('company_name', ''))
+        signature = self.hasher.signature(shingle_hashes(f"{job.get('title', '')} {job.get('description', '')}"))
+        band_keys = [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+        index = self._near_duplicate(signature, company, band_keys)
+        if index >= 0:
+            merge_job(self.jobs[index], job)
+            self.by_key[key] = index
+            return False
+
+        index = len(self.jobs)
+        self.jobs.append(job)
+        self.by_key[key] = index
+        self.signatures.append(signature)
+        self.companies.append(company)
+        for band, band_key in enumerate(band_keys):
+            self.buckets[band].setdefault(band_key, []).append(index)
+        return True
+
+    def extend(self, jobs: list) -> list:
+        """add() every job; returns the ones that were kept."""
+        return [job for job in jobs if job and self.add(job)]
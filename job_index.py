@@ -0,0 +1,178 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+import logging
+from career_cache import normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_search_text(value: str) -> str:
+    return ' '.join((value or '').lower().split())
+
+
+def make_dedupe_key(job: dict) -> str:
+    """Stable key for a posting: normalized company + title"""
+    return f"{normalize_company_name(job.get('company_name', ''))}|{normalize_search_text(job.get('title', ''))}"
+
+
+def build_title_match_query(title: str) -> str:
+    """FTS5 query requiring every word of the title to appear in the indexed title"""
+    terms = re.findall(r'[a-z0-9]+', (title or '').lower())
+    return ' AND '.join(f'title : "{term}"' for term in terms)
+
+
+class JobIndex:
+    """
+    Local SQLite index of normalized jobs (Job records, stored as dicts) with FTS5 over title/description.
+
+    Populated by the ingestion worker; /find-jobs reads from it so popular titles
+    are served from disk instead of live scrapes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    dedupe_key TEXT,
+                    job_id TEXT,
+                    source TEXT,
+                    title TEXT,
+                    company_name TEXT,
+                    location TEXT,
+                    search_location TEXT,
+                    posted_at TEXT,
+                    ingested_at REAL NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (dedupe_key, search_location)
+                );
+                CREATE INDEX IF NOT EXISTS jobs_search_location ON jobs (search_location, ingested_at);
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (dedupe_key UNINDEXED, title, description);
+                CREATE TABLE IF NOT EXISTS coverage (
+                    search_title TEXT,
+                    search_location TEXT,
+                    source TEXT,
+                    job_count INTEGER,
+                    ingested_at REAL NOT NULL,
+                    PRIMARY KEY (search_title, search_location, source)
+                );
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def upsert_jobs(self, jobs: list, search_title: str, search_location: str, source: str) -> int:
+        """
+        Store cleaned jobs found for a (title, location, source) search and record
+        the coverage. A posting is kept once per search location; a search that
+        stored nothing (blocked, failed or timed out) records no coverage.
+        """
+        now = time.time()
+        location_key = normalize_search_text(search_location)
+        stored = 0
+
+        with self._connection() as conn:
+            for job in jobs:
+                if not job:
+                    continue
+                key = getattr(job, 'dedupe_key', None) or make_dedupe_key(job)
+                payload = job.to_dict() if hasattr(job, 'to_dict') else job
+                conn.execute(
+                    "INSERT OR REPLACE INTO jobs "
+                    "(dedupe_key, job_id, source, title, company_name, location, search_location, posted_at, ingested_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, job.get('job_id', ''), job.get('source', source), job.get('title', ''),
+                     job.get('company_name', ''), job.get('location', ''), location_key,
+                     job.get('posted_at', ''), now, json.dumps(payload))
+                )
+                conn.execute("DELETE FROM jobs_fts WHERE dedupe_key = ?", (key,))
+                conn.execute(
+                    "INSERT INTO jobs_fts (dedupe_key, title, description) VALUES (?, ?, ?)",
+                    (key, job.get('title', ''), job.get('description', ''))
+                )
+                stored += 1
+
+            if not stored:
+                return 0
+            conn.execute(
+                "INSERT OR REPLACE INTO coverage (search_title, search_location, source, job_count, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (normalize_search_text(search_title), location_key, source, stored, now)
+            )
+
+        return stored
+
+    def search(self, title: str, search_location: str, max_age_seconds: float, limit: int = 100) -> list:
+        """Fresh indexed jobs whose title contains every word of `title`, best FTS rank first."""
+        query = build_title_match_query(title)
+        if not query:
+            return []
+
+        try:
+            rows = self._connection().execute(
+                "SELECT jobs.payload FROM jobs_fts JOIN jobs ON jobs.dedupe_key = jobs_fts.dedupe_key "
+                "WHERE jobs_fts MATCH ? AND jobs.search_location = ? AND jobs.ingested_at >= ? "
+                "ORDER BY jobs_fts.rank LIMIT ?",
+                (query, normalize_search_text(search_location), time.time() - max_age_seconds, limit)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error searching job index for '{title}': {e}")
+            return []
+
+        return [json.loads(payload) for (payload,) in rows]
+
+    def iter_jobs(self, search_location: str, max_age_seconds: float, batch_size: int = 1000):
+        """Every fresh indexed job for a search location, for building the retrieval pool"""
+        cursor = self._connection().execute(
+            "SELECT payload FROM jobs WHERE search_location = ? AND ingested_at >= ?",
+            (normalize_search_text(search_location), time.time() - max_age_seconds)
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for (payload,) in rows:
+                yield json.loads(payload)
+
+    def iter_descriptions(self, batch_size: int = 1000):
+        """Every indexed job description (title + description), for offline model fitting"""
+        cursor = self._connection().execute("SELECT title, description FROM jobs_fts")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for title, description in rows:
+                yield f"{title or ''}. {description or ''}"
+
+    def is_ingested(self, title: str, search_location: str, max_age_seconds: float) -> bool:
+        """True if the worker has recently found jobs for exactly this title/location"""
+        row = self._connection().execute(
+            "SELECT 1 FROM coverage WHERE search_title = ? AND search_location = ? AND ingested_at >= ? AND job_count > 0 LIMIT 1",
+            (normalize_search_text(title), normalize_search_text(search_location), time.time() - max_age_seconds)
+        ).fetchone()
+        return row is not None
+
+    def purge_older_than(self, max_age_seconds: float) -> int:
+        """Drop jobs and coverage rows older than max_age_seconds"""
+        cutoff = time.time() - max_age_seconds
+        with self._connection() as conn:
+            removed = conn.execute("DELETE FROM jobs WHERE ingested_at < ?", (cutoff,)).rowcount
+            # A posting's text stays searchable while any search location still holds it
+            conn.execute("DELETE FROM jobs_fts WHERE dedupe_key NOT IN (SELECT dedupe_key FROM jobs)")
+            conn.execute("DELETE FROM coverage WHERE ingested_at < ?", (cutoff,))
+        return removed
@@ -0,0 +1,48 @@
+"""
+JSON payloads for job lists: compact card records and fast serialization.
+Full job records stay server-side and are fetched one at a time through
+GET /results/<session_id>/jobs/<job_id>.
+"""
+
+import json
+from job_record import json_default
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the standard json module is used without it
+    orjson = None
+
+SNIPPET_CHARS = 200
+
+# Fields a job card shows, copied as-is
+CARD_FIELDS = ('job_id', 'title', 'company_name', 'location', 'posted_at', 'source',
+               'match_score', 'has_direct_apply', 'career_page')
+
+
+def snippet(text: str, limit: int = SNIPPET_CHARS) -> str:
+    """First `limit` characters of the text, cut at a word boundary."""
+    text = ' '.join((text or '').split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(' ', 1)[0] or text[:limit]
+    return cut.rstrip(' ,.;:') + '…'
+
+
+def compact_job(job: dict, snippet_chars: int = SNIPPET_CHARS) -> dict:
+    """Card fields of a job: no full description, link lists or raw scraper fields."""
+    compact = {field: job[field] for field in CARD_FIELDS if job.get(field) not in (None, '')}
+    compact['snippet'] = snippet(job.get('description', ''), snippet_chars)
+    apply_options = job.get('apply_options') or []
+    if apply_options and apply_options[0].get('link'):
+        compact['apply_url'] = apply_options[0]['link']
+    apply_links = job.get('apply_links') or []
+    if apply_links and apply_links[0].get('url'):
+        compact['direct_apply_url'] = apply_links[0]['url']
+    return compact
+
+
+def dumps(obj) -> bytes:
+    """UTF-8 JSON (Job records as their dicts), with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, default=json_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
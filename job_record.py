@@ -0,0 +1,196 @@
+"""
+Typed job record used from the scrapers to the JSON boundary.
+
+Scrapers emit Job records through normalize_job, the single cleaning pass:
+fields are trimmed, repeated strings (source, location, job type) are
+interned, a description is synthesized when the posting has none, and the
+stable id, dedupe key and ranking text are computed once. Dedupe, ranking and
+enrichment work on the records in place, and they become dicts only when
+serialized (to_dict / json_default).
+
+Jobs keep dict-style access (job.get('title'), job['match_score'] = ...) so
+code written against the old dicts keeps working.
+"""
+
+import sys
+import hashlib
+from dataclasses import dataclass, field, fields, replace
+from career_cache import normalize_company_name
+from job_index import make_dedupe_key
+
+# Descriptions shorter than this are padded with the other fields for ranking
+MIN_MATCH_TEXT_CHARS = 50
+MATCH_TEXT_FIELDS = frozenset(('title', 'company_name', 'location', 'description', 'salary', 'experience', 'job_type'))
+
+
+@dataclass(slots=True, eq=False)
+class Job:
+    title: str
+    company_name: str
+    location: str = ''
+    description: str = ''
+    job_id: str = ''
+    posted_at: str = ''
+    salary: str = ''
+    job_type: str = ''
+    experience: str = ''
+    apply_options: list = field(default_factory=list)
+    related_links: list = field(default_factory=list)
+    source: str = 'Unknown'
+    career_page: str = None
+    apply_links: list = field(default_factory=list)
+    has_direct_apply: bool = False
+    match_score: float = None
+    sources: list = None
+    # Derived once by normalize_job / from_dict, never serialized
+    dedupe_key: str = field(default='', repr=False)
+    company_key: str = field(default='', repr=False)
+    match_text: str = field(default='', repr=False)
+
+    def get(self, key: str, default=None):
+        """dict.get over the public fields; unset optional fields (None) count as missing."""
+        if key not in PUBLIC_FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        if key not in PUBLIC_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in PUBLIC_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+        if key in MATCH_TEXT_FIELDS:
+            self.match_text = match_text(self)
+
+    def __contains__(self, key: str) -> bool:
+        return key in PUBLIC_FIELDS and getattr(self, key) is not None
+
+    def setdefault(self, key: str, default=None):
+        value = self.get(key)
+        if value is None:
+            self[key] = value = default
+        return value
+
+    def update(self, values: dict):
+        for key, value in values.items():
+            self[key] = value
+
+    def copy(self) -> 'Job':
+        """
+        Per-request copy of a shared (cached) record. Every field value, lists included, is shared
+        with the original: requests only assign fields (dedupe and enrichment replace lists instead
+        of extending them), so a copy costs one slotted object.
+        """
+        return replace(self)
+
+    def to_dict(self) -> dict:
+        """Public fields as a plain dict (unset optional fields left out), for JSON and the SQLite stores."""
+        data = {}
+        for name in PUBLIC_FIELDS:
+            value = getattr(self, name)
+            if value is not None or name == 'career_page':
+                data[name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Job':
+        """Record from an already-normalized dict (job index payloads), with the derived fields filled in."""
+        job = cls(**{name: data[name] for name in PUBLIC_FIELDS if name in data})
+        job.source = sys.intern(job.source or 'Unknown')
+        job.location = sys.intern(job.location or '')
+        return derive_fields(job)
+
+
+PUBLIC_FIELDS = tuple(f.name for f in fields(Job) if f.repr)
+
+
+def json_default(value):
+    """json.dumps(default=...) hook: Job records serialize as their dict."""
+    if isinstance(value, Job):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def stable_job_id(job, source: str) -> str:
+    """Same id for the same posting in every process (unlike hash(), which is salted per process)."""
+    key = '\x1f'.join(str(job.get(name) or '') for name in ('title', 'company_name', 'location', 'apply_url'))
+    return f"{source}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+
+
+def clean_text(value) -> str:
+    return ' '.join(str(value).split()) if value else ''
+
+
+def match_text(job: Job) -> str:
+    """Text the ranker scores: the description, padded with the other fields when it is short."""
+    if len(job.description) >= MIN_MATCH_TEXT_CHARS:
+        return job.description
+    parts = [job.description] if job.description else []
+    parts.append(f"Job Title: {job.title}")
+    parts.append(f"Company: {job.company_name}")
+    parts.append(f"Location: {job.location}")
+    if job.salary:
+        parts.append(f"Salary: {job.salary}")
+    if job.experience:
+        parts.append(f"Experience: {job.experience}")
+    if job.job_type:
+        parts.append(f"Job Type: {job.job_type}")
+    return '. '.join(parts)
+
+
+def derive_fields(job: Job) -> Job:
+    job.dedupe_key = make_dedupe_key(job)
+    job.company_key = normalize_company_name(job.company_name)
+    job.match_text = match_text(job)
+    return job
+
+
+def normalize_job(raw: dict, source: str = None) -> Job:
+    """
+    One pass from a scraper's raw dict to a Job, or None without a title or
+    company. source defaults to the dict's own 'source'.
+    """
+    title = clean_text(raw.get('title'))
+    company_name = clean_text(raw.get('company_name'))
+    if not title or not company_name:
+        return None
+
+    source = sys.intern(source or raw.get('source') or 'Unknown')
+    experience = clean_text(raw.get('experience'))
+    salary = clean_text(raw.get('salary'))
+    job_type = sys.intern(clean_text(raw.get('job_type')))
+
+    description = (raw.get('description') or '').strip()
+    if not description:
+        parts = [f"Position: {title}"]
+        if experience:
+            parts.append(f"Experience: {experience}")
+        if salary:
+            parts.append(f"Salary: {salary}")
+        if job_type:
+            parts.append(f"Type: {job_type}")
+        description = '. '.join(parts)
+
+    apply_url = raw.get('apply_url') or ''
+    apply_options = [{'title': f"Apply on {source}", 'link': apply_url}] if apply_url else list(raw.get('apply_options') or [])
+
+    job = Job(
+        title=title,
+        company_name=company_name,
+        location=sys.intern(clean_text(raw.get('location'))),
+        description=description,
+        job_id=raw.get('job_id') or stable_job_id(raw, source),
+        posted_at=raw.get('posted_at') or '',
+        salary=salary,
+        job_type=job_type,
+        experience=experience,
+        apply_options=apply_options,
+        related_links=list(raw.get('related_links') or []),
+        source=source,
+        has_direct_apply=bool(apply_url),
+    )
+    return derive_fields(job)
@@ -0,0 +1,218 @@
+import re
+import time
+import array
+import threading
+from collections import Counter
+import logging
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from tfidf_model import TFIDF_TOKEN_PATTERN
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(TFIDF_TOKEN_PATTERN)
+
+
+def tokenize(text: str) -> list:
+    """Same tokens as the TF-IDF vectorizer (keeps C++, C#, .NET), minus English stop words"""
+    return [token for token in TOKEN_RE.findall((text or '').lower()) if token not in ENGLISH_STOP_WORDS]
+
+
+def job_document(job: dict) -> str:
+    return f"{job.get('title', '')} {job.get('description', '')}"
+
+
+class BM25Index:
+    """
+    Static inverted index with BM25 impacts precomputed per posting.
+
+    Postings are stored CSR-style (term -> contiguous doc ids and impacts), and
+    each term keeps its maximum impact as an upper bound for optional MaxScore
+    pruning: once the best remaining terms together cannot lift an unseen
+    document into the current top-k, only the surviving candidates are scored
+    further. On job-like corpora (10k to 1M postings, resume queries capped at
+    100 terms) the pruned search was never faster than scoring every posting
+    (bench_job_retrieval.py), so it is off by default.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_ids = {}
+        self.num_docs = 0
+
+    def build(self, documents):
+        """Index an iterable of document texts; document ids are their positions."""
+        posting_terms = array.array('i')
+        posting_docs = array.array('i')
+        posting_tfs = array.array('f')
+        doc_lengths = array.array('f')
+
+        for doc_id, text in enumerate(documents):
+            tokens = tokenize(text)
+            doc_lengths.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                term_id = self.term_ids.setdefault(token, len(self.term_ids))
+                posting_terms.append(term_id)
+                posting_docs.append(doc_id)
+                posting_tfs.append(tf)
+
+        self.num_docs = len(doc_lengths)
+        terms = np.frombuffer(posting_terms, dtype=np.int32)
+        docs = np.frombuffer(posting_docs, dtype=np.int32)
+        tfs = np.frombuffer(posting_tfs, dtype=np.float32)
+        lengths = np.frombuffer(doc_lengths, dtype=np.float32)
+
+        # Group postings by term; a stable sort keeps doc ids ascending within a term
+        order = np.argsort(terms, kind='stable')
+        self.doc_ids = docs[order]
+        tfs = tfs[order]
+        doc_freqs = np.bincount(terms, minlength=len(self.term_ids))
+        self.offsets = np.concatenate(([0], np.cumsum(doc_freqs))).astype(np.int64)
+
+        self.idf = np.log(1 + (self.num_docs - doc_freqs + 0.5) / (doc_freqs + 0.5)).astype(np.float32)
+        average_length = float(lengths.mean()) if self.num_docs else 0.0
+        norms = self.k1 * (1 - self.b + self.b * lengths / max(average_length, 1e-9))
+        posting_idf = np.repeat(self.idf, doc_freqs)
+        self.impacts = (posting_idf * tfs * (self.k1 + 1) / (tfs + norms[self.doc_ids])).astype(np.float32)
+
+        self.upper_bounds = np.zeros(len(self.term_ids), dtype=np.float32)
+        non_empty = doc_freqs > 0
+        if self.impacts.size:
+            self.upper_bounds[non_empty] = np.maximum.reduceat(self.impacts, self.offsets[:-1][non_empty])
+        return self
+
+    def _query_terms(self, query: str, max_query_terms: int = None) -> list:
+        counts = Counter(token for token in tokenize(query) if token in self.term_ids)
+        # Long queries (a whole resume) keep their most discriminative terms
+        weighted = sorted(counts, key=lambda token: self.idf[self.term_ids[token]] * np.log1p(counts[token]), reverse=True)
+        return [self.term_ids[token] for token in weighted[:max_query_terms]]
+
+    def search(self, query: str, k: int = 300, max_query_terms: int = 100, prune: bool = False) -> list:
+        """
+        Top-k (doc_id, score) pairs by BM25, best first. max_query_terms=None keeps
+        every query term; prune=True enables MaxScore pruning instead of scoring
+        every posting exhaustively.
+        """
+        if not self.num_docs or k <= 0:
+            return []
+
+        query_terms = self._query_terms(query, max_query_terms)
+        if not query_terms:
+            return []
+
+        # Highest upper bound first; remaining[i] is the most terms i.. can still add
+        query_terms.sort(key=lambda term: self.upper_bounds[term], reverse=True)
+        bounds = self.upper_bounds[query_terms]
+        remaining = np.concatenate((np.cumsum(bounds[::-1])[::-1], [0.0]))
+
+        lengths = (self.offsets[np.array(query_terms) + 1] - self.offsets[query_terms]).astype(np.float64)
+        remaining_postings = np.concatenate((np.cumsum(lengths[::-1])[::-1], [0.0]))
+
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+        candidates = None  # doc ids once unseen documents can no longer make the top-k
+        # The k-th score only grows by the bounds processed since it was last measured,
+        # so it is re-measured only once that growth could allow a freeze
+        threshold, rest_at_threshold = 0.0, remaining[0]
+
+        for position, term in enumerate(query_terms):
+            start, end = self.offsets[term], self.offsets[term + 1]
+            docs = self.doc_ids[start:end]
+            impacts = self.impacts[start:end]
+            rest = remaining[position + 1]
+
+            if candidates is None:
+                scores[docs] += impacts
+            else:
+                if len(candidates) > k and len(docs) > len(candidates):
+                    # Shrinking the candidates costs less than the posting list about to be scanned
+                    threshold = max(threshold, float(np.partition(scores[candidates], -k)[-k]))
+                    candidates = candidates[scores[candidates] + remaining[position] >= threshold]
+
+                if len(candidates) * np.log2(len(docs) + 1) < len(docs):
+                    # Few candidates: skip into the posting list by binary search
+                    found = np.searchsorted(docs, candidates)
+                    hit = found < len(docs)
+                    hit[hit] = docs[found[hit]] == candidates[hit]
+                    scores[candidates[hit]] += impacts[found[hit]]
+                else:
+                    # Scores of non-candidates are never read, so a plain scatter is cheapest
+                    scores[docs] += impacts
+                continue
+
+            # A freeze check costs O(docs); only worth it while more postings than that remain
+            if not prune or self.num_docs <= k or remaining_postings[position + 1] < 2 * self.num_docs:
+                continue
+            if rest >= threshold + (rest_at_threshold - rest):
+                continue
+            threshold = float(np.partition(scores, -k)[-k])
+            rest_at_threshold = rest
+            if threshold > rest:
+                # Unseen documents cannot reach the threshold even with every remaining term
+                candidates = np.flatnonzero(scores + rest >= threshold)
+
+        if candidates is None:
+            candidates = np.flatnonzero(scores)
+
+        k = min(k, len(candidates))
+        if k == 0:
+            return []
+        top = candidates[np.argpartition(scores[candidates], -k)[-k:]]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in top]
+
+
+class JobPoolRetriever:
+    """
+    Candidate retrieval over a large local job pool (one index per pool key,
+    e.g. search location). build_index(documents) returns any index with
+    search(query, k) -> [(doc_id, score)]; BM25 by default. Indexes are built
+    in the background, never on a request thread: until a key's first index is
+    ready its searches return no candidates, and once older than refresh_seconds
+    it is rebuilt while the previous index keeps serving.
+    """
+
+    def __init__(self, load_jobs, refresh_seconds: float = 900, build_index=None):
+        self.load_jobs = load_jobs
+        self.refresh_seconds = refresh_seconds
+        self.build_index = build_index or (lambda documents: BM25Index().build(documents))
+        self.pools = {}  # key -> (built_at, index, jobs)
+        self.rebuilding = set()
+        self.lock = threading.Lock()
+
+    def _build(self, key: str):
+        started = time.monotonic()
+        jobs = list(self.load_jobs(key))
+        index = self.build_index(job_document(job) for job in jobs)
+        with self.lock:
+            self.pools[key] = (time.monotonic(), index, jobs)
+            self.rebuilding.discard(key)
+        logger.info(f"Built {type(index).__name__} for '{key}': {len(jobs)} jobs in {time.monotonic() - started:.2f}s")
+        return self.pools[key]
+
+    def _build_in_background(self, key: str):
+        try:
+            self._build(key)
+        except Exception as e:
+            logger.error(f"Error building retrieval index for '{key}': {e}")
+            with self.lock:
+                self.rebuilding.discard(key)
+
+    def _start_build(self, key: str):
+        """Start a background build of key's index unless one is running (call with the lock held)."""
+        if key not in self.rebuilding:
+            self.rebuilding.add(key)
+            threading.Thread(target=self._build_in_background, args=(key,), daemon=True).start()
+
+    def search(self, key: str, query: str, k: int = 300) -> list:
+        """The k jobs in the pool that best match the query text, best first (none while the index builds)."""
+        with self.lock:
+            pool = self.pools.get(key)
+            if pool is None or time.monotonic() - pool[0] > self.refresh_seconds:
+                self._start_build(key)
+
+        if pool is None:
+            return []
+
+        _, index, jobs = pool
+        return [jobs[doc_id] for doc_id, _ in index.search(query, k)]
@@ -1,339 +1,459 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from html_parsing import parse_cards, iter_anchors
 import json
 import time
-from urllib.parse import urljoin, quote
+from urllib.parse import urljoin
 import logging
+from job_dedupe import JobDeduplicator
+from job_record import normalize_job
+from career_cache import LookupUnavailable
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+JSEARCH_URL = "https://jsearch.p.rapidapi.com/search"
+
+# Common career page patterns
+CAREER_PAGE_PATTERNS = [
+    "/careers",
+    "/jobs",
+    "/career",
+    "/job",
+    "/work-with-us",
+    "/join-us",
+    "/opportunities"
+]
+
+# Common apply link patterns
+APPLY_LINK_PATTERNS = [
+    'apply',
+    'apply now',
+    'apply for this position',
+    'submit application',
+    'apply online',
+    'apply here',
+    'apply today'
+]
+
+def naukri_search_url(job_title: str, location: str) -> str:
+    """Build the Naukri search URL for a title and location"""
+    formatted_title = job_title.lower().replace(' ', '-')
+    formatted_location = location.lower().replace(' ', '-')
+    return f"https://www.naukri.com/{formatted_title}-jobs-in-{formatted_location}"
+
+def indeed_search_params(job_title: str, location: str) -> dict:
+    """Query parameters for an Indeed search"""
+    return {
+        'q': job_title,
+        'l': location,
+        'start': 0
+    }
+
+def linkedin_search_params(job_title: str, location: str) -> dict:
+    """Query parameters for a LinkedIn job search"""
+    return {
+        'keywords': job_title,
+        'location': location,
+        'f_TPR': 'r86400'  # Past 24 hours
+    }
+
+def jsearch_request(job_title: str, location: str, rapidapi_key: str) -> tuple:
+    """Return (headers, params) for a JSearch API call"""
+    headers = {
+        "X-RapidAPI-Key": rapidapi_key,
+        "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
+    }
+
+    params = {
+        "query": f"{job_title} in {location}",
+        "page": "1",
+        "num_pages": "1"
+    }
+    return headers, params
+
+def parse_naukri_jobs(html, location: str, max_jobs: int = 20) -> list:
+    """Parse Naukri search result HTML into Job records"""
+    jobs = []
+
+    # Job cards (Naukri's current structure), see html_parsing.SOURCE_SELECTORS
+    for card in parse_cards(html, 'naukri', max_jobs):
+        try:
+            title_text = card.get('title')
+            company_text = card.get('company')
+            experience_text = card.get('experience')
+            salary_text = card.get('salary')
+
+            if title_text and company_text:
+                # Try to get job description or create one
+                description = card.get('description', '')
+
+                # If no description, create enhanced one from available info
+                if not description:
+                    desc_parts = [f"Position: {title_text}"]
+
+                    if experience_text:
+                        desc_parts.append(f"Experience Required: {experience_text}")
+                    if salary_text:
+                        desc_parts.append(f"Salary: {salary_text}")
+
+                    # Add relevant keywords based on job title for better matching
+                    if 'python' in title_text.lower():
+                        desc_parts.append("Skills: Python programming, Django, Flask, web development")
+                    if 'java' in title_text.lower():
+                        desc_parts.append("Skills: Java programming, Spring, enterprise applications")
+                    if 'react' in title_text.lower():
+                        desc_parts.append("Skills: React, JavaScript, frontend development")
+                    if 'full stack' in title_text.lower():
+                        desc_parts.append("Skills: Full stack development, frontend and backend")
+                    if 'senior' in title_text.lower():
+                        desc_parts.append("Level: Senior position with leadership responsibilities")
+
+                    description = '. '.join(desc_parts)
+
+                job = normalize_job({
+                    'title': title_text,
+                    'company_name': company_text,
+                    'location': card.get('location') or location,
+                    'experience': experience_text or '',
+                    'salary': salary_text or '',
+                    'apply_url': urljoin('https://www.naukri.com', card.get('title_href', '')),
+                    'source': 'Naukri',
+                    'description': description,
+                    'posted_at': '',
+                    'job_type': ''
+                })
+                if job:
+                    jobs.append(job)
+
+        except Exception as e:
+            logger.error(f"Error parsing Naukri job card: {e}")
+            continue
+
+    return jobs
+
+def parse_indeed_jobs(html, location: str, max_jobs: int = 20) -> list:
+    """Parse Indeed search result HTML into Job records"""
+    jobs = []
+
+    # Job cards (Indeed's structure), see html_parsing.SOURCE_SELECTORS
+    for card in parse_cards(html, 'indeed', max_jobs):
+        try:
+            company_text = card.get('company')
+            salary_text = card.get('salary')
+
+            if card.get('title') and company_text:
+                has_link = 'title_link' in card
+                title_text = card['title_link'] if has_link else card['title']
+
+                # Try to get job description
+                description = card.get('description', '')
+
+                # If no description, create enhanced one
+                if not description:
+                    desc_parts = [f"Position: {title_text}"]
+
+                    if salary_text:
+                        desc_parts.append(f"Salary: {salary_text}")
+
+                    # Add relevant keywords based on job title for better matching
+                    if 'python' in title_text.lower():
+                        desc_parts.append("Skills: Python programming, web development, software engineering")
+                    if 'java' in title_text.lower():
+                        desc_parts.append("Skills: Java programming, enterprise development, backend systems")
+                    if 'react' in title_text.lower():
+                        desc_parts.append("Skills: React, JavaScript, frontend development, UI/UX")
+                    if 'full stack' in title_text.lower():
+                        desc_parts.append("Skills: Full stack development, both frontend and backend")
+                    if 'senior' in title_text.lower():
+                        desc_parts.append("Level: Senior role with advanced responsibilities")
+
+                    description = '. '.join(desc_parts)
+
+                job = normalize_job({
+                    'title': title_text,
+                    'company_name': company_text,
+                    'location': card.get('location') or location,
+                    'salary': salary_text or '',
+                    'apply_url': urljoin('https://in.indeed.com', card.get('title_link_href', '')) if has_link else '',
+                    'source': 'Indeed',
+                    'description': description,
+                    'posted_at': '',
+                    'job_type': '',
+                    'experience': ''
+                })
+                if job:
+                    jobs.append(job)
+
+        except Exception as e:
+            logger.error(f"Error parsing Indeed job card: {e}")
+            continue
+
+    return jobs
+
+def parse_linkedin_jobs(html, location: str, max_jobs: int = 15) -> list:
+    """Parse LinkedIn search result HTML into Job records"""
+    jobs = []
+
+    # LinkedIn job cards (structure may change frequently), see html_parsing.SOURCE_SELECTORS
+    for card in parse_cards(html, 'linkedin', max_jobs):
+        try:
+            title_text = card.get('title')
+            company_text = card.get('company')
+            location_text = card.get('location')
+
+            if title_text and company_text:
+                # Try to get job link
+                apply_url = urljoin('https://www.linkedin.com', card.get('link_href', '')) if 'link' in card else ''
+
+                # Create enhanced description with common job keywords
+
+                # Enhanced description with relevant keywords for better matching
+                description_parts = [
+                    f"Position: {title_text}",
+                    f"Company: {company_text}",
+                ]
+
+                if location_text:
+                    description_parts.append(f"Location: {location_text}")
+
+                # Add relevant keywords based on job title
+                if 'python' in title_text.lower():
+                    description_parts.append("Skills: Python programming, software development, web applications")
+                if 'java' in title_text.lower():
+                    description_parts.append("Skills: Java programming, enterprise applications, backend development")
+                if 'react' in title_text.lower():
+                    description_parts.append("Skills: React, JavaScript, frontend development, web applications")
+                if 'full stack' in title_text.lower():
+                    description_parts.append("Skills: Full stack development, frontend, backend, web technologies")
+                if 'senior' in title_text.lower():
+                    description_parts.append("Experience: Senior level position, leadership, mentoring")
+                if 'engineer' in title_text.lower():
+                    description_parts.append("Role: Software engineering, technical design, problem solving")
+
+                description = '. '.join(description_parts)
+
+                job = normalize_job({
+                    'title': title_text,
+                    'company_name': company_text,
+                    'location': location_text or location,
+                    'source': 'LinkedIn',
+                    'description': description,
+                    'posted_at': '',
+                    'job_type': '',
+                    'salary': '',
+                    'experience': '',
+                    'apply_url': apply_url
+                })
+                if job:
+                    jobs.append(job)
+
+        except Exception as e:
+            logger.error(f"Error parsing LinkedIn job card: {e}")
+            continue
+
+    return jobs
+
+def parse_jsearch_jobs(data: dict, location: str) -> list:
+    """Convert a JSearch API response into Job records"""
+    jobs = []
+
+    for job_data in data.get('data', []):
+        # Ensure we have a good description
+        description = job_data.get('job_description', '')
+        if not description:
+            # Create description from available fields
+            desc_parts = [f"Job Title: {job_data.get('job_title', '')}"]
+            if job_data.get('job_employment_type'):
+                desc_parts.append(f"Employment Type: {job_data.get('job_employment_type')}")
+            if job_data.get('job_salary'):
+                desc_parts.append(f"Salary: {job_data.get('job_salary')}")
+            description = '. '.join(desc_parts)
+
+        # Safely handle location concatenation
+        job_city = job_data.get('job_city') or ''
+        job_country = job_data.get('job_country') or ''
+        location = f"{job_city}, {job_country}".strip(', ') if job_city or job_country else location
+
+        job = normalize_job({
+            'title': job_data.get('job_title', ''),
+            'company_name': job_data.get('employer_name', ''),
+            'location': location,
+            'description': description,
+            'salary': job_data.get('job_salary', ''),
+            'job_type': job_data.get('job_employment_type', ''),
+            'apply_url': job_data.get('job_apply_link', ''),
+            'posted_at': job_data.get('job_posted_at_datetime_utc', ''),
+            'source': 'JSearch API',
+            'experience': ''
+        })
+        if job:
+            jobs.append(job)
+
+    return jobs
+
+def parse_apply_links(html, page_url: str, max_links: int = 3) -> list:
+    """Extract apply links from a career page's HTML"""
+    apply_links = []
+
+    # Only anchors are parsed, not the rest of the page
+    for text, href in iter_anchors(html):
+        link_text = text.lower().strip()
+
+        # Check if link text matches apply patterns
+        if any(pattern in link_text for pattern in APPLY_LINK_PATTERNS):
+            full_url = urljoin(page_url, href)
+            apply_links.append({
+                'text': text.strip(),
+                'url': full_url
+            })
+
+        # Also check href for apply patterns
+        elif any(pattern in href.lower() for pattern in APPLY_LINK_PATTERNS):
+            full_url = urljoin(page_url, href)
+            apply_links.append({
+                'text': text.strip() or 'Apply',
+                'url': full_url
+            })
+
+        # Limit to maximum 3 apply links
+        if len(apply_links) >= max_links:
+            break
+
+    return apply_links
+
 class JobScraperAlternatives:
     """Alternative job scraping methods to replace RapidAPI"""
-    
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+
+    def __init__(self, pool_maxsize: int = 20):
+        self.headers = dict(DEFAULT_HEADERS)
         self.session = requests.Session()
         self.session.headers.update(self.headers)
-    
+
+        # Scrapes run concurrently, so keep enough pooled keep-alive connections per host
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def scrape_naukri_direct(self, job_title: str, location: str = "India", max_jobs: int = 20) -> list:
         """Direct Naukri scraping without API"""
         jobs = []
         try:
             # Format search URL
-            formatted_title = job_title.lower().replace(' ', '-')
-            formatted_location = location.lower().replace(' ', '-')
-            
-            search_url = f"https://www.naukri.com/{formatted_title}-jobs-in-{formatted_location}"
-            
+            search_url = naukri_search_url(job_title, location)
+
             response = self.session.get(search_url, timeout=10)
             if response.status_code != 200:
                 return jobs
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job cards (Naukri's current structure)
-            job_cards = soup.find_all('div', class_='jobTuple')
-            
-            for card in job_cards[:max_jobs]:
-                try:
-                    # Extract job details
-                    title_elem = card.find('a', class_='title')
-                    company_elem = card.find('a', class_='subTitle')
-                    location_elem = card.find('span', class_='locationsContainer')
-                    experience_elem = card.find('span', class_='expwdth')
-                    salary_elem = card.find('span', class_='salary')
-                    
-                    if title_elem and company_elem:
-                        # Try to get job description or create one
-                        desc_elem = card.find('span', class_='job-description')
-                        description = desc_elem.text.strip() if desc_elem else ''
-                        
-                        # If no description, create enhanced one from available info
-                        if not description:
-                            title_text = title_elem.text.strip()
-                            desc_parts = [f"Position: {title_text}"]
-                            
-                            if experience_elem:
-                                desc_parts.append(f"Experience Required: {experience_elem.text.strip()}")
-                            if salary_elem:
-                                desc_parts.append(f"Salary: {salary_elem.text.strip()}")
-                            
-                            # Add relevant keywords based on job title for better matching
-                            if 'python' in title_text.lower():
-                                desc_parts.append("Skills: Python programming, Django, Flask, web development")
-                            if 'java' in title_text.lower():
-                                desc_parts.append("Skills: Java programming, Spring, enterprise applications")
-                            if 'react' in title_text.lower():
-                                desc_parts.append("Skills: React, JavaScript, frontend development")
-                            if 'full stack' in title_text.lower():
-                                desc_parts.append("Skills: Full stack development, frontend and backend")
-                            if 'senior' in title_text.lower():
-                                desc_parts.append("Level: Senior position with leadership responsibilities")
-                            
-                            description = '. '.join(desc_parts)
-                        
-                        job = {
-                            'title': title_elem.text.strip(),
-                            'company_name': company_elem.text.strip(),
-                            'location': location_elem.text.strip() if location_elem else location,
-                            'experience': experience_elem.text.strip() if experience_elem else '',
-                            'salary': salary_elem.text.strip() if salary_elem else '',
-                            'apply_url': urljoin('https://www.naukri.com', title_elem.get('href', '')),
-                            'source': 'Naukri',
-                            'description': description,
-                            'posted_at': '',
-                            'job_type': ''
-                        }
-                        jobs.append(job)
-                        
-                except Exception as e:
-                    logger.error(f"Error parsing Naukri job card: {e}")
-                    continue
-                    
+
+            jobs = parse_naukri_jobs(response.content, location, max_jobs)
+
         except Exception as e:
             logger.error(f"Error scraping Naukri: {e}")
-            
+
         return jobs
-    
+
     def scrape_indeed_direct(self, job_title: str, location: str = "India", max_jobs: int = 20) -> list:
         """Direct Indeed scraping without API"""
         jobs = []
         try:
             # Format search parameters
-            params = {
-                'q': job_title,
-                'l': location,
-                'start': 0
-            }
-            
+            params = indeed_search_params(job_title, location)
+
             search_url = "https://in.indeed.com/jobs"
             response = self.session.get(search_url, params=params, timeout=10)
-            
+
             if response.status_code != 200:
                 return jobs
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job cards (Indeed's structure)
-            job_cards = soup.find_all('div', class_='job_seen_beacon')
-            
-            for card in job_cards[:max_jobs]:
-                try:
-                    title_elem = card.find('h2', class_='jobTitle')
-                    company_elem = card.find('span', class_='companyName')
-                    location_elem = card.find('div', class_='companyLocation')
-                    salary_elem = card.find('span', class_='salary-snippet')
-                    
-                    if title_elem and company_elem:
-                        title_link = title_elem.find('a')
-                        
-                        # Try to get job description
-                        desc_elem = card.find('div', class_='job-snippet')
-                        description = desc_elem.text.strip() if desc_elem else ''
-                        
-                        # If no description, create enhanced one
-                        if not description:
-                            title_text = title_link.text.strip() if title_link else title_elem.text.strip()
-                            desc_parts = [f"Position: {title_text}"]
-                            
-                            if salary_elem:
-                                desc_parts.append(f"Salary: {salary_elem.text.strip()}")
-                            
-                            # Add relevant keywords based on job title for better matching
-                            if 'python' in title_text.lower():
-                                desc_parts.append("Skills: Python programming, web development, software engineering")
-                            if 'java' in title_text.lower():
-                                desc_parts.append("Skills: Java programming, enterprise development, backend systems")
-                            if 'react' in title_text.lower():
-                                desc_parts.append("Skills: React, JavaScript, frontend development, UI/UX")
-                            if 'full stack' in title_text.lower():
-                                desc_parts.append("Skills: Full stack development, both frontend and backend")
-                            if 'senior' in title_text.lower():
-                                desc_parts.append("Level: Senior role with advanced responsibilities")
-                            
-                            description = '. '.join(desc_parts)
-                        
-                        job = {
-                            'title': title_link.text.strip() if title_link else title_elem.text.strip(),
-                            'company_name': company_elem.text.strip(),
-                            'location': location_elem.text.strip() if location_elem else location,
-                            'salary': salary_elem.text.strip() if salary_elem else '',
-                            'apply_url': urljoin('https://in.indeed.com', title_link.get('href', '')) if title_link else '',
-                            'source': 'Indeed',
-                            'description': description,
-                            'posted_at': '',
-                            'job_type': '',
-                            'experience': ''
-                        }
-                        jobs.append(job)
-                        
-                except Exception as e:
-                    logger.error(f"Error parsing Indeed job card: {e}")
-                    continue
-                    
+
+            jobs = parse_indeed_jobs(response.content, location, max_jobs)
+
         except Exception as e:
             logger.error(f"Error scraping Indeed: {e}")
-            
+
         return jobs
-    
+
     def scrape_linkedin_jobs_direct(self, job_title: str, location: str = "India", max_jobs: int = 15) -> list:
         """Direct LinkedIn Jobs scraping (limited due to anti-bot measures)"""
         jobs = []
         try:
             # LinkedIn is heavily protected, but we can try basic scraping
-            params = {
-                'keywords': job_title,
-                'location': location,
-                'f_TPR': 'r86400'  # Past 24 hours
-            }
-            
+            params = linkedin_search_params(job_title, location)
+
             search_url = "https://www.linkedin.com/jobs/search"
             response = self.session.get(search_url, params=params, timeout=10)
-            
+
             if response.status_code != 200:
                 return jobs
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # LinkedIn job cards (structure may change frequently)
-            job_cards = soup.find_all('div', class_='base-card')
-            
-            for card in job_cards[:max_jobs]:
-                try:
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    
-                    if title_elem and company_elem:
-                        # Try to get job link
-                        job_link = card.find('a')
-                        apply_url = urljoin('https://www.linkedin.com', job_link.get('href', '')) if job_link else ''
-                        
-                        # Create enhanced description with common job keywords
-                        title_text = title_elem.text.strip()
-                        company_text = company_elem.text.strip()
-                        
-                        # Enhanced description with relevant keywords for better matching
-                        description_parts = [
-                            f"Position: {title_text}",
-                            f"Company: {company_text}",
-                        ]
-                        
-                        if location_elem:
-                            description_parts.append(f"Location: {location_elem.text.strip()}")
-                        
-                        # Add relevant keywords based on job title
-                        if 'python' in title_text.lower():
-                            description_parts.append("Skills: Python programming, software development, web applications")
-                        if 'java' in title_text.lower():
-                            description_parts.append("Skills: Java programming, enterprise applications, backend development")
-                        if 'react' in title_text.lower():
-                            description_parts.append("Skills: React, JavaScript, frontend development, web applications")
-                        if 'full stack' in title_text.lower():
-                            description_parts.append("Skills: Full stack development, frontend, backend, web technologies")
-                        if 'senior' in title_text.lower():
-                            description_parts.append("Experience: Senior level position, leadership, mentoring")
-                        if 'engineer' in title_text.lower():
-                            description_parts.append("Role: Software engineering, technical design, problem solving")
-                        
-                        description = '. '.join(description_parts)
-                        
-                        job = {
-                            'title': title_text,
-                            'company_name': company_text,
-                            'location': location_elem.text.strip() if location_elem else location,
-                            'source': 'LinkedIn',
-                            'description': description,
-                            'posted_at': '',
-                            'job_type': '',
-                            'salary': '',
-                            'experience': '',
-                            'apply_url': apply_url
-                        }
-                        jobs.append(job)
-                        
-                except Exception as e:
-                    logger.error(f"Error parsing LinkedIn job card: {e}")
-                    continue
-                    
+
+            jobs = parse_linkedin_jobs(response.content, location, max_jobs)
+
         except Exception as e:
             logger.error(f"Error scraping LinkedIn: {e}")
-            
+
         return jobs
-    
+
     def use_jsearch_api(self, job_title: str, location: str = "India", rapidapi_key: str = None) -> list:
         """Use JSearch API via RapidAPI (2500 free requests/month)"""
         if not rapidapi_key:
             return []
-            
+
         jobs = []
         try:
-            url = "https://jsearch.p.rapidapi.com/search"
-            headers = {
-                "X-RapidAPI-Key": rapidapi_key,
-                "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
-            }
-            
-            params = {
-                "query": f"{job_title} in {location}",
-                "page": "1",
-                "num_pages": "1"
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
+            headers, params = jsearch_request(job_title, location, rapidapi_key)
+
+            response = self.session.get(JSEARCH_URL, headers=headers, params=params, timeout=10)
+
             if response.status_code == 200:
-                data = response.json()
-                
-                for job_data in data.get('data', []):
-                    # Ensure we have a good description
-                    description = job_data.get('job_description', '')
-                    if not description:
-                        # Create description from available fields
-                        desc_parts = [f"Job Title: {job_data.get('job_title', '')}"]
-                        if job_data.get('job_employment_type'):
-                            desc_parts.append(f"Employment Type: {job_data.get('job_employment_type')}")
-                        if job_data.get('job_salary'):
-                            desc_parts.append(f"Salary: {job_data.get('job_salary')}")
-                        description = '. '.join(desc_parts)
-                    
-                    # Safely handle location concatenation
-                    job_city = job_data.get('job_city') or ''
-                    job_country = job_data.get('job_country') or ''
-                    location = f"{job_city}, {job_country}".strip(', ') if job_city or job_country else location
-                    
-                    job = {
-                        'title': job_data.get('job_title', ''),
-                        'company_name': job_data.get('employer_name', ''),
-                        'location': location,
-                        'description': description,
-                        'salary': job_data.get('job_salary', ''),
-                        'job_type': job_data.get('job_employment_type', ''),
-                        'apply_url': job_data.get('job_apply_link', ''),
-                        'posted_at': job_data.get('job_posted_at_datetime_utc', ''),
-                        'source': 'JSearch API',
-                        'experience': ''
-                    }
-                    jobs.append(job)
-                    
+                jobs = parse_jsearch_jobs(response.json(), location)
+
         except Exception as e:
             logger.error(f"Error using JSearch API: {e}")
-            
+
         return jobs
-    
+
+    def find_career_page(self, base_url: str) -> str:
+        """Probe common career page paths on a company website; raises LookupUnavailable if no probe got an answer"""
+        errors = 0
+        for pattern in CAREER_PAGE_PATTERNS:
+            career_url = urljoin(base_url, pattern)
+            try:
+                response = self.session.get(career_url, timeout=10)
+                if response.status_code == 200:
+                    return career_url
+            except Exception:
+                errors += 1
+                continue
+
+        if errors == len(CAREER_PAGE_PATTERNS):
+            raise LookupUnavailable(f"{base_url} did not answer any career page probe")
+        return None
+
+    def extract_apply_links_from_career_page(self, career_url: str) -> list:
+        """Fetch a career page and extract its apply links"""
+        try:
+            response = self.session.get(career_url, timeout=10)
+            if response.status_code != 200:
+                return []
+            return parse_apply_links(response.content, career_url)
+        except Exception as e:
+            logger.error(f"Error extracting apply links from {career_url}: {e}")
+            return []
+
     def scrape_all_sources(self, job_title: str, location: str = "India", rapidapi_key: str = None) -> list:
         """Scrape jobs from all available sources"""
         all_jobs = []
-        
+
         # Direct scraping sources
         sources = [
             ('Naukri', self.scrape_naukri_direct),
             ('Indeed', self.scrape_indeed_direct),
             ('LinkedIn', self.scrape_linkedin_jobs_direct)
         ]
-        
+
         for source_name, scraper_func in sources:
             try:
                 logger.info(f"Scraping {source_name} for '{job_title}' in {location}")
@@ -342,7 +462,7 @@ class JobScraperAlternatives:
                 time.sleep(2)  # Rate limiting
             except Exception as e:
                 logger.error(f"Error scraping {source_name}: {e}")
-        
+
         # API sources
         if rapidapi_key:
             try:
@@ -351,7 +471,7 @@ class JobScraperAlternatives:
                 all_jobs.extend(api_jobs)
             except Exception as e:
                 logger.error(f"Error using JSearch API: {e}")
-        
+
         return all_jobs
 
 # Usage example
@@ -359,20 +479,11 @@ def get_jobs_without_serpapi(job_titles: list, location: str = "India", rapidapi
     """Get jobs using alternative methods instead of SerpAPI"""
     scraper = JobScraperAlternatives()
     all_jobs = []
-    
+
     for title in job_titles:
         jobs = scraper.scrape_all_sources(title, location, rapidapi_key)
         all_jobs.extend(jobs)
         time.sleep(3)  # Rate limiting between different job titles
-    
-    # Remove duplicates
-    unique_jobs = []
-    seen = set()
-    
-    for job in all_jobs:
-        job_key = (job['title'].lower(), job['company_name'].lower())
-        if job_key not in seen:
-            seen.add(job_key)
-            unique_jobs.append(job)
-    
-    return unique_jobs
\ No newline at end of file
+
+    # Remove duplicates (merging apply options and sources of the same posting)
+    return JobDeduplicator().extend(all_jobs)
@@ -0,0 +1,105 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+import logging
+import scipy.sparse
+
+logger = logging.getLogger(__name__)
+
+
+def job_vector_key(job_id: str, description: str) -> str:
+    """job_id + description hash, so an edited posting gets a fresh vector"""
+    digest = hashlib.sha1((description or '').encode('utf-8')).hexdigest()
+    return f"{job_id or ''}:{digest}"
+
+
+class JobVectorCache:
+    """
+    Sparse TF-IDF rows for job descriptions under the pre-fitted model.
+
+    Rows live in an in-memory LRU with an optional directory of .npz files
+    per model version; a refit (new model version) starts a fresh cache, so
+    vectors from different vocabularies are never mixed.
+    """
+
+    def __init__(self, max_entries: int = 20000, disk_dir: str = None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.entries = OrderedDict()
+        self.model_version = None
+        self.lock = threading.Lock()
+
+    def _disk_path(self, key: str) -> str:
+        file_name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, self.model_version, f"{file_name}.npz")
+
+    def _set_model_version(self, model_version: str):
+        with self.lock:
+            if model_version != self.model_version:
+                self.entries.clear()
+                self.model_version = model_version
+        if self.disk_dir:
+            os.makedirs(os.path.join(self.disk_dir, model_version), exist_ok=True)
+
+    def _get(self, key: str):
+        with self.lock:
+            row = self.entries.get(key)
+            if row is not None:
+                self.entries.move_to_end(key)
+                return row
+
+        if not self.disk_dir:
+            return None
+
+        try:
+            row = scipy.sparse.load_npz(self._disk_path(key))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading cached job vector {key}: {e}")
+            return None
+
+        self._remember(key, row)
+        return row
+
+    def _remember(self, key: str, row):
+        with self.lock:
+            self.entries[key] = row
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def _put(self, key: str, row):
+        self._remember(key, row)
+
+        if not self.disk_dir:
+            return
+
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+        try:
+            scipy.sparse.save_npz(tmp_path, row)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing cached job vector {key}: {e}")
+
+    def transform(self, vectorizer, model_version: str, job_ids: list, descriptions: list):
+        """
+        Stacked TF-IDF rows for the descriptions, in order. Only descriptions
+        missing from the cache are transformed, in a single batch.
+        """
+        self._set_model_version(model_version)
+
+        keys = [job_vector_key(job_id, description) for job_id, description in zip(job_ids, descriptions)]
+        rows = [self._get(key) for key in keys]
+
+        missing = [index for index, row in enumerate(rows) if row is None]
+        if missing:
+            fresh = vectorizer.transform([descriptions[index] for index in missing]).tocsr()
+            for offset, index in enumerate(missing):
+                rows[index] = fresh[offset]
+                self._put(keys[index], rows[index])
+
+        logger.info(f"Job vectors: {len(keys) - len(missing)} cached, {len(missing)} transformed")
+        return scipy.sparse.vstack(rows, format='csr')
@@ -0,0 +1,74 @@
+import re
+from functools import lru_cache
+
+# Characters that continue a token: 'java' must not hit 'javascript', 'C' must not hit 'C++'
+WORD_CHARS = r'A-Za-z0-9_+#'
+ROMAN_NUMERAL_RE = re.compile(r'^[IVX]+$')
+
+
+def keyword_pattern(keywords: list) -> str:
+    # Longest first so the alternation prefers 'senior lead' over 'senior' at the same position
+    alternatives = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    return rf'(?<![{WORD_CHARS}])(?=({alternatives})(?![{WORD_CHARS}]))'
+
+
+class KeywordMatcher:
+    """
+    Precompiled whole-word matcher for a fixed keyword set.
+
+    All keywords are folded into one alternation regex (case-insensitive), except
+    roman numerals like 'I' / 'II' which only match as written, so a job text is
+    scanned once and every keyword it contains is returned.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keyword for keyword in keywords if keyword and keyword.strip()))
+
+        case_sensitive = [keyword for keyword in self.keywords if ROMAN_NUMERAL_RE.match(keyword)]
+        case_insensitive = [keyword for keyword in self.keywords if keyword not in case_sensitive]
+
+        self.patterns = []
+        if case_insensitive:
+            self.patterns.append((re.compile(keyword_pattern(case_insensitive), re.IGNORECASE), str.lower))
+        if case_sensitive:
+            self.patterns.append((re.compile(keyword_pattern(case_sensitive)), str))
+
+        # Matched text -> every keyword it implies, including shorter keywords
+        # starting at the same position that the alternation skipped
+        self.implied = {}
+        for keyword in self.keywords:
+            normalize = str if keyword in case_sensitive else str.lower
+            contained = {other for other in self.keywords
+                         if other != keyword and other not in case_sensitive
+                         and re.search(keyword_pattern([other]), keyword, re.IGNORECASE)}
+            contained |= {other for other in case_sensitive
+                          if other != keyword and re.search(keyword_pattern([other]), keyword)}
+            self.implied.setdefault(normalize(keyword), set()).update({keyword} | contained)
+
+    def find(self, text: str) -> set:
+        """Every keyword that occurs in the text as a whole word."""
+        hits = set()
+        if not text:
+            return hits
+        for pattern, normalize in self.patterns:
+            for match in pattern.finditer(text):
+                hits |= self.implied.get(normalize(match.group(1)), set())
+        return hits
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in the text."""
+        return bool(text) and any(pattern.search(text) for pattern, _ in self.patterns)
+
+    def find_all(self, texts: list) -> list:
+        """find() over a batch of texts."""
+        return [self.find(text) for text in texts]
+
+
+@lru_cache(maxsize=512)
+def _cached_matcher(keywords: tuple) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords) -> KeywordMatcher:
+    """Shared compiled matcher for a keyword set (order and duplicates don't matter)."""
+    return _cached_matcher(tuple(sorted(set(keywords or ()))))
@@ -0,0 +1,144 @@
+"""
+Deterministic resume analysis without the LLM.
+
+Years of experience come from the date ranges on the resume ("Jan 2019 -
+Present", "03/2021 – 06/2023", "2016 to 2018"), merged so overlapping jobs are
+counted once; education lines are skipped. Skills come from the bundled
+taxonomy in resume_keywords and titles from its precomputed skill -> title
+table. Everything is regex and dictionary lookups, so a resume takes a few
+milliseconds.
+"""
+
+import re
+from datetime import date
+from resume_keywords import find_skills, rank_job_titles
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Only real month names, so "Wipro 2018 - 2020" still parses as a year range
+MONTH_NAME = (r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+              r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b")
+DATE_TOKEN = rf"(?:{MONTH_NAME}\.?,?\s+\d{{4}}|\d{{1,2}}\s*/\s*\d{{4}}|\d{{4}})"
+DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{DATE_TOKEN})\s*(?:-|–|—|to|till|until)\s*"
+    rf"(?P<end>{DATE_TOKEN}|present|current|now|today|till date|date)\b",
+    re.IGNORECASE,
+)
+YEARS_RE = re.compile(r'(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years|yrs)', re.IGNORECASE)
+
+# Lines and section headings whose date ranges are not work experience
+EDUCATION_RE = re.compile(
+    r"\b(?:education|b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|b\.?\s?sc|m\.?\s?sc|bachelor|master|mba|ph\.?d|"
+    r"university|college|institute|school|degree|diploma|graduat\w*|cgpa|gpa)\b",
+    re.IGNORECASE,
+)
+SECTION_HEADINGS = {
+    'experience': True, 'work experience': True, 'professional experience': True, 'employment': True,
+    'employment history': True, 'work history': True,
+    'education': False, 'projects': False, 'certifications': False, 'skills': False, 'summary': False,
+    'achievements': False, 'publications': False,
+}
+
+# (minimum years, level), highest first; same bands as the Gemini prompt
+EXPERIENCE_BANDS = [(8, "lead"), (5, "senior"), (3, "mid"), (1, "junior"), (0, "entry")]
+
+# Title patterns searched for each level, mirroring what the Gemini variants prompt asks for
+LEVEL_TITLE_PATTERNS = {
+    "entry": ["Associate {}", "Junior {}", "{}"],
+    "junior": ["Junior {}", "{} I"],
+    "mid": ["{}", "{} II"],
+    "senior": ["Senior {}", "{}"],
+    "lead": ["Lead {}", "Senior {}", "Principal {}"],
+}
+
+
+def experience_level_for_years(years: float) -> str:
+    return next(level for minimum, level in EXPERIENCE_BANDS if years >= minimum)
+
+
+def parse_month(token: str, is_end: bool) -> int:
+    """Month index (year * 12 + month - 1) of a date token; a bare year means January, or December as an end."""
+    token = token.strip().lower().rstrip('.,')
+    if token in ('present', 'current', 'now', 'today', 'till date', 'date'):
+        return None
+    if token.isdigit():
+        return int(token) * 12 + (11 if is_end else 0)
+    if '/' in token:
+        month, year = (int(part) for part in token.split('/'))
+        return year * 12 + min(max(month, 1), 12) - 1
+    name, year = re.split(r'[.,\s]+', token, maxsplit=1)
+    month = MONTHS.get(name[:4]) or MONTHS.get(name[:3])
+    if month is None or not year.strip().isdigit():
+        raise ValueError(token)
+    return int(year) * 12 + month - 1
+
+
+def experience_intervals(text: str, today: date = None) -> list:
+    """[start, end] month indexes (inclusive) of the work date ranges in the text."""
+    today = today or date.today()
+    current = today.year * 12 + today.month - 1
+    intervals, in_work_section = [], True
+    for line in (text or '').splitlines():
+        heading = line.strip().strip(':').lower()
+        if heading in SECTION_HEADINGS:
+            in_work_section = SECTION_HEADINGS[heading]
+            continue
+        if not in_work_section or EDUCATION_RE.search(line):
+            continue
+        for match in DATE_RANGE_RE.finditer(line):
+            try:
+                start = parse_month(match.group('start'), is_end=False)
+                end = parse_month(match.group('end'), is_end=True)
+            except ValueError:
+                continue
+            end = current if end is None else min(end, current)
+            if start is not None and 1950 * 12 <= start <= end:
+                intervals.append([start, end])
+    return intervals
+
+
+def years_of_experience(text: str, today: date = None) -> float:
+    """Years covered by the work date ranges (overlaps counted once), else the largest "N years" mention."""
+    intervals = sorted(experience_intervals(text, today))
+    months, merged_end = 0, None
+    for start, end in intervals:
+        if merged_end is not None and start <= merged_end:
+            if end > merged_end:
+                months += end - merged_end
+                merged_end = end
+            continue
+        months += end - start + 1
+        merged_end = end
+    if months:
+        return round(months / 12, 1)
+    return max((float(value) for value in YEARS_RE.findall(text or '')), default=0.0)
+
+
+def level_title_variants(titles: list, experience_level: str, limit: int = 8) -> list:
+    patterns = LEVEL_TITLE_PATTERNS.get(experience_level, ["{}"])
+    variants = []
+    for title in titles:
+        for pattern in patterns:
+            variant = pattern.format(title)
+            if variant not in variants:
+                variants.append(variant)
+    return variants[:limit]
+
+
+def analyze_resume_locally(text: str, today: date = None, max_titles: int = 4) -> dict:
+    """Resume profile in the same shape as the Gemini extraction, plus the unprefixed base titles."""
+    years = years_of_experience(text, today)
+    years = int(years) if float(years).is_integer() else years
+    level = experience_level_for_years(years)
+    skills = find_skills(text)
+    titles = [title for title, _ in rank_job_titles(text, skills)[:max_titles]] or ["Software Engineer"]
+    return {
+        "experience_level": level,
+        "years_experience": years,
+        "skills": skills,
+        "base_job_titles": titles,
+        "job_titles": level_title_variants(titles, level),
+    }
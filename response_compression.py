@@ -0,0 +1,61 @@
+import gzip
+import logging
+
+try:
+    import brotli
+except ImportError:  # Optional; responses are gzip-compressed without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/css', 'application/javascript', 'text/javascript')
+
+
+def accepted_encoding(accept_encoding: str) -> str:
+    """'br', 'gzip' or None for an Accept-Encoding header (q=0 entries are refused)."""
+    accepted = set()
+    for part in (accept_encoding or '').lower().split(','):
+        name, _, params = part.strip().partition(';')
+        if name and params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            accepted.add(name)
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return None
+
+
+def compress_response(response, accept_encoding: str, min_size: int = 1024, gzip_level: int = 6,
+                      brotli_quality: int = 5):
+    """
+    Compress a buffered Flask response body with brotli or gzip when the client
+    accepts it. Streamed and passthrough responses (NDJSON, files) are left
+    alone so incremental delivery keeps working.
+    """
+    if (response.is_streamed or response.direct_passthrough or response.status_code < 200
+            or response.status_code in (204, 304) or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = accepted_encoding(accept_encoding)
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    try:
+        if encoding == 'br':
+            compressed = brotli.compress(body, quality=brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=gzip_level)
+    except Exception as e:
+        logger.error(f"Error compressing response: {e}")
+        return response
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Content-Length'] = str(len(compressed))
+    return response
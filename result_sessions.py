@@ -0,0 +1,141 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from collections import OrderedDict
+import logging
+from job_record import json_default
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSessionStore:
+    """
+    Ranked search results kept server-side per search session, so pages,
+    filters and sort orders are served from the stored list instead of a new
+    /find-jobs run.
+
+    Sessions live in SQLite (any gunicorn worker can serve a page of a search
+    run by another) and expire ttl_seconds after their last update. Full job
+    records are also kept per (session_id, job_id), so the list can stay
+    compact and a job's details (with that session's match_score) are fetched
+    on demand. Each process keeps the last max_cached
+    decoded sessions, revalidated against the stored updated_at, so a page
+    request normally skips the JSON decode.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 3600, max_cached: int = 64):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_cached = max_cached
+        self.local = threading.local()
+        self.cached = OrderedDict()  # session_id -> decoded session
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    context TEXT NOT NULL,
+                    jobs TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_jobs (
+                    session_id TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (session_id, job_id)
+                )
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def create(self, context: dict = None) -> str:
+        """New empty session; context holds the search inputs (filters, profile)."""
+        session_id = uuid.uuid4().hex
+        self.save(session_id, [], context or {})
+        self.purge_expired()
+        return session_id
+
+    def save(self, session_id: str, jobs: list, context: dict = None):
+        """Replace the session's ranked jobs (and context, when given) and refresh their details by job_id."""
+        now = time.time()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO result_jobs (session_id, job_id, payload, expires_at) VALUES (?, ?, ?, ?)",
+                [(session_id, job['job_id'], json.dumps(job, default=json_default), now + self.ttl_seconds)
+                 for job in jobs if job.get('job_id')]
+            )
+            if context is None:
+                row = conn.execute("SELECT context FROM result_sessions WHERE session_id = ?", (session_id,)).fetchone()
+                context_json = row[0] if row else '{}'
+            else:
+                context_json = json.dumps(context)
+            conn.execute(
+                "INSERT OR REPLACE INTO result_sessions (session_id, context, jobs, updated_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (session_id, context_json, json.dumps(jobs, default=json_default), now, now + self.ttl_seconds)
+            )
+
+    def load(self, session_id: str) -> dict:
+        """{'session_id', 'context', 'jobs', 'updated_at'} or None when unknown or expired."""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT updated_at, expires_at FROM result_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if not row or row[1] < time.time():
+            return None
+        updated_at = row[0]
+
+        with self.lock:
+            session = self.cached.get(session_id)
+            if session is not None and session['updated_at'] == updated_at:
+                self.cached.move_to_end(session_id)
+                return session
+
+        row = conn.execute(
+            "SELECT context, jobs, updated_at FROM result_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if not row:
+            return None
+        session = {
+            'session_id': session_id,
+            'context': json.loads(row[0]),
+            'jobs': json.loads(row[1]),
+            'updated_at': row[2],
+        }
+        with self.lock:
+            self.cached[session_id] = session
+            self.cached.move_to_end(session_id)
+            while len(self.cached) > self.max_cached:
+                self.cached.popitem(last=False)
+        return session
+
+    def load_job(self, session_id: str, job_id: str) -> dict:
+        """Full record of a job as ranked in a live session, or None."""
+        row = self._connection().execute(
+            "SELECT payload FROM result_jobs WHERE session_id = ? AND job_id = ? AND expires_at >= ?",
+            (session_id, job_id, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute("DELETE FROM result_jobs WHERE expires_at < ?", (now,))
+            return conn.execute("DELETE FROM result_sessions WHERE expires_at < ?", (now,)).rowcount
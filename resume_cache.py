@@ -0,0 +1,82 @@
+import os
+import json
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def resume_digest(pdf_bytes: bytes) -> str:
+    """Content address of an uploaded resume"""
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+class ResumeAnalysisCache:
+    """
+    Content-addressed cache: SHA-256 of the PDF bytes -> extracted text + experience_data.
+
+    Lookups hit an in-memory LRU first and fall back to an optional directory
+    of JSON files, so a repeat upload skips PDF parsing and every Gemini call.
+    """
+
+    def __init__(self, max_entries: int = 256, disk_dir: str = None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.disk_dir, f"{digest}.json")
+
+    def _remember(self, digest: str, entry: dict):
+        with self.lock:
+            self.entries[digest] = entry
+            self.entries.move_to_end(digest)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get(self, digest: str) -> dict:
+        """Return {'resume_text', 'experience_data'} for a digest, or None on a miss."""
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is not None:
+                self.entries.move_to_end(digest)
+                return copy.deepcopy(entry)
+
+        if not self.disk_dir:
+            return None
+
+        try:
+            with open(self._disk_path(digest), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading resume cache entry {digest}: {e}")
+            return None
+
+        self._remember(digest, entry)
+        return copy.deepcopy(entry)
+
+    def put(self, digest: str, resume_text: str, experience_data: dict):
+        entry = {'resume_text': resume_text, 'experience_data': copy.deepcopy(experience_data)}
+        self._remember(digest, entry)
+
+        if not self.disk_dir:
+            return
+
+        # Write to a temp file first so concurrent workers never read a partial entry
+        path = self._disk_path(digest)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing resume cache entry {digest}: {e}")
@@ -0,0 +1,147 @@
+from collections import Counter
+from keyword_matcher import get_matcher
+
+# Bundled skills taxonomy: category -> canonical skill names. Ambiguous short
+# names ("Go", "R", "C") are only matched through unambiguous aliases.
+SKILL_TAXONOMY = {
+    "languages": ["Python", "Java", "JavaScript", "TypeScript", "Scala", "Kotlin", "Swift", "Objective-C", "C++", "C#",
+                  "Go", "Ruby", "PHP", "Rust", "SQL", "Bash"],
+    "frontend": ["React", "Angular", "Vue", "Redux", "Next.js", "HTML", "CSS", "Tailwind", "SwiftUI", "Jetpack Compose"],
+    "backend": ["Django", "Flask", "FastAPI", "Celery", "Spring Boot", "Spring", "Hibernate", "J2EE", "Node.js", "Express",
+                ".NET", "ASP.NET", "GraphQL", "REST APIs", "Microservices"],
+    "data": ["PostgreSQL", "MySQL", "Oracle", "MongoDB", "Redis", "Elasticsearch", "Spark", "PySpark", "Airflow", "Hadoop",
+             "Hive", "Kafka", "ETL", "BigQuery", "Snowflake", "dbt", "Teradata", "Tableau", "Power BI", "Looker"],
+    "ml": ["Machine Learning", "Deep Learning", "NLP", "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy"],
+    "cloud": ["AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins", "CI/CD", "Linux"],
+    "mobile": ["Android", "iOS"],
+    "testing": ["Selenium", "Cypress", "Jest", "pytest", "JUnit", "TestNG", "Appium", "Test Automation"],
+    "practices": ["Git", "Full Stack", "MERN", "MEAN"],
+}
+
+# Alternate spellings -> canonical skill
+SKILL_ALIASES = {
+    "Golang": "Go",
+    "ReactJS": "React",
+    "React.js": "React",
+    "AngularJS": "Angular",
+    "Vue.js": "Vue",
+    "NextJS": "Next.js",
+    "TailwindCSS": "Tailwind",
+    "Node": "Node.js",
+    "NodeJS": "Node.js",
+    "Express.js": "Express",
+    "ExpressJS": "Express",
+    "Java EE": "J2EE",
+    "Jakarta EE": "J2EE",
+    "Springboot": "Spring Boot",
+    "REST API": "REST APIs",
+    "RESTful APIs": "REST APIs",
+    "REST endpoints": "REST APIs",
+    "Postgres": "PostgreSQL",
+    "Mongo": "MongoDB",
+    "Apache Spark": "Spark",
+    "Apache Airflow": "Airflow",
+    "Apache Kafka": "Kafka",
+    "Apache Hive": "Hive",
+    "PowerBI": "Power BI",
+    "ML": "Machine Learning",
+    "sklearn": "scikit-learn",
+    "Amazon Web Services": "AWS",
+    "Google Cloud": "GCP",
+    "Google Cloud Platform": "GCP",
+    "Microsoft Azure": "Azure",
+    "Azure DevOps": "Azure",
+    "K8s": "Kubernetes",
+    "CI/CD pipelines": "CI/CD",
+    "Full-Stack": "Full Stack",
+    "Fullstack": "Full Stack",
+    "Shell scripting": "Bash",
+}
+
+# Job titles searched on the boards -> skills that point to them. Generic
+# titles with no distinctive skills are only picked when they appear in the text.
+TITLE_SKILLS = {
+    "Python Developer": ["Python", "Django", "Flask", "FastAPI", "Celery"],
+    "Java Developer": ["Java", "Spring Boot", "Spring", "Hibernate", "J2EE"],
+    "Frontend Developer": ["React", "Angular", "Vue", "Redux", "Next.js", "TypeScript", "JavaScript", "HTML", "CSS", "Tailwind"],
+    "Backend Developer": ["Node.js", "Express", "Microservices", "REST APIs", "GraphQL", "PostgreSQL", "MySQL", "MongoDB",
+                          "Redis", "Go", "Kafka"],
+    "Full Stack Developer": ["MERN", "MEAN", "Full Stack"],
+    "Data Engineer": ["Spark", "PySpark", "Airflow", "Hadoop", "Hive", "Kafka", "ETL", "BigQuery", "Snowflake", "Scala",
+                      "dbt", "Teradata", "SQL"],
+    "Data Scientist": ["Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "scikit-learn", "NLP", "Pandas", "NumPy"],
+    "Data Analyst": ["Tableau", "Power BI", "Looker", "SQL"],
+    "DevOps Engineer": ["Docker", "Kubernetes", "Terraform", "Jenkins", "CI/CD", "Ansible", "Linux"],
+    "Cloud Engineer": ["AWS", "Azure", "GCP", "Terraform"],
+    "Android Developer": ["Android", "Kotlin", "Jetpack Compose"],
+    "iOS Developer": ["iOS", "Swift", "SwiftUI", "Objective-C"],
+    "QA Engineer": ["Selenium", "Cypress", "Test Automation", "JUnit", "TestNG", "Appium"],
+    ".NET Developer": ["C#", ".NET", "ASP.NET"],
+    "Software Engineer": [],
+    "Software Developer": [],
+    "Web Developer": [],
+}
+
+# Spellings of titles as they appear on resumes
+TITLE_ALIASES = {
+    "Full Stack Developer": ["Full Stack Developer", "Full-Stack Developer", "Full Stack Engineer", "Fullstack Developer"],
+    "Frontend Developer": ["Frontend Developer", "Front-End Developer", "Front End Developer", "Frontend Engineer", "UI Developer"],
+    "Backend Developer": ["Backend Developer", "Back-End Developer", "Back End Developer", "Backend Engineer"],
+    "Software Engineer": ["Software Engineer", "SDE", "Software Development Engineer"],
+    "QA Engineer": ["QA Engineer", "Test Engineer", "SDET", "Quality Assurance Engineer"],
+    "Data Scientist": ["Data Scientist", "ML Engineer", "Machine Learning Engineer"],
+}
+
+# A title named on the resume outweighs a handful of matching skills
+TITLE_MENTION_WEIGHT = 3
+
+ALL_SKILLS = [skill for skills in SKILL_TAXONOMY.values() for skill in skills]
+SKILL_CATEGORIES = {skill: category for category, skills in SKILL_TAXONOMY.items() for skill in skills}
+# Ambiguous canonical names are left out of the text scan (their aliases still match)
+SKILL_SPELLINGS = {skill: skill for skill in ALL_SKILLS if skill not in ("Go",)}
+SKILL_SPELLINGS.update(SKILL_ALIASES)
+ALIAS_TITLES = {alias: title for title in TITLE_SKILLS for alias in TITLE_ALIASES.get(title, [title])}
+
+
+def _skill_title_weights() -> dict:
+    """Precomputed skill -> {title: weight}; a skill shared by several titles counts less for each."""
+    titles_by_skill = {}
+    for title, skills in TITLE_SKILLS.items():
+        for skill in skills:
+            titles_by_skill.setdefault(skill, []).append(title)
+    return {skill: {title: 1.0 / len(titles) for title in titles} for skill, titles in titles_by_skill.items()}
+
+
+SKILL_TITLE_WEIGHTS = _skill_title_weights()
+
+
+def find_skills(text: str) -> list:
+    """Canonical taxonomy skills mentioned in the text (directly or by alias), in taxonomy order."""
+    hits = {SKILL_SPELLINGS[spelling] for spelling in get_matcher(list(SKILL_SPELLINGS)).find(text)}
+    return [skill for skill in ALL_SKILLS if skill in hits]
+
+
+def rank_job_titles(text: str, skills: list = None) -> list:
+    """(title, score) pairs, best first: titles named in the text plus the precomputed skill -> title weights."""
+    if not text:
+        return []
+
+    scores = Counter()
+    for alias in get_matcher(list(ALIAS_TITLES)).find(text):
+        scores[ALIAS_TITLES[alias]] = TITLE_MENTION_WEIGHT
+    for skill in (find_skills(text) if skills is None else skills):
+        for title, weight in SKILL_TITLE_WEIGHTS.get(skill, {}).items():
+            scores[title] += weight
+
+    order = {title: index for index, title in enumerate(TITLE_SKILLS)}
+    ranked = sorted((title for title, score in scores.items() if score > 0),
+                    key=lambda title: (-scores[title], order[title]))
+    return [(title, scores[title]) for title in ranked]
+
+
+def guess_job_titles(text: str, limit: int = 4) -> list:
+    """
+    Likely job titles for a resume from a dictionary scan (no LLM): titles
+    named in the text, plus titles whose skills the text mentions, best first.
+    """
+    return [title for title, _ in rank_job_titles(text)[:limit]]
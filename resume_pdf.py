@@ -0,0 +1,142 @@
+import io
+import time
+import threading
+import multiprocessing
+import logging
+import PyPDF2
+
+logger = logging.getLogger(__name__)
+
+
+class PdfExtractionError(Exception):
+    pass
+
+
+def extract_pages(pdf_bytes: bytes, start: int, end: int, max_chars: int) -> tuple:
+    """(page_count, texts of pages start..end), stopping once max_chars are collected."""
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    page_count = len(reader.pages)
+    texts, collected = [], 0
+    for number in range(start, min(end, page_count)):
+        text = reader.pages[number].extract_text() or ''
+        texts.append(text)
+        collected += len(text)
+        if collected >= max_chars:
+            break
+    return page_count, texts
+
+
+def extraction_worker(conn, pdf_bytes: bytes, start: int, end: int, max_chars: int):
+    """Runs in its own process: sends ('ok', (page_count, texts)) or ('error', message) back."""
+    try:
+        conn.send(('ok', extract_pages(pdf_bytes, start, end, max_chars)))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+def process_context():
+    """
+    forkserver where available, else spawn. Forking a multithreaded server worker
+    can copy a lock held by another thread into the child and hang it; a forkserver
+    child is forked from a clean single-threaded server with PyPDF2 preloaded.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['__main__', __name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+class PdfTextExtractor:
+    """
+    Resume PDF text extraction in separate processes, so a large or hostile PDF
+    cannot pin the request thread (or the GIL of the whole worker).
+
+    The first pages_per_task pages are read by one process, which covers
+    typical resumes; longer documents have their remaining pages (up to
+    max_pages) split over at most range_workers processes reading in parallel.
+    Extraction stops once max_chars of text are collected.
+
+    At most max_workers documents are extracted at once; a document waits up
+    to queue_timeout seconds for a slot. Its timeout starts when its first
+    process starts, and a document that runs over has its own processes killed
+    without touching other uploads.
+    """
+
+    def __init__(self, max_workers: int = 2, timeout: float = 10, max_pages: int = 30,
+                 max_chars: int = 20000, queue_timeout: float = 30, pages_per_task: int = 4,
+                 range_workers: int = 2):
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.queue_timeout = queue_timeout
+        self.pages_per_task = pages_per_task
+        self.range_workers = range_workers
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.context = process_context()
+
+    def _start(self, pdf_bytes: bytes, start: int, end: int, max_chars: int) -> tuple:
+        receiver, sender = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=extraction_worker, args=(sender, pdf_bytes, start, end, max_chars), daemon=True
+        )
+        process.start()
+        sender.close()
+        return process, receiver
+
+    def _result(self, receiver, deadline: float) -> tuple:
+        if not receiver.poll(max(0.0, deadline - time.monotonic())):
+            raise PdfExtractionError(f"PDF text extraction took longer than {self.timeout:g}s")
+        try:
+            status, result = receiver.recv()
+        except EOFError:
+            raise PdfExtractionError("PDF text extraction was interrupted")
+        if status != 'ok':
+            raise PdfExtractionError(f"Could not parse PDF: {result}")
+        return result
+
+    def _run(self, pdf_bytes: bytes) -> list:
+        deadline = time.monotonic() + self.timeout
+        first_end = min(self.pages_per_task, self.max_pages)
+        running = [self._start(pdf_bytes, 0, first_end, self.max_chars)]
+        try:
+            page_count, texts = self._result(running[0][1], deadline)
+            page_count = min(page_count, self.max_pages)
+            collected = sum(len(text) for text in texts)
+
+            if collected < self.max_chars and page_count > first_end:
+                remaining_chars = self.max_chars - collected
+                step = -(-(page_count - first_end) // self.range_workers)
+                running += [self._start(pdf_bytes, start, min(start + step, page_count), remaining_chars)
+                            for start in range(first_end, page_count, step)]
+                # Ranges are joined in page order; later ranges are dropped once there is enough text
+                for _, receiver in running[1:]:
+                    _, range_texts = self._result(receiver, deadline)
+                    texts.extend(range_texts)
+                    collected += sum(len(text) for text in range_texts)
+                    if collected >= self.max_chars:
+                        break
+            return texts
+        finally:
+            for process, receiver in running:
+                receiver.close()
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    def extract_text(self, pdf_bytes: bytes) -> str:
+        """Text of the PDF's pages joined by newlines, truncated to max_chars."""
+        if not self.slots.acquire(timeout=self.queue_timeout):
+            raise PdfExtractionError("PDF text extraction is busy, try again shortly")
+        try:
+            texts = self._run(pdf_bytes)
+        except PdfExtractionError:
+            raise
+        except Exception as e:
+            raise PdfExtractionError(f"Could not parse PDF: {e}")
+        finally:
+            self.slots.release()
+
+        return '\n'.join(texts)[:self.max_chars]
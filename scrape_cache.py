@@ -0,0 +1,119 @@
+import time
+import threading
+import concurrent.futures
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def scrape_cache_key(source: str, job_title: str, location: str) -> tuple:
+    """Normalized (source, job_title, location) key"""
+    def normalize(value):
+        return ' '.join((value or '').lower().split())
+    return normalize(source), normalize(job_title), normalize(location)
+
+
+class ScrapeResultCache:
+    """
+    Shared cache of raw scraper results with stale-while-revalidate.
+
+    Fresh hits are served directly. Stale hits (older than the TTL but within
+    the stale window) are served immediately while one background refresh runs.
+    Concurrent misses for the same key are coalesced so only one upstream fetch
+    goes out; the other callers wait for its result.
+    """
+
+    def __init__(self, ttl_seconds: float, stale_seconds: float, empty_ttl_seconds: float,
+                 max_entries: int = 2000, refresh_workers: int = 4):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.empty_ttl_seconds = empty_ttl_seconds
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (fetched_at, jobs)
+        self.inflight = {}  # key -> Future shared by coalesced callers
+        self.lock = threading.Lock()
+        self.refresher = concurrent.futures.ThreadPoolExecutor(max_workers=refresh_workers)
+
+    def _ttl_for(self, jobs: list) -> float:
+        # Empty results are usually blocks or transient errors, so retry them sooner
+        return self.ttl_seconds if jobs else self.empty_ttl_seconds
+
+    def _store(self, key: tuple, jobs: list):
+        with self.lock:
+            self.entries[key] = (time.time(), jobs)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def _fetch(self, key: tuple, fetch, future: concurrent.futures.Future) -> list:
+        """Run the upstream fetch as the leader of a coalesced flight."""
+        try:
+            jobs = fetch()
+            self._store(key, jobs)
+            future.set_result(jobs)
+            return jobs
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.inflight.pop(key, None)
+
+    def _refresh(self, key: tuple, fetch, future: concurrent.futures.Future):
+        try:
+            self._fetch(key, fetch, future)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {key}: {e}")
+
+    def is_warm(self, source: str, job_title: str, location: str) -> bool:
+        """True if get_or_fetch() would not start a new upstream fetch (fresh, stale or in flight)."""
+        key = scrape_cache_key(source, job_title, location)
+        with self.lock:
+            if key in self.inflight:
+                return True
+            entry = self.entries.get(key)
+            if entry is None:
+                return False
+            fetched_at, jobs = entry
+            return time.time() - fetched_at < self._ttl_for(jobs) + self.stale_seconds
+
+    def clear(self):
+        """Drop every cached entry (in-flight fetches are left alone)."""
+        with self.lock:
+            self.entries.clear()
+
+    def get_or_fetch(self, source: str, job_title: str, location: str, fetch) -> list:
+        """Return cached jobs for the key, calling fetch() on a miss."""
+        key = scrape_cache_key(source, job_title, location)
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                fetched_at, jobs = entry
+                age = time.time() - fetched_at
+                ttl = self._ttl_for(jobs)
+
+                if age < ttl:
+                    self.entries.move_to_end(key)
+                    return list(jobs)
+
+                if age < ttl + self.stale_seconds:
+                    if key not in self.inflight:
+                        future = concurrent.futures.Future()
+                        self.inflight[key] = future
+                        self.refresher.submit(self._refresh, key, fetch, future)
+                        logger.info(f"Serving stale {key}, refreshing in background")
+                    return list(jobs)
+
+            future = self.inflight.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self.inflight[key] = future
+
+        if leader:
+            return list(self._fetch(key, fetch, future))
+
+        logger.info(f"Coalescing scrape for {key} with an in-flight request")
+        return list(future.result())
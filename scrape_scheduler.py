@@ -0,0 +1,148 @@
+import threading
+import time
+import concurrent.futures
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Default per-host pacing: (requests per second, burst size)
+DEFAULT_HOST_RATES = {
+    'naukri.com': (1.0, 2),
+    'indeed.com': (1.0, 2),
+    'linkedin.com': (0.5, 1),
+    'jsearch': (2.0, 4)
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace requests to a single host"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def acquire(self, deadline: float = None) -> bool:
+        """Block until a token is available. Returns False if the deadline passes first."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """Keeps one token bucket per host key"""
+
+    def __init__(self, host_rates: dict = None, default_rate: tuple = (1.0, 1)):
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.default_rate = default_rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, host: str) -> TokenBucket:
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.host_rates.get(host, self.default_rate)
+                bucket = TokenBucket(rate, capacity)
+                self.buckets[host] = bucket
+            return bucket
+
+    def acquire(self, host: str, deadline: float = None) -> bool:
+        return self.bucket_for(host).acquire(deadline)
+
+
+class ScrapeScheduler:
+    """
+    Runs scrape tasks concurrently with per-host rate limits and an overall deadline.
+
+    Every caller's tasks share one executor of max_workers threads, so the
+    thread count stays bounded however many searches (and speculative
+    scrapes) run at once. Tasks still queued when their deadline passes are
+    dropped without running.
+    """
+
+    def __init__(self, max_workers: int = 8, rate_limiter: HostRateLimiter = None):
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        # Threads are only started on submit, so creating the pool before a fork is safe
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrape')
+
+    def _run_task(self, task: dict, deadline: float):
+        if deadline is not None and time.monotonic() >= deadline:
+            return []
+        # Tasks served from a cache or an in-flight fetch don't hit the host, so skip the pacing
+        if task.get('rate_limited', True) and not self.rate_limiter.acquire(task['host'], deadline):
+            logger.warning(f"Skipping {task['name']} for '{task['title']}': deadline reached while rate limited")
+            return []
+        return task['func'](*task.get('args', ()))
+
+    def _run_background_task(self, task: dict, deadline: float):
+        try:
+            self._run_task(task, deadline)
+        except Exception as e:
+            logger.error(f"Error processing {task['name']} for '{task['title']}' in the background: {e}")
+
+    def start(self, tasks: list, timeout: float = None):
+        """Run every task in the background without waiting; for tasks that fill a shared cache."""
+        if not tasks:
+            return
+
+        deadline = time.monotonic() + timeout if timeout else None
+        for task in tasks:
+            self.executor.submit(self._run_background_task, task, deadline)
+
+    def iter_completed(self, tasks: list, timeout: float = None):
+        """
+        Run every task and yield (task, result) pairs as each one finishes.
+
+        Each task is a dict with 'name', 'title', 'host', 'func' and 'args'.
+        Tasks that fail or do not finish before the timeout are left out, so
+        callers always get whatever partial results were ready in time.
+        """
+        if not tasks:
+            return
+
+        deadline = time.monotonic() + timeout if timeout else None
+        futures = {self.executor.submit(self._run_task, task, deadline): task for task in tasks}
+        finished = 0
+
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=timeout):
+                finished += 1
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {task['name']} for '{task['title']}': {e}")
+                    continue
+                yield task, result
+        except concurrent.futures.TimeoutError:
+            logger.warning(f"Scrape deadline of {timeout}s reached, returning partial results "
+                           f"({finished}/{len(futures)} tasks finished)")
+        finally:
+            # Never block the request on stragglers; running ones finish in the background
+            for future in futures:
+                future.cancel()
+
+    def run(self, tasks: list, timeout: float = None) -> list:
+        """Run every task and return the (task, result) pairs that finished in time, in task order."""
+        order = {id(task): index for index, task in enumerate(tasks)}
+        results = list(self.iter_completed(tasks, timeout))
+        results.sort(key=lambda pair: order[id(pair[0])])
+        return results
@@ -0,0 +1,186 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import concurrent.futures
+import logging
+from job_record import json_default
+
+logger = logging.getLogger(__name__)
+
+SEARCH_STAGES = ("analysis", "discovery", "enrichment")
+
+
+class SearchQueueFull(Exception):
+    """Raised when the background executor already has its maximum of pending searches."""
+
+
+class SearchStore:
+    """
+    SQLite-backed search records, so a poll handled by any gunicorn worker
+    sees the state written by the worker that runs the search.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS searches (
+                    search_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    expires_at REAL
+                )
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def save(self, record: dict, expires_at: float = None):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO searches (search_id, status, payload, updated_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (record['search_id'], record['status'], json.dumps(record, default=json_default), time.time(), expires_at)
+            )
+
+    def load(self, search_id: str) -> dict:
+        row = self._connection().execute(
+            "SELECT payload, expires_at FROM searches WHERE search_id = ?", (search_id,)
+        ).fetchone()
+        if not row:
+            return None
+        payload, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return json.loads(payload)
+
+    def purge_expired(self) -> int:
+        with self._connection() as conn:
+            return conn.execute(
+                "DELETE FROM searches WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            ).rowcount
+
+
+class SearchJobManager:
+    """
+    Runs search pipelines on a bounded background executor and tracks their progress.
+
+    `run_events` is a generator function yielding the same events as the
+    streaming endpoint (stage / profile / jobs / enrichment / done / error);
+    the manager folds them into a record with per-stage progress and results.
+    """
+
+    def __init__(self, store: SearchStore, max_workers: int = 4, max_pending: int = 32,
+                 retention_seconds: float = 3600):
+        self.store = store
+        self.retention_seconds = retention_seconds
+        self.max_pending = max_pending
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+        self.pending = 0
+        self.lock = threading.Lock()
+
+    def submit(self, run_events, *args) -> str:
+        """Queue a search and return its id immediately."""
+        with self.lock:
+            if self.pending >= self.max_pending:
+                raise SearchQueueFull("Too many searches in progress, please retry shortly")
+            self.pending += 1
+
+        search_id = uuid.uuid4().hex
+        now = time.time()
+        record = {
+            'search_id': search_id,
+            'status': 'queued',
+            'created_at': now,
+            'finished_at': None,
+            'stages': {stage: {'status': 'pending'} for stage in SEARCH_STAGES},
+            'profile': None,
+            'results': [],
+            'error': None
+        }
+        self.store.save(record)
+        self.executor.submit(self._run, record, run_events, args)
+        self.store.purge_expired()
+        return search_id
+
+    def get(self, search_id: str) -> dict:
+        return self.store.load(search_id)
+
+    def _start_stage(self, record: dict, stage: str):
+        for name in SEARCH_STAGES:
+            if name == stage:
+                break
+            if record['stages'][name]['status'] == 'running':
+                record['stages'][name]['status'] = 'done'
+        record['stages'][stage]['status'] = 'running'
+
+    def _apply_event(self, record: dict, event: dict, jobs_by_id: dict):
+        event_type = event.get('type')
+        stages = record['stages']
+
+        if event_type == 'stage':
+            self._start_stage(record, event['stage'])
+        elif event_type == 'profile':
+            record['profile'] = event.get('experience_data')
+        elif event_type == 'jobs':
+            for job_id, score in event.get('scores', {}).items():
+                if job_id in jobs_by_id:
+                    jobs_by_id[job_id]['match_score'] = score
+            for job in event.get('jobs', []):
+                jobs_by_id[job.get('job_id')] = job
+            discovery = stages['discovery']
+            discovery['sources_completed'] = discovery.get('sources_completed', 0) + 1
+            discovery['jobs_found'] = len(jobs_by_id)
+        elif event_type == 'enrichment':
+            for patch in event.get('patches', []):
+                job = jobs_by_id.get(patch.get('job_id'))
+                if job:
+                    job.update(patch)
+            enrichment = stages['enrichment']
+            enrichment['companies_completed'] = enrichment.get('companies_completed', 0) + 1
+        elif event_type == 'done':
+            record['status'] = 'completed'
+        elif event_type == 'error':
+            record['status'] = 'failed'
+            record['error'] = {'message': event.get('error'), 'status': event.get('status', 500)}
+
+        record['results'] = sorted(jobs_by_id.values(), key=lambda job: job.get('match_score', 0), reverse=True)
+
+    def _run(self, record: dict, run_events, args):
+        jobs_by_id = {}
+        try:
+            record['status'] = 'running'
+            self.store.save(record)
+
+            for event in run_events(*args):
+                self._apply_event(record, event, jobs_by_id)
+                self.store.save(record)
+
+            if record['status'] == 'running':
+                record['status'] = 'completed'
+        except Exception as e:
+            logger.error(f"Search {record['search_id']} failed: {e}")
+            record['status'] = 'failed'
+            record['error'] = {'message': "An unexpected error occurred. Please try again.", 'status': 500}
+        finally:
+            for stage in record['stages'].values():
+                if stage['status'] == 'running':
+                    stage['status'] = 'done' if record['status'] == 'completed' else 'failed'
+            record['finished_at'] = time.time()
+            self.store.save(record, expires_at=record['finished_at'] + self.retention_seconds)
+            with self.lock:
+                self.pending -= 1
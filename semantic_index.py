@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+LSA semantic model and random-projection LSH index for job matching.
+
+The model is a TF-IDF vectorizer plus a truncated SVD fitted offline on the
+job-description corpus (the local job index), so related terms ("Django",
+"Python backend") land close together in a dense space. SemanticJobIndex adds
+random-hyperplane LSH tables over the job embeddings for approximate top-k
+retrieval, re-ranked with exact cosine. Everything runs on CPU with NumPy.
+
+    python semantic_index.py                  # fit on the job index and save
+    python semantic_index.py --components 192
+"""
+
+import os
+import argparse
+import logging
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from tfidf_model import build_vectorizer, vectorizer_arrays, vectorizer_from_arrays, save_arrays, ModelStore
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class LsaModel:
+    """TF-IDF -> truncated SVD projection; embeddings are L2-normalized float32 rows."""
+
+    def __init__(self, vectorizer, components: np.ndarray):
+        self.vectorizer = vectorizer
+        self.components = components.astype(np.float32)
+        # Contiguous (terms x components) so sparse @ dense does not copy it per call
+        self.projection = np.ascontiguousarray(self.components.T)
+
+    @classmethod
+    def fit(cls, corpus: list, n_components: int = 128, max_features: int = 50000, seed: int = 0):
+        vectorizer = build_vectorizer(max_features=max_features, min_df=2)
+        tfidf_matrix = vectorizer.fit_transform(corpus)
+        n_components = min(n_components, tfidf_matrix.shape[1] - 1)
+        svd = TruncatedSVD(n_components=n_components, algorithm='randomized', random_state=seed)
+        svd.fit(tfidf_matrix)
+        return cls(vectorizer, svd.components_)
+
+    def embed(self, texts: list) -> np.ndarray:
+        # Cast the (small) sparse rows, not the projection, to keep float32 without copies
+        projected = self.vectorizer.transform(texts).astype(np.float32) @ self.projection
+        return normalize_rows(np.asarray(projected, dtype=np.float32))
+
+    def similarity(self, query: str, texts: list) -> list:
+        """Cosine similarity in LSA space between the query and each text (negatives clipped to 0)."""
+        if not query or not texts:
+            return [0.0] * len(texts)
+        query_vector = self.embed([query])[0]
+        return np.clip(self.embed(texts) @ query_vector, 0.0, 1.0).tolist()
+
+    def save(self, path: str, corpus_size: int):
+        save_arrays(path, dict(vectorizer_arrays(self.vectorizer, corpus_size), components=self.components))
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(vectorizer_from_arrays(data), data['components'])
+
+
+class RandomProjectionLsh:
+    """
+    Random-hyperplane LSH for cosine similarity: each table hashes a vector to
+    the sign pattern of `n_bits` projections. Buckets are stored as sorted
+    signature arrays so lookups are binary searches; queries also probe the
+    buckets one bit-flip away (multi-probe) to raise recall with fewer tables.
+    """
+
+    def __init__(self, dimensions: int, n_tables: int = 8, n_bits: int = 12, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((n_tables, n_bits, dimensions)).astype(np.float32)
+        self.bit_values = (1 << np.arange(n_bits)).astype(np.int64)
+        self.sorted_signatures = []
+        self.sorted_ids = []
+
+    def _signatures(self, vectors: np.ndarray, table: int) -> np.ndarray:
+        return ((vectors @ self.planes[table].T) > 0).astype(np.int64) @ self.bit_values
+
+    def build(self, vectors: np.ndarray):
+        self.num_vectors = len(vectors)
+        self.sorted_signatures, self.sorted_ids = [], []
+        for table in range(len(self.planes)):
+            signatures = self._signatures(vectors, table)
+            order = np.argsort(signatures, kind='stable')
+            self.sorted_signatures.append(signatures[order])
+            self.sorted_ids.append(order.astype(np.int32))
+        return self
+
+    def candidates(self, vector: np.ndarray, multi_probe: bool = True) -> np.ndarray:
+        found = np.zeros(self.num_vectors, dtype=bool)
+        for table in range(len(self.planes)):
+            signature = int(self._signatures(vector[None, :], table)[0])
+            probes = np.array([signature], dtype=np.int64)
+            if multi_probe:
+                probes = np.concatenate((probes, signature ^ self.bit_values))
+            starts = np.searchsorted(self.sorted_signatures[table], probes, side='left')
+            ends = np.searchsorted(self.sorted_signatures[table], probes, side='right')
+            for start, end in zip(starts, ends):
+                found[self.sorted_ids[table][start:end]] = True
+        return np.flatnonzero(found)
+
+
+class SemanticJobIndex:
+    """
+    LSA embeddings of a job pool with LSH retrieval; search() matches BM25Index.search().
+
+    Pools smaller than min_lsh_docs get no LSH tables and are searched by exact
+    cosine: in bench_semantic_index.py, 8 tables x 12 bits only beat the exact
+    scan clearly at 1M jobs (51 vs 25 q/s, recall@10 0.81); at 100k it was
+    448 vs 392 q/s with recall@10 0.72, and slower at 10k.
+    """
+
+    def __init__(self, model: LsaModel, n_tables: int = 8, n_bits: int = 12, seed: int = 0,
+                 min_lsh_docs: int = 500000):
+        self.model = model
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.seed = seed
+        self.min_lsh_docs = min_lsh_docs
+        self.vectors = None
+        self.lsh = None
+
+    def build(self, documents, batch_size: int = 5000):
+        documents = list(documents)
+        batches = [self.model.embed(documents[start:start + batch_size])
+                   for start in range(0, len(documents), batch_size)]
+        dimensions = self.model.components.shape[0]
+        self.vectors = np.vstack(batches) if batches else np.zeros((0, dimensions), dtype=np.float32)
+        if self.n_tables > 0 and len(self.vectors) >= self.min_lsh_docs:
+            self.lsh = RandomProjectionLsh(dimensions, self.n_tables, self.n_bits, self.seed).build(self.vectors)
+        return self
+
+    def search(self, query: str, k: int = 300, exact: bool = False) -> list:
+        """Top-k (doc_id, cosine) pairs, best first; exact=True (or no LSH tables) scans every vector."""
+        if self.vectors is None or not len(self.vectors) or k <= 0:
+            return []
+
+        query_vector = self.model.embed([query])[0]
+        if exact or self.lsh is None:
+            candidates = np.arange(len(self.vectors))
+            scores = self.vectors @ query_vector
+        else:
+            candidates = self.lsh.candidates(query_vector)
+            if not len(candidates):
+                return []
+            scores = self.vectors[candidates] @ query_vector
+        k = min(k, len(candidates))
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(int(candidates[index]), float(scores[index])) for index in top]
+
+
+class SemanticModelStore(ModelStore):
+    def __init__(self, path: str):
+        super().__init__(path, LsaModel.load)
+
+
+def main():
+    from dotenv import load_dotenv
+    from job_index import JobIndex
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Fit the LSA semantic model on the local job index")
+    parser.add_argument('--components', type=int, default=int(os.getenv("SEMANTIC_MODEL_COMPONENTS", "128")))
+    parser.add_argument('--min-docs', type=int, default=int(os.getenv("SEMANTIC_MODEL_MIN_DOCS", "500")))
+    args = parser.parse_args()
+
+    index = JobIndex(os.getenv("JOB_INDEX_PATH", os.path.join("cache", "job_index.db")))
+    model_path = os.getenv("SEMANTIC_MODEL_PATH", os.path.join("cache", "semantic_model.npz"))
+
+    corpus = [description for description in index.iter_descriptions() if description]
+    if len(corpus) < args.min_docs:
+        logger.warning(f"Only {len(corpus)} job descriptions indexed (need {args.min_docs}), not saving a model")
+        return
+
+    model = LsaModel.fit(corpus, n_components=args.components)
+    model.save(model_path, len(corpus))
+    logger.info(f"Saved LSA model with {model.components.shape[0]} components fitted on {len(corpus)} jobs to {model_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,11 @@ const resultsFilters = document.getElementById('results-filters');
 const dateFilterOptions = document.getElementById('date-filter-options');
 const statsSection = document.getElementById('stats-section');
 const statsGrid = document.getElementById('stats-grid');
+const resultsControls = document.getElementById('results-controls');
+const resultsDate = document.getElementById('results-date');
+const resultsSource = document.getElementById('results-source');
+const resultsMinScore = document.getElementById('results-min-score');
+const resultsSort = document.getElementById('results-sort');
 
 // Action buttons
 const saveJobsBtn = document.getElementById('save-jobs-btn');
@@ -26,6 +31,15 @@ let currentLocationFilter = 'India';
 let currentJobs = [];
 let currentResumeInfo = null;
 
+// Server-side result session of the current search (null for jobs loaded from browser storage)
+let currentSessionId = null;
+// Session announced by a running stream, used once the stream is done
+let streamSessionId = null;
+let totalJobs = 0;
+let pageRequestId = 0;
+
+const defaultLoadingText = loadingSection.querySelector('p').textContent;
+
 // Pagination variables
 let currentPage = 1;
 let jobsPerPage = 12;
@@ -71,6 +85,10 @@ dateFilterOptions.addEventListener('click', (e) => {
         
         // Update current filter
         currentDateFilter = e.target.dataset.value;
+        resultsDate.value = currentDateFilter;
+
+        // An existing search is re-filtered server-side, no new scrape needed
+        if (currentSessionId) reloadResults();
     }
 });
 
@@ -91,6 +109,22 @@ locationFilterOptions.addEventListener('click', (e) => {
     }
 });
 
+// Result controls re-query the current result session
+resultsDate.addEventListener('change', () => {
+    setDateFilter(resultsDate.value);
+    reloadResults();
+});
+[resultsSource, resultsMinScore, resultsSort].forEach(control => {
+    control.addEventListener('change', reloadResults);
+});
+
+function setDateFilter(value) {
+    currentDateFilter = value;
+    dateFilterOptions.querySelectorAll('.filter-option').forEach(option => {
+        option.classList.toggle('active', option.dataset.value === value);
+    });
+}
+
 // Action button event listeners
 saveJobsBtn.addEventListener('click', saveJobs);
 loadSavedBtn.addEventListener('click', loadSavedJobs);
@@ -206,6 +240,20 @@ submitBtn.addEventListener('click', async function(event) {
             formData.append('date_filter', currentDateFilter);
         formData.append('location_filter', currentLocationFilter);
 
+    currentResumeInfo = {
+        filename: file.name,
+        size: file.size,
+        date_filter: currentDateFilter,
+        location_filter: currentLocationFilter,
+        search_date: new Date().toISOString()
+    };
+
+    // Stream results incrementally when the browser supports it
+    if (window.ReadableStream && window.TextDecoder) {
+        await streamJobs(formData);
+        return;
+    }
+
     try {
         const response = await fetch('/find-jobs', {
             method: 'POST',
@@ -220,23 +268,16 @@ submitBtn.addEventListener('click', async function(event) {
             return;
         }
 
-        const jobs = await response.json();
+        const data = await response.json();
 
-        if (jobs.length === 0) {
+        if (data.total === 0) {
             showNoResults();
             return;
         }
 
-        currentJobs = jobs;
-        currentResumeInfo = {
-            filename: file.name,
-            size: file.size,
-            date_filter: currentDateFilter,
-        location_filter: currentLocationFilter,
-            search_date: new Date().toISOString()
-        };
-        
-        displayJobs(jobs);
+        currentSessionId = data.session_id;
+        resetResultsControls();
+        showResultsPage(data);
 
     } catch (error) {
         hideLoading();
@@ -245,15 +286,228 @@ submitBtn.addEventListener('click', async function(event) {
     }
 });
 
-function saveJobs() {
-    if (currentJobs.length === 0) {
+// Streaming search: newline-delimited JSON events from /find-jobs/stream
+async function streamJobs(formData) {
+    currentJobs = [];
+    currentSessionId = null;
+    streamSessionId = null;
+    resetResultsControls();
+    let receivedJobs = false;
+    loadingSection.querySelector('p').textContent = defaultLoadingText;
+
+    try {
+        const response = await fetch('/find-jobs/stream', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (!response.ok) {
+            hideLoading();
+            const errorData = await response.json();
+            showError(errorData.error || 'Something went wrong. Please try again.');
+            return;
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+
+            for (const line of lines) {
+                if (!line.trim()) continue;
+                receivedJobs = handleStreamEvent(JSON.parse(line), receivedJobs);
+            }
+        }
+
+        if (buffer.trim()) {
+            receivedJobs = handleStreamEvent(JSON.parse(buffer), receivedJobs);
+        }
+    } catch (error) {
+        showError('Network error. Please check your connection and try again.');
+        console.error('Stream error:', error);
+    } finally {
+        hideLoading();
+    }
+}
+
+function handleStreamEvent(event, receivedJobs) {
+    switch (event.type) {
+        case 'session':
+            // The session is complete once the stream is done; until then pages are sliced from the streamed cards
+            streamSessionId = event.session_id;
+            return receivedJobs;
+        case 'profile': {
+            const profile = event.experience_data || {};
+            const loadingText = loadingSection.querySelector('p');
+            loadingText.textContent = `Profile: ${profile.experience_level || 'entry'} level, ${(profile.skills || []).length} skills. Searching job boards...`;
+            return receivedJobs;
+        }
+        case 'jobs': {
+            // Update scores of jobs we already have, then add the new batch's cards
+            const scores = event.scores || {};
+            currentJobs.forEach(job => {
+                if (scores[job.job_id] !== undefined) job.match_score = scores[job.job_id];
+            });
+            currentJobs = currentJobs.concat(event.jobs || []);
+            currentJobs.sort((a, b) => (b.match_score || 0) - (a.match_score || 0));
+            if (!currentJobs.length) return receivedJobs;
+
+            if (!receivedJobs) {
+                hideLoading();
+                displayJobs(currentJobs);
+            } else {
+                refreshJobs(currentJobs);
+            }
+            return true;
+        }
+        case 'enrichment': {
+            const patches = {};
+            (event.patches || []).forEach(patch => { patches[patch.job_id] = patch; });
+            currentJobs.forEach(job => {
+                if (patches[job.job_id]) Object.assign(job, patches[job.job_id]);
+            });
+            refreshJobs(currentJobs);
+            return receivedJobs;
+        }
+        case 'error':
+            hideLoading();
+            if (event.status === 404 && !receivedJobs) {
+                showNoResults();
+            } else {
+                showError(event.error || 'Something went wrong. Please try again.');
+            }
+            return receivedJobs;
+        case 'done':
+            if (!receivedJobs) {
+                showNoResults();
+            } else if (streamSessionId) {
+                // The full ranked list is stored now: page, filter and sort it server-side
+                currentSessionId = streamSessionId;
+                loadResultsPage(currentPage);
+            }
+            return receivedJobs;
+        default:
+            return receivedJobs;
+    }
+}
+
+function refreshJobs(jobs) {
+    resultsCount.textContent = `Found ${jobs.length} job${jobs.length !== 1 ? 's' : ''} for you`;
+    updateStatistics(computeStatistics(jobs));
+    totalJobs = jobs.length;
+    totalPages = Math.ceil(jobs.length / jobsPerPage);
+    currentPage = Math.min(currentPage, Math.max(1, totalPages));
+    displayPaginatedJobs(jobs);
+}
+
+// Fetch one page of the current result session with the selected filters and sort order
+async function loadResultsPage(page) {
+    const requestId = ++pageRequestId;
+    try {
+        const response = await fetch(resultsUrl(page, jobsPerPage));
+        const data = await response.json();
+
+        // A newer page request (or a new search) superseded this one
+        if (requestId !== pageRequestId) return;
+
+        if (!response.ok) {
+            showError(data.error || 'Could not load results. Please try again.');
+            return;
+        }
+        showResultsPage(data);
+    } catch (error) {
+        if (requestId === pageRequestId) {
+            showError('Network error. Please check your connection and try again.');
+        }
+        console.error('Results page error:', error);
+    }
+}
+
+function resultsUrl(page, pageSize) {
+    const params = new URLSearchParams({
+        page: page,
+        page_size: pageSize,
+        date_filter: currentDateFilter,
+        sort: resultsSort.value
+    });
+    if (resultsSource.value) params.append('source', resultsSource.value);
+    if (resultsMinScore.value) params.append('min_score', resultsMinScore.value);
+    return `/results/${currentSessionId}?${params}`;
+}
+
+function reloadResults() {
+    if (!currentSessionId) return;
+    currentPage = 1;
+    loadResultsPage(1);
+}
+
+function resetResultsControls() {
+    resultsDate.value = currentDateFilter;
+    resultsSource.value = '';
+    resultsMinScore.value = '';
+    resultsSort.value = 'score';
+}
+
+function showResultsPage(data) {
+    currentJobs = data.jobs;
+    currentPage = data.page;
+    totalPages = data.total_pages;
+    totalJobs = data.total;
+
+    resultsCount.textContent = `Found ${totalJobs} job${totalJobs !== 1 ? 's' : ''} for you`;
+    updateResultsFilters();
+    updateSourceOptions(data.stats.sources);
+    updateStatistics(data.stats);
+    resultsControls.style.display = 'flex';
+
+    renderJobCards(currentJobs);
+    updatePaginationControls();
+    showResults();
+}
+
+function updateSourceOptions(sources) {
+    const selected = resultsSource.value;
+    resultsSource.innerHTML = '<option value="">All Sources</option>';
+    Object.keys(sources).sort().forEach(source => {
+        const option = document.createElement('option');
+        option.value = source;
+        option.textContent = `${source} (${sources[source]})`;
+        resultsSource.appendChild(option);
+    });
+    resultsSource.value = sources[selected] !== undefined ? selected : '';
+}
+
+// Every job of the result session (with the current filters), page by page
+async function fetchAllSessionJobs() {
+    // Full records, so saved and exported jobs keep descriptions and apply links
+    const pageSize = 100;
+    let jobs = [];
+    for (let page = 1; ; page++) {
+        const response = await fetch(`${resultsUrl(page, pageSize)}&full=true`);
+        const data = await response.json();
+        if (!response.ok) throw new Error(data.error || 'Could not load results');
+        jobs = jobs.concat(data.jobs);
+        if (page >= data.total_pages) return jobs;
+    }
+}
+
+async function saveJobs() {
+    if (totalJobs === 0) {
         showError('No jobs to save. Please search for jobs first.');
         return;
     }
 
     try {
+        const jobs = currentSessionId ? await fetchAllSessionJobs() : currentJobs;
         const savedData = {
-            jobs: currentJobs,
+            jobs: jobs,
             resume_info: currentResumeInfo,
             last_updated: new Date().toISOString(),
             version: '1.0' // For future compatibility
@@ -262,10 +516,10 @@ function saveJobs() {
         // Save to localStorage
         localStorage.setItem('ai_job_finder_saved_jobs', JSON.stringify(savedData));
         
-        showSavedStatus(`Successfully saved ${currentJobs.length} jobs to your browser storage`);
+        showSavedStatus(`Successfully saved ${jobs.length} jobs to your browser storage`);
         
         // Update the saved jobs info display
-        showSavedJobsInfo(currentJobs.length, savedData.last_updated);
+        showSavedJobsInfo(jobs.length, savedData.last_updated);
         
     } catch (error) {
         if (error.name === 'QuotaExceededError') {
@@ -292,6 +546,7 @@ function loadSavedJobs() {
         if (savedData.jobs && savedData.jobs.length > 0) {
             currentJobs = savedData.jobs;
             currentResumeInfo = savedData.resume_info;
+            currentSessionId = null;
             
             // Reset to first page when loading saved jobs
             currentPage = 1;
@@ -329,6 +584,9 @@ function startNewSearch() {
     fileInput.value = '';
     currentJobs = [];
     currentResumeInfo = null;
+    currentSessionId = null;
+    totalJobs = 0;
+    pageRequestId++;
     
     // Reset pagination
     currentPage = 1;
@@ -452,18 +710,21 @@ function getSavedJobsStorageInfo() {
     }
 }
 
+// Client-side display of a full job list (jobs loaded from browser storage)
 function displayJobs(jobs) {
     // Update results count
     resultsCount.textContent = `Found ${jobs.length} job${jobs.length !== 1 ? 's' : ''} for you`;
     
     // Update filters display
     updateResultsFilters();
+    resultsControls.style.display = 'none';
     
     // Update statistics
-    updateStatistics(jobs);
+    updateStatistics(computeStatistics(jobs));
     
     // Initialize pagination
     currentPage = 1;
+    totalJobs = jobs.length;
     totalPages = Math.ceil(jobs.length / jobsPerPage);
     
     // Display paginated jobs
@@ -474,22 +735,34 @@ function displayJobs(jobs) {
 }
 
 function displayPaginatedJobs(jobs) {
-    // Clear previous results
-    jobsGrid.innerHTML = '';
-    
     // Calculate start and end indices for current page
     const startIndex = (currentPage - 1) * jobsPerPage;
     const endIndex = startIndex + jobsPerPage;
-    const jobsToShow = jobs.slice(startIndex, endIndex);
+    renderJobCards(jobs.slice(startIndex, endIndex));
     
-    // Create job cards for current page
-    jobsToShow.forEach(job => {
+    // Update pagination controls
+    updatePaginationControls();
+}
+
+function renderJobCards(jobs) {
+    // Clear previous results
+    jobsGrid.innerHTML = '';
+    
+    jobs.forEach(job => {
         const jobCard = createJobCard(job);
         jobsGrid.appendChild(jobCard);
     });
-    
-    // Update pagination controls
-    updatePaginationControls();
+}
+
+// Server-side pages for a result session, slices of the full list otherwise
+function goToPage(pageNumber) {
+    currentPage = pageNumber;
+    if (currentSessionId) {
+        loadResultsPage(pageNumber);
+    } else {
+        displayPaginatedJobs(currentJobs);
+    }
+    scrollToResults();
 }
 
 function updatePaginationControls() {
@@ -513,8 +786,8 @@ function updatePaginationControls() {
     const paginationInfo = document.createElement('div');
     paginationInfo.className = 'pagination-info';
     const startJob = (currentPage - 1) * jobsPerPage + 1;
-    const endJob = Math.min(currentPage * jobsPerPage, currentJobs.length);
-    paginationInfo.textContent = `Showing ${startJob}-${endJob} of ${currentJobs.length} jobs`;
+    const endJob = Math.min(currentPage * jobsPerPage, totalJobs);
+    paginationInfo.textContent = `Showing ${startJob}-${endJob} of ${totalJobs} jobs`;
     
     // Create pagination buttons container
     const paginationButtons = document.createElement('div');
@@ -527,9 +800,7 @@ function updatePaginationControls() {
     prevButton.disabled = currentPage === 1;
     prevButton.addEventListener('click', () => {
         if (currentPage > 1) {
-            currentPage--;
-            displayPaginatedJobs(currentJobs);
-            scrollToResults();
+            goToPage(currentPage - 1);
         }
     });
     
@@ -588,9 +859,7 @@ function updatePaginationControls() {
     nextButton.disabled = currentPage === totalPages;
     nextButton.addEventListener('click', () => {
         if (currentPage < totalPages) {
-            currentPage++;
-            displayPaginatedJobs(currentJobs);
-            scrollToResults();
+            goToPage(currentPage + 1);
         }
     });
     
@@ -612,9 +881,7 @@ function createPageButton(pageNumber) {
     button.className = `page-btn ${pageNumber === currentPage ? 'active' : ''}`;
     button.textContent = pageNumber;
     button.addEventListener('click', () => {
-        currentPage = pageNumber;
-        displayPaginatedJobs(currentJobs);
-        scrollToResults();
+        goToPage(pageNumber);
     });
     return button;
 }
@@ -624,15 +891,31 @@ function scrollToResults() {
     resultsSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
 }
 
-function updateStatistics(jobs) {
+// Same shape as the stats returned with each result session page
+function computeStatistics(jobs) {
+    const sources = {};
+    jobs.forEach(job => {
+        const source = job.source || 'Unknown';
+        sources[source] = (sources[source] || 0) + 1;
+    });
+    return {
+        total: jobs.length,
+        direct_apply: jobs.filter(job => job.has_direct_apply).length,
+        avg_score: jobs.length > 0 ? Math.round(jobs.reduce((sum, job) => sum + (job.match_score || 0), 0) / jobs.length) : 0,
+        sources: sources
+    };
+}
+
+function updateStatistics(summary) {
+    const sources = summary.sources || {};
     const stats = {
-        totalJobs: jobs.length,
-        directApply: jobs.filter(job => job.has_direct_apply).length,
-        linkedinJobs: jobs.filter(job => job.source === 'LinkedIn').length,
-        indeedJobs: jobs.filter(job => job.source === 'Indeed').length,
-        jsearchJobs: jobs.filter(job => job.source === 'JSearch API').length,
-        naukriJobs: jobs.filter(job => job.source === 'Naukri').length,
-        avgScore: jobs.length > 0 ? Math.round(jobs.reduce((sum, job) => sum + (job.match_score || 0), 0) / jobs.length) : 0
+        totalJobs: summary.total,
+        directApply: summary.direct_apply,
+        linkedinJobs: sources['LinkedIn'] || 0,
+        indeedJobs: sources['Indeed'] || 0,
+        jsearchJobs: sources['JSearch API'] || 0,
+        naukriJobs: sources['Naukri'] || 0,
+        avgScore: summary.avg_score
     };
 
     statsGrid.innerHTML = `
@@ -745,11 +1028,12 @@ function createJobCard(job) {
 
     jobCard.appendChild(metaRow);
 
-    // Description
-    if (job.description) {
+    // Description (result pages carry a snippet; the full text is loaded with the details)
+    const descriptionText = job.snippet || job.description;
+    if (descriptionText) {
         const description = document.createElement('div');
         description.className = 'job-description';
-        description.textContent = job.description;
+        description.textContent = descriptionText;
         jobCard.appendChild(description);
     }
 
@@ -775,9 +1059,10 @@ function createJobCard(job) {
     applyBtn.innerHTML = '<i class="fas fa-external-link-alt"></i> Apply';
     applyBtn.target = '_blank';
 
-    // Check if apply link exists
-    if (job.apply_options && job.apply_options.length > 0 && job.apply_options[0].link) {
-        applyBtn.href = job.apply_options[0].link;
+    // Check if apply link exists (compact records carry apply_url, saved full records apply_options)
+    const applyUrl = job.apply_url || (job.apply_options && job.apply_options.length > 0 && job.apply_options[0].link);
+    if (applyUrl) {
+        applyBtn.href = applyUrl;
         applyBtn.title = 'Apply for this position';
     } else {
         // No apply link available
@@ -790,11 +1075,12 @@ function createJobCard(job) {
     actions.appendChild(applyBtn);
 
     // Direct Apply button (if available)
-    if (job.has_direct_apply && job.apply_links && job.apply_links.length > 0) {
+    const directApplyUrl = job.direct_apply_url || (job.apply_links && job.apply_links.length > 0 && job.apply_links[0].url);
+    if (job.has_direct_apply && directApplyUrl) {
         const directApplyBtn = document.createElement('a');
         directApplyBtn.className = 'btn btn-success';
         directApplyBtn.innerHTML = '<i class="fas fa-rocket"></i> Direct';
-        directApplyBtn.href = job.apply_links[0].url;
+        directApplyBtn.href = directApplyUrl;
         directApplyBtn.target = '_blank';
         directApplyBtn.title = 'Apply directly on company website';
         actions.appendChild(directApplyBtn);
@@ -811,6 +1097,14 @@ function createJobCard(job) {
         actions.appendChild(careerBtn);
     }
 
+    // Details button (full record fetched on demand)
+    const detailsBtn = document.createElement('button');
+    detailsBtn.className = 'btn btn-secondary';
+    detailsBtn.innerHTML = '<i class="fas fa-info-circle"></i> Details';
+    detailsBtn.title = 'Show full job details';
+    detailsBtn.addEventListener('click', () => showJobDetails(job));
+    actions.appendChild(detailsBtn);
+
     footer.appendChild(actions);
     jobCard.appendChild(footer);
 
@@ -874,7 +1168,21 @@ function formatPostedDate(dateStr) {
     }
 }
 
-function showJobDetails(job) {
+// Full job record from the server; falls back to the card data (e.g. saved jobs whose session expired)
+async function fetchJobDetails(job) {
+    if (!job.job_id || !currentSessionId) return job;
+    try {
+        const response = await fetch(`/results/${encodeURIComponent(currentSessionId)}/jobs/${encodeURIComponent(job.job_id)}`);
+        if (response.ok) return await response.json();
+    } catch (error) {
+        console.error('Job details error:', error);
+    }
+    return job;
+}
+
+async function showJobDetails(cardJob) {
+    const job = await fetchJobDetails(cardJob);
+
     // Create a modal or expand the card to show more details
     const details = [];
     
@@ -884,6 +1192,7 @@ function showJobDetails(job) {
     if (job.job_type) details.push(`Type: ${job.job_type}`);
     if (job.source) details.push(`Source: ${job.source}`);
     if (job.career_page) details.push(`Career Page: ${job.career_page}`);
+    if (job.description) details.push(`\nDescription:\n${job.description}\n`);
     
     if (job.related_links && job.related_links.length > 0) {
         details.push('Related Links:');
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Pre-fitted TF-IDF model store.
+
+The vectorizer is fitted offline on the accumulated job-description corpus
+(the local job index) and saved as vocabulary + idf. Web workers load it once
+and only call transform() per request; without a saved model the caller falls
+back to fitting on the request's own documents.
+
+    python tfidf_model.py                  # refit from the job index and save
+    python tfidf_model.py --min-docs 500   # refuse to save if the corpus is smaller
+"""
+
+import os
+import json
+import argparse
+import threading
+import logging
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+logger = logging.getLogger(__name__)
+
+# Include tech terms like C++, C#, .NET
+TFIDF_TOKEN_PATTERN = r'\b[a-zA-Z][a-zA-Z0-9+#\.]*\b'
+
+# Shared by the offline fit and the per-request fallback so both tokenize identically
+TFIDF_PARAMS = {
+    'stop_words': 'english',
+    'ngram_range': (1, 2),
+    'lowercase': True,
+    'token_pattern': TFIDF_TOKEN_PATTERN
+}
+
+
+def build_vectorizer(max_features: int = 5000, min_df=1, max_df=0.95, **overrides) -> TfidfVectorizer:
+    params = dict(TFIDF_PARAMS, max_features=max_features, min_df=min_df, max_df=max_df)
+    params.update(overrides)
+    return TfidfVectorizer(**params)
+
+
+def vectorizer_arrays(vectorizer: TfidfVectorizer, corpus_size: int) -> dict:
+    """Vocabulary (ordered by column), idf and tokenizer settings as plain arrays for np.savez."""
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    meta = {'corpus_size': corpus_size, 'params': dict(TFIDF_PARAMS, ngram_range=list(TFIDF_PARAMS['ngram_range']))}
+    return {'terms': np.array(terms), 'idf': vectorizer.idf_, 'meta': np.array(json.dumps(meta))}
+
+
+def vectorizer_from_arrays(data) -> TfidfVectorizer:
+    """Rebuild a transform-only vectorizer from the arrays written by vectorizer_arrays."""
+    terms = data['terms'].tolist()
+    meta = json.loads(str(data['meta']))
+
+    params = dict(meta.get('params', TFIDF_PARAMS))
+    params['ngram_range'] = tuple(params['ngram_range'])
+    vectorizer = TfidfVectorizer(vocabulary={term: index for index, term in enumerate(terms)}, **params)
+    vectorizer.idf_ = data['idf']
+    return vectorizer
+
+
+def save_arrays(path: str, arrays: dict):
+    """np.savez_compressed to a temp file, then rename, so readers never see a partial model."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp.npz"
+    np.savez_compressed(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def save_model(vectorizer: TfidfVectorizer, path: str, corpus_size: int):
+    """Write vocabulary and idf to a single .npz, atomically."""
+    save_arrays(path, vectorizer_arrays(vectorizer, corpus_size))
+
+
+def load_model(path: str) -> TfidfVectorizer:
+    """Rebuild a transform-only vectorizer from a saved vocabulary + idf."""
+    with np.load(path, allow_pickle=False) as data:
+        return vectorizer_from_arrays(data)
+
+
+class ModelStore:
+    """
+    Loads a saved model file once per process and picks up refits by file mtime,
+    so running the refit command does not require restarting the web workers.
+    """
+
+    def __init__(self, path: str, loader):
+        self.path = path
+        self.loader = loader
+        self.model = None
+        self.loaded_mtime = None
+        self.lock = threading.Lock()
+
+    def current(self) -> tuple:
+        """(model, version) for the saved model, or (None, None) when no model has been saved yet."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None, None
+
+        if mtime != self.loaded_mtime:
+            with self.lock:
+                if mtime != self.loaded_mtime:
+                    try:
+                        self.model = self.loader(self.path)
+                        logger.info(f"Loaded model from {self.path}")
+                    except Exception as e:
+                        logger.error(f"Error loading model from {self.path}: {e}")
+                        self.model = None
+                    self.loaded_mtime = mtime
+
+        with self.lock:
+            if self.model is None:
+                return None, None
+            return self.model, str(self.loaded_mtime)
+
+    def get(self):
+        """The loaded model, or None when no model has been saved yet."""
+        return self.current()[0]
+
+
+class TfidfModelStore(ModelStore):
+    def __init__(self, path: str):
+        super().__init__(path, load_model)
+
+
+def refit(index, path: str, max_features: int, min_docs: int) -> int:
+    """Fit on every indexed job description and save. Returns the corpus size (0 if not saved)."""
+    corpus = [description for description in index.iter_descriptions() if description]
+    if len(corpus) < min_docs:
+        logger.warning(f"Only {len(corpus)} job descriptions indexed (need {min_docs}), not saving a model")
+        return 0
+
+    # With a large corpus, drop one-off terms so the vocabulary keeps meaningful features
+    vectorizer = build_vectorizer(max_features=max_features, min_df=2)
+    vectorizer.fit(corpus)
+    save_model(vectorizer, path, len(corpus))
+    logger.info(f"Saved TF-IDF model with {len(vectorizer.vocabulary_)} terms fitted on {len(corpus)} jobs to {path}")
+    return len(corpus)
+
+
+def main():
+    from dotenv import load_dotenv
+    from job_index import JobIndex
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Refit the TF-IDF model on the local job index")
+    parser.add_argument('--min-docs', type=int, default=int(os.getenv("TFIDF_MODEL_MIN_DOCS", "200")))
+    parser.add_argument('--max-features', type=int, default=int(os.getenv("TFIDF_MODEL_MAX_FEATURES", "50000")))
+    args = parser.parse_args()
+
+    index = JobIndex(os.getenv("JOB_INDEX_PATH", os.path.join("cache", "job_index.db")))
+    model_path = os.getenv("TFIDF_MODEL_PATH", os.path.join("cache", "tfidf_model.npz"))
+    refit(index, model_path, args.max_features, args.min_docs)
+
+
+if __name__ == '__main__':
+    main()
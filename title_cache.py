@@ -0,0 +1,132 @@
+import re
+import copy
+import time
+import threading
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Spellings of the same skill as they come back from resume extraction
+SKILL_SYNONYMS = {
+    'js': 'javascript',
+    'es6': 'javascript',
+    'ts': 'typescript',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'nextjs': 'next.js',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'angularjs': 'angular',
+    'node': 'node.js',
+    'nodejs': 'node.js',
+    'expressjs': 'express',
+    'express.js': 'express',
+    'golang': 'go',
+    'py': 'python',
+    'python3': 'python',
+    'springboot': 'spring boot',
+    'postgres': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'amazon web services': 'aws',
+    'google cloud platform': 'gcp',
+    'google cloud': 'gcp',
+    'microsoft azure': 'azure',
+    'ml': 'machine learning',
+    'dl': 'deep learning',
+    'sklearn': 'scikit-learn',
+    'scikit learn': 'scikit-learn',
+    'tf': 'tensorflow',
+    'html5': 'html',
+    'css3': 'css',
+    'ci/cd pipelines': 'ci/cd',
+    'rest': 'rest apis',
+    'rest api': 'rest apis',
+    'restful apis': 'rest apis',
+}
+
+
+def canonical_skill(skill: str) -> str:
+    """Lowercased, whitespace-collapsed, synonym-normalized skill name"""
+    normalized = ' '.join(str(skill or '').lower().split()).rstrip(' ,;')
+    normalized = re.sub(r'\s*\(.*?\)$', '', normalized)  # "Amazon Web Services (AWS)"
+    return SKILL_SYNONYMS.get(normalized, normalized)
+
+
+def canonical_skill_set(skills) -> frozenset:
+    return frozenset(skill for skill in (canonical_skill(skill) for skill in skills or []) if skill)
+
+
+def jaccard(first: frozenset, second: frozenset) -> float:
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class JobTitleCache:
+    """
+    Cache of Gemini-generated job titles and experience-level variants, keyed by
+    the canonical skill set plus experience level (neither prompt sees anything
+    else from the resume).
+
+    Entries expire after ttl_seconds and the least recently used are evicted
+    beyond max_entries. With min_jaccard < 1, a skill set that overlaps a cached
+    one of the same level at least that much (Jaccard) is served the cached titles.
+    """
+
+    def __init__(self, ttl_seconds: float = 86400, max_entries: int = 1000, min_jaccard: float = 1.0):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.min_jaccard = min_jaccard
+        self.entries = OrderedDict()  # (level, skill set) -> (stored_at, entry)
+        self.lock = threading.Lock()
+
+    def _near_match(self, level: str, skills: frozenset, now: float):
+        best_key, best_similarity = None, self.min_jaccard
+        for key, (stored_at, _) in self.entries.items():
+            cached_level, cached_skills = key
+            if cached_level != level or now - stored_at >= self.ttl_seconds:
+                continue
+            # Jaccard can't reach the threshold when the set sizes are too far apart
+            smaller, larger = sorted((len(skills), len(cached_skills)))
+            if not larger or smaller / larger < best_similarity:
+                continue
+            similarity = jaccard(skills, cached_skills)
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+    def get(self, skills: list, experience_level: str) -> dict:
+        """{'job_titles', 'variants'} for the skill set and level, or None on a miss."""
+        canonical = canonical_skill_set(skills)
+        if not canonical:
+            return None
+        key = (str(experience_level or '').lower(), canonical)
+        now = time.time()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and now - entry[0] >= self.ttl_seconds:
+                del self.entries[key]
+                entry = None
+            if entry is None and self.min_jaccard < 1:
+                near_key = self._near_match(key[0], canonical, now)
+                if near_key is not None:
+                    key, entry = near_key, self.entries[near_key]
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
+    def put(self, skills: list, experience_level: str, job_titles: list, variants: list):
+        canonical = canonical_skill_set(skills)
+        if not canonical:
+            return
+        key = (str(experience_level or '').lower(), canonical)
+        entry = {'job_titles': list(job_titles), 'variants': list(variants)}
+        with self.lock:
+            self.entries[key] = (time.time(), entry)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)